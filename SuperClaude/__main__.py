@@ -16,7 +16,7 @@ import argparse
 import subprocess
 import difflib
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional
 
 # Add the local 'setup' directory to the Python import path
 current_dir = Path(__file__).parent
@@ -127,6 +127,9 @@ def setup_global_environment(args: argparse.Namespace):
 
     # Log startup context
     logger = get_logger()
+    if logger and getattr(args, "json", False):
+        # Operations printing JSON keep stdout for the report
+        logger.set_console_stream(sys.stderr)
     if logger:
         logger.debug(f"SuperClaude called with operation: {getattr(args, 'operation', 'None')}")
         logger.debug(f"Arguments: {vars(args)}")
@@ -138,14 +141,17 @@ def get_operation_modules() -> Dict[str, str]:
         "install": "Install SuperClaude framework components",
         "update": "Update existing SuperClaude installation",
         "uninstall": "Remove SuperClaude installation",
-        "backup": "Backup and restore operations"
+        "backup": "Backup and restore operations",
+        "mcp": "Prefetch MCP servers for offline installs",
+        "analyze-context": "Measure the context loaded through CLAUDE.md imports"
     }
 
 
 def load_operation_module(name: str):
     """Try to dynamically import an operation module"""
     try:
-        return __import__(f"setup.cli.commands.{name}", fromlist=[name])
+        module_name = name.replace("-", "_")
+        return __import__(f"setup.cli.commands.{module_name}", fromlist=[module_name])
     except ImportError as e:
         logger = get_logger()
         if logger:
@@ -153,10 +159,45 @@ def load_operation_module(name: str):
         return None
 
 
-def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]:
-    """Register subcommand parsers and map operation names to their run functions"""
+def detect_operation(argv: List[str]) -> Optional[str]:
+    """
+    Find the operation named on the command line without full parsing
+
+    The operation is the first positional argument; global options that
+    take a value are skipped along with it, including the abbreviations
+    argparse accepts (`--install-d`). `--opt=value` tokens carry their value.
+    """
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+            continue
+        if token.startswith("--") and "=" not in token and len(token) > 2:
+            # No other global long option starts with "--i", so any such prefix is unambiguous
+            skip_value = "--install-dir".startswith(token) and token.startswith("--i")
+            continue
+        if token.startswith("-"):
+            continue
+        return token if token in get_operation_modules() else None
+    return None
+
+
+def register_operation_parsers(subparsers, global_parser,
+                               selected: Optional[str] = None) -> Dict[str, Callable]:
+    """
+    Register subcommand parsers and map operation names to their run functions
+
+    Only the selected operation's module is imported; the others get a
+    lightweight parser built from their description, which is all that
+    top-level help and dispatch need.
+    """
     operations = {}
     for name, desc in get_operation_modules().items():
+        if selected is not None and name != selected:
+            subparsers.add_parser(name, help=desc, parents=[global_parser])
+            operations[name] = None
+            continue
+
         module = load_operation_module(name)
         if module and hasattr(module, 'register_parser') and hasattr(module, 'run'):
             module.register_parser(subparsers, global_parser)
@@ -202,7 +243,9 @@ def main() -> int:
     """Main entry point"""
     try:
         parser, subparsers, global_parser = create_parser()
-        operations = register_operation_parsers(subparsers, global_parser)
+        # An empty selection registers stubs only (e.g. for --help and --version)
+        selected = detect_operation(sys.argv[1:]) or ""
+        operations = register_operation_parsers(subparsers, global_parser, selected)
         args = parser.parse_args()
 
         # Handle --authors flag
@@ -238,7 +281,7 @@ def main() -> int:
                 display_header(f"SuperClaude Framework v{__version__}", "Unified CLI for all operations")
                 print(f"{Colors.CYAN}Available operations:{Colors.RESET}")
                 for op, desc in get_operation_modules().items():
-                    print(f"  {op:<12} {desc}")
+                    print(f"  {op:<16} {desc}")
             return 0
 
         # Handle unknown operations and suggest corrections
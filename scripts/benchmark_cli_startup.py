@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Framework - CLI Startup Benchmark
+Measures import cost of common CLI invocations using `python -X importtime`.
+
+Usage:
+    python scripts/benchmark_cli_startup.py                  # Report all scenarios
+    python scripts/benchmark_cli_startup.py --repeat 10      # Median over 10 runs
+    python scripts/benchmark_cli_startup.py --max-ms 150     # Fail if any scenario is slower
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Invocation -> modules it must not import
+SCENARIOS: Dict[str, Tuple[List[str], List[str]]] = {
+    "--help": (["--help"], ["setup.cli.commands.install", "setup.cli.commands.backup", "setup.core.installer"]),
+    "--version": (["--version"], ["setup.cli.commands.install", "setup.core.installer"]),
+    "backup --help": (["backup", "--help"], ["setup.cli.commands.install", "setup.core.installer"]),
+    "uninstall --help": (["uninstall", "--help"], ["setup.cli.commands.install", "setup.cli.commands.backup"]),
+    "install --help": (["install", "--help"], ["setup.cli.commands.backup", "setup.cli.commands.update"]),
+}
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def measure(cli_args: List[str]) -> Tuple[int, List[str]]:
+    """
+    Run the CLI once with -X importtime
+
+    Returns:
+        Tuple of (total import time in microseconds, imported module names)
+    """
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "SuperClaude", *cli_args],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env=env
+    )
+
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        modules.append(match.group(4))
+        # Top-level imports carry the cumulative time of everything below them
+        if not match.group(3):
+            total_us += int(match.group(2))
+    return total_us, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SuperClaude CLI import time")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario (default: 5)")
+    parser.add_argument("--max-ms", type=float, help="Fail if a scenario's median import time exceeds this")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'scenario':<20} {'median ms':>10} {'modules':>8}")
+    for name, (cli_args, forbidden) in SCENARIOS.items():
+        timings = []
+        modules: List[str] = []
+        for _ in range(args.repeat):
+            total_us, modules = measure(cli_args)
+            timings.append(total_us / 1000)
+
+        median_ms = statistics.median(timings)
+        print(f"{name:<20} {median_ms:>10.1f} {len(modules):>8}")
+
+        unexpected = sorted(set(forbidden) & set(modules))
+        if unexpected:
+            print(f"  ✗ imports {', '.join(unexpected)}")
+            failed = True
+        if args.max_ms is not None and median_ms > args.max_ms:
+            print(f"  ✗ exceeds {args.max_ms:.1f} ms")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
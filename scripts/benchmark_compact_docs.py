@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Framework - Compact Docs Benchmark
+Compares size, lines and approximate tokens of the full and compact variants
+of the Core, Modes and MCP docs, i.e. what each Claude Code session loads.
+
+Usage:
+    python scripts/benchmark_compact_docs.py                     # Per-doc report
+    python scripts/benchmark_compact_docs.py --min-reduction 10  # Fail below 10% token savings
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup import DATA_DIR  # noqa: E402
+from setup.services.config import ConfigService  # noqa: E402
+from setup.services.context_footprint import estimate_tokens  # noqa: E402
+from setup.utils.compact_docs import compact_markdown  # noqa: E402
+
+DOC_DIRS = ["Core", "Modes", "MCP"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compact SuperClaude framework docs")
+    parser.add_argument("--min-reduction", type=float, help="Minimum total token reduction in percent")
+    args = parser.parse_args()
+
+    sections = ConfigService(DATA_DIR).get_compact_sections()
+    totals = [0, 0, 0, 0]
+    elapsed = 0.0
+
+    print(f"{'doc':<40} {'bytes':>8} {'compact':>8} {'tokens':>7} {'compact':>8} {'saved':>6}")
+    for name in DOC_DIRS:
+        for path in sorted((PROJECT_ROOT / "SuperClaude" / name).glob("*.md")):
+            if path.name == "README.md":
+                continue
+            full = path.read_text(encoding="utf-8")
+            start = time.perf_counter()
+            compact = compact_markdown(full, sections.get(path.name))
+            elapsed += time.perf_counter() - start
+
+            sizes = [len(full.encode("utf-8")), len(compact.encode("utf-8")),
+                     estimate_tokens(full), estimate_tokens(compact)]
+            totals = [total + size for total, size in zip(totals, sizes)]
+            print(f"{name + '/' + path.name:<40} {sizes[0]:>8} {sizes[1]:>8} {sizes[2]:>7} {sizes[3]:>8} "
+                  f"{1 - sizes[3] / max(sizes[2], 1):>6.0%}")
+
+    reduction = 1 - totals[3] / max(totals[2], 1)
+    print(f"{'total':<40} {totals[0]:>8} {totals[1]:>8} {totals[2]:>7} {totals[3]:>8} {reduction:>6.0%}")
+    print(f"\nCompaction time: {elapsed * 1000:.1f} ms")
+
+    if args.min_reduction is not None and reduction * 100 < args.min_reduction:
+        print(f"Token reduction {reduction:.1%} is below {args.min_reduction}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Framework - Path Validation Benchmark
+Measures per-file cost of validating a synthetic component manifest, both
+file by file through validate_path (cold and warm verdict cache) and with
+the per-directory batch validator used by validate_component_files.
+
+Usage:
+    python scripts/benchmark_path_validation.py                 # 10k-file manifest
+    python scripts/benchmark_path_validation.py --files 50000   # Larger manifest
+    python scripts/benchmark_path_validation.py --repeat 5      # Best of 5 runs
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.utils.security import SecurityValidator  # noqa: E402
+
+
+def build_manifest(count: int) -> Tuple[List[Tuple[Path, Path]], Path, Path]:
+    """
+    Build (source, target) pairs spread over nested directories
+
+    Returns:
+        Tuple of (file list, source base directory, target base directory)
+    """
+    source_dir = PROJECT_ROOT / "SuperClaude"
+    target_dir = Path.home() / ".claude"
+    files = []
+    for i in range(count):
+        relative = Path(f"group{i % 50:02d}") / f"section{i % 7}" / f"file{i:05d}.md"
+        files.append((source_dir / relative, target_dir / relative))
+    return files, source_dir, target_dir
+
+
+def time_per_file(files: List[Tuple[Path, Path]], source_dir: Path, target_dir: Path) -> float:
+    """Validate every path with validate_path and return elapsed seconds"""
+    start = time.perf_counter()
+    for source, target in files:
+        if not (SecurityValidator.validate_path(source, source_dir)[0] and
+                SecurityValidator.validate_path(target, target_dir)[0]):
+            raise SystemExit(f"Unexpected validation error for {source}")
+    return time.perf_counter() - start
+
+
+def time_batch(files: List[Tuple[Path, Path]], source_dir: Path, target_dir: Path) -> float:
+    """Validate the manifest with validate_component_files and return elapsed seconds"""
+    start = time.perf_counter()
+    is_safe, errors = SecurityValidator.validate_component_files(files, source_dir, target_dir)
+    elapsed = time.perf_counter() - start
+    if not is_safe:
+        raise SystemExit(f"Unexpected validation errors: {errors[:3]}")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SuperClaude path validation")
+    parser.add_argument("--files", type=int, default=10000, help="Files in the manifest (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    files, source_dir, target_dir = build_manifest(args.files)
+
+    timings: Dict[str, List[float]] = {"per-file (cold)": [], "per-file (warm)": [], "batch": []}
+    for _ in range(args.repeat):
+        SecurityValidator.clear_path_cache()
+        timings["per-file (cold)"].append(time_per_file(files, source_dir, target_dir))
+        timings["per-file (warm)"].append(time_per_file(files, source_dir, target_dir))
+        timings["batch"].append(time_batch(files, source_dir, target_dir))
+
+    print(f"{'mode':<16} {'total ms':>10} {'us/file':>10}")
+    for name, runs in timings.items():
+        best = min(runs)
+        print(f"{name:<16} {best * 1000:>10.1f} {best / args.files * 1e6:>10.2f}")
+
+    info = SecurityValidator._validate_path_cached.cache_info()
+    print(f"\nCached verdicts: {info.currsize} (max {info.maxsize})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
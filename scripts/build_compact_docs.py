@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Framework - Compact Docs Build
+Builds the compact variant of the Core, Modes and MCP docs into a `compact/`
+directory next to each set of full docs, for `install --doc-variant compact`.
+setup.py runs it when packaging so wheels ship prebuilt compact docs;
+installs that find them missing or stale build them into the installation's
+cache directory instead.
+
+Usage:
+    python scripts/build_compact_docs.py            # Build stale compact docs
+    python scripts/build_compact_docs.py --clean    # Rebuild everything
+"""
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup import DATA_DIR  # noqa: E402
+from setup.services.config import ConfigService  # noqa: E402
+from setup.utils.compact_docs import COMPACT_DIR_NAME, build_compact_docs  # noqa: E402
+
+DOC_DIRS = ["Core", "Modes", "MCP"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build compact SuperClaude framework docs")
+    parser.add_argument("--clean", action="store_true", help="Remove existing compact docs first")
+    args = parser.parse_args()
+
+    sections = ConfigService(DATA_DIR).get_compact_sections()
+    for name in DOC_DIRS:
+        source_dir = PROJECT_ROOT / "SuperClaude" / name
+        if args.clean:
+            shutil.rmtree(source_dir / COMPACT_DIR_NAME, ignore_errors=True)
+        docs = sorted(path.name for path in source_dir.glob("*.md") if path.name != "README.md")
+        compact_dir = build_compact_docs(source_dir, docs, sections)
+        print(f"{name:<6} {len(docs):>3} docs -> {compact_dir.relative_to(PROJECT_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
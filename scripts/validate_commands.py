@@ -8,14 +8,29 @@ Usage:
     python scripts/validate_commands.py command.md          # Validate specific command
     python scripts/validate_commands.py --summary           # Summary report only
     python scripts/validate_commands.py --strict            # Fail on warnings
+    python scripts/validate_commands.py --jobs 4            # Validate in 4 processes
+    python scripts/validate_commands.py --no-cache          # Revalidate unchanged files
+
+Results are cached per file in scripts/__pycache__/validate_commands-cache.json,
+keyed on the file's sha256 and the validator version, so unchanged commands
+are not re-parsed (e.g. when run from a pre-commit hook).
 """
 
 import sys
 import re
+import os
+import json
+import hashlib
 import yaml
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ProcessPoolExecutor
+
+# Bump when validation rules change so cached results are discarded
+VALIDATOR_VERSION = "2"
+
+DEFAULT_CACHE_FILE = Path(__file__).parent / "__pycache__" / "validate_commands-cache.json"
 
 
 @dataclass
@@ -57,8 +72,36 @@ class CommandValidator:
         'Tool Coordination', 'Key Patterns', 'Examples', 'Boundaries'
     ]
     
-    def __init__(self, commands_dir: Path):
+    # Precompiled matchers
+    FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---', re.MULTILINE | re.DOTALL)
+    COMMAND_HEADER_RE = re.compile(r'^# /sc:\w+', re.MULTILINE)
+    # One pass finds every required section heading (longest names first so prefixes can't shadow them)
+    REQUIRED_SECTIONS_RE = re.compile(
+        r'^## (' + '|'.join(re.escape(s) for s in sorted(REQUIRED_SECTIONS, key=len, reverse=True)) + ')',
+        re.MULTILINE
+    )
+    MCP_SECTION_RE = re.compile(r'## MCP Integration.*?(?=^## |\Z)', re.MULTILINE | re.DOTALL)
+    EXAMPLES_SECTION_RE = re.compile(r'## Examples.*?(?=^## |\Z)', re.MULTILINE | re.DOTALL)
+    EXAMPLE_HEADING_RE = re.compile(r'^###.*Example', re.MULTILINE)
+    WORKFLOW_RE = re.compile(
+        r'Workflow Integration \(per AGENTS\.md\)|byterover-retrieve-knowledge|byterover-store-knowledge'
+        r'|Before.*byterover|After.*byterover',
+        re.IGNORECASE
+    )
+    BEFORE_RE = re.compile(r'Before.*byterover', re.IGNORECASE)
+    DURING_RE = re.compile(r'During.*basic-memory', re.IGNORECASE)
+    AFTER_RE = re.compile(r'After.*byterover', re.IGNORECASE)
+    
+    def __init__(self, commands_dir: Path, jobs: int = 1, cache_file: Optional[Path] = DEFAULT_CACHE_FILE):
+        """
+        Args:
+            commands_dir: Directory containing command files
+            jobs: Worker processes for validating changed files (1 = serial)
+            cache_file: Results cache, or None to always revalidate
+        """
         self.commands_dir = commands_dir
+        self.jobs = jobs
+        self.cache_file = cache_file
         self.results: List[ValidationResult] = []
     
     def validate_file(self, filepath: Path) -> ValidationResult:
@@ -67,7 +110,18 @@ class CommandValidator:
         
         try:
             content = filepath.read_text()
-            
+            return self.validate_content(content, filepath)
+        except Exception as e:
+            result.errors.append(f"Failed to validate file: {str(e)}")
+            result.passed = False
+        
+        return result
+    
+    def validate_content(self, content: str, filepath: Path) -> ValidationResult:
+        """Validate the content of a command file"""
+        result = ValidationResult(filename=filepath.name)
+        
+        try:
             # Extract and validate YAML front matter
             metadata = self._extract_metadata(content, result)
             if metadata:
@@ -97,8 +151,7 @@ class CommandValidator:
     def _extract_metadata(self, content: str, result: ValidationResult) -> Optional[Dict]:
         """Extract YAML front matter"""
         # Match YAML front matter
-        yaml_pattern = r'^---\s*\n(.*?)\n---'
-        match = re.search(yaml_pattern, content, re.MULTILINE | re.DOTALL)
+        match = self.FRONT_MATTER_RE.search(content)
         
         if not match:
             result.errors.append("Missing YAML front matter")
@@ -188,7 +241,7 @@ class CommandValidator:
         """Validate command structure and required sections"""
         
         # Check for command header
-        if not re.search(r'^# /sc:\w+', content, re.MULTILINE):
+        if not self.COMMAND_HEADER_RE.search(content):
             result.errors.append("Missing command header (# /sc:command-name)")
         
         # Check for Context Framework Note
@@ -196,9 +249,9 @@ class CommandValidator:
             result.warnings.append("Missing Context Framework Note in header")
         
         # Check for required sections
+        found_sections = set(self.REQUIRED_SECTIONS_RE.findall(content))
         for section in self.REQUIRED_SECTIONS:
-            pattern = rf'^## {re.escape(section)}'
-            if not re.search(pattern, content, re.MULTILINE):
+            if section not in found_sections:
                 result.errors.append(f"Missing required section: {section}")
         
         # Check for subsections in MCP Integration
@@ -221,11 +274,7 @@ class CommandValidator:
             return
         
         # Extract MCP Integration section
-        mcp_match = re.search(
-            r'## MCP Integration.*?(?=^## |\Z)', 
-            content, 
-            re.MULTILINE | re.DOTALL
-        )
+        mcp_match = self.MCP_SECTION_RE.search(content)
         
         if mcp_match:
             mcp_section = mcp_match.group(0)
@@ -240,29 +289,15 @@ class CommandValidator:
         """Validate ByteRover workflow integration"""
         
         # Check for workflow integration pattern
-        has_workflow = False
-        workflow_patterns = [
-            'Workflow Integration (per AGENTS.md)',
-            'byterover-retrieve-knowledge',
-            'byterover-store-knowledge',
-            'Before.*byterover',
-            'After.*byterover'
-        ]
-        
-        for pattern in workflow_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                has_workflow = True
-                break
-        
-        if not has_workflow:
+        if not self.WORKFLOW_RE.search(content):
             result.warnings.append(
                 "Missing ByteRover workflow integration (retrieve before, store after pattern)"
             )
         
         # Check for comprehensive integration (3-step pattern)
-        has_before = bool(re.search(r'Before.*byterover', content, re.IGNORECASE))
-        has_during = bool(re.search(r'During.*basic-memory', content, re.IGNORECASE))
-        has_after = bool(re.search(r'After.*byterover', content, re.IGNORECASE))
+        has_before = bool(self.BEFORE_RE.search(content))
+        has_during = bool(self.DURING_RE.search(content))
+        has_after = bool(self.AFTER_RE.search(content))
         
         if has_before and has_during and has_after:
             result.info.append("✓ Complete ByteRover workflow integration (3-step pattern)")
@@ -278,17 +313,13 @@ class CommandValidator:
             return
         
         # Extract Examples section
-        examples_match = re.search(
-            r'## Examples.*?(?=^## |\Z)',
-            content,
-            re.MULTILINE | re.DOTALL
-        )
+        examples_match = self.EXAMPLES_SECTION_RE.search(content)
         
         if examples_match:
             examples_section = examples_match.group(0)
             
             # Count example subsections
-            example_count = len(re.findall(r'^###.*Example', examples_section, re.MULTILINE))
+            example_count = len(self.EXAMPLE_HEADING_RE.findall(examples_section))
             
             if example_count < 3:
                 result.warnings.append(
@@ -307,8 +338,7 @@ class CommandValidator:
             if not filepath.exists():
                 print(f"Error: File not found: {filepath}")
                 sys.exit(1)
-            result = self.validate_file(filepath)
-            self.results = [result]
+            self.results = self.validate_files([filepath])
         else:
             # Validate all .md files except README and TEMPLATE
             md_files = [
@@ -318,12 +348,87 @@ class CommandValidator:
             
             print(f"Validating {len(md_files)} command files...\n")
             
-            for filepath in sorted(md_files):
-                result = self.validate_file(filepath)
-                self.results.append(result)
+            self.results = self.validate_files(sorted(md_files))
         
         return self.results
     
+    def validate_files(self, filepaths: List[Path]) -> List[ValidationResult]:
+        """
+        Validate files, reusing cached results for unchanged ones
+        
+        Files that are not cached are validated in a process pool when
+        jobs > 1 and more than one file needs validation.
+        
+        Returns:
+            Results in the order of filepaths
+        """
+        cache = self._load_cache()
+        results: Dict[str, ValidationResult] = {}
+        pending: List[Tuple[Path, str, str]] = []
+        
+        for filepath in filepaths:
+            try:
+                data = filepath.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                entry = cache.get(filepath.name)
+                if entry and entry.get("sha256") == digest:
+                    results[filepath.name] = ValidationResult(**entry["result"])
+                else:
+                    pending.append((filepath, digest, data.decode("utf-8")))
+            except (OSError, UnicodeDecodeError) as e:
+                # Not cached, so the file is re-checked on the next run
+                results[filepath.name] = ValidationResult(
+                    filename=filepath.name, passed=False, errors=[f"Failed to validate file: {str(e)}"]
+                )
+        
+        if self.jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(pending))) as executor:
+                validated = list(executor.map(
+                    _validate_content,
+                    [self.commands_dir] * len(pending),
+                    [content for _, _, content in pending],
+                    [filepath for filepath, _, _ in pending]
+                ))
+        else:
+            validated = [self.validate_content(content, filepath) for filepath, _, content in pending]
+        
+        for (filepath, digest, _), result in zip(pending, validated):
+            results[filepath.name] = result
+            cache[filepath.name] = {"sha256": digest, "result": asdict(result)}
+        
+        if pending:
+            self._save_cache(cache)
+        
+        return [results[filepath.name] for filepath in filepaths]
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load cached results, discarding them if written by another validator version"""
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != _validator_fingerprint() or data.get("commands_dir") != str(self.commands_dir.resolve()):
+            return {}
+        return data.get("results", {})
+    
+    def _save_cache(self, cache: Dict[str, Dict]) -> None:
+        """Write cached results atomically (best effort)"""
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_file.with_suffix(".tmp")
+            temp_path.write_text(json.dumps({
+                "version": _validator_fingerprint(),
+                "commands_dir": str(self.commands_dir.resolve()),
+                "results": cache
+            }, indent=2, ensure_ascii=False))
+            os.replace(temp_path, self.cache_file)
+        except OSError:
+            pass
+    
     def print_results(self, summary_only: bool = False):
         """Print validation results"""
         
@@ -388,6 +493,16 @@ class CommandValidator:
         print(f"\nByteRover Integration: {with_byterover}/{total} commands ({with_byterover/total*100:.1f}%)")
 
 
+def _validator_fingerprint() -> str:
+    """VALIDATOR_VERSION plus a hash of this script, so edited rules never reuse stale results"""
+    return f"{VALIDATOR_VERSION}:{hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]}"
+
+
+def _validate_content(commands_dir: Path, content: str, filepath: Path) -> ValidationResult:
+    """Process pool entry point for CommandValidator.validate_content"""
+    return CommandValidator(commands_dir, cache_file=None).validate_content(content, filepath)
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -401,6 +516,8 @@ Examples:
   python scripts/validate_commands.py analyze.md         # Validate specific command
   python scripts/validate_commands.py --summary          # Summary only
   python scripts/validate_commands.py --strict           # Fail on warnings
+  python scripts/validate_commands.py --jobs 4           # Validate in 4 processes
+  python scripts/validate_commands.py --no-cache         # Ignore cached results
         """
     )
     
@@ -425,6 +542,17 @@ Examples:
         default=Path(__file__).parent.parent / 'SuperClaude' / 'Commands',
         help='Path to Commands directory'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes for files that need validation (default: CPU count)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Revalidate every file and do not update the results cache'
+    )
     
     args = parser.parse_args()
     
@@ -434,7 +562,11 @@ Examples:
         sys.exit(1)
     
     # Run validation
-    validator = CommandValidator(args.commands_dir)
+    validator = CommandValidator(
+        args.commands_dir,
+        jobs=args.jobs,
+        cache_file=None if args.no_cache else DEFAULT_CACHE_FILE
+    )
     results = validator.validate_all(specific_file=args.file)
     
     # Print results
@@ -3,9 +3,37 @@ Setup.py for SuperClaude Framework
 
 This is a minimal setup.py that defers to pyproject.toml for configuration.
 Modern Python packaging uses pyproject.toml as the primary configuration file.
+It only hooks the build so packages ship prebuilt compact docs.
 """
 
+import subprocess
+import sys
+from pathlib import Path
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+from setuptools.command.sdist import sdist
+
+COMPACT_DOCS_SCRIPT = Path(__file__).parent / "scripts" / "build_compact_docs.py"
+
+
+def build_compact_docs():
+    """Prebuild compact docs into SuperClaude/*/compact (sdists already contain them)"""
+    if COMPACT_DOCS_SCRIPT.exists():
+        subprocess.check_call([sys.executable, str(COMPACT_DOCS_SCRIPT)])
+
+
+class BuildPy(build_py):
+    def run(self):
+        build_compact_docs()
+        super().run()
+
+
+class SDist(sdist):
+    def run(self):
+        build_compact_docs()
+        super().run()
+
 
-# All configuration is now in pyproject.toml
-setup()
\ No newline at end of file
+# All other configuration is in pyproject.toml
+setup(cmdclass={"build_py": BuildPy, "sdist": SDist})
@@ -4,8 +4,15 @@ Command-line interface operations for SuperClaude installation system
 """
 
 from .base import OperationBase
-from .commands import *
 
 __all__ = [
     'OperationBase',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Operation classes resolve lazily through the commands package
+    from . import commands
+    if name in commands._OPERATION_MODULES:
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,6 +4,7 @@ SuperClaude CLI Base Module
 Base class for all CLI operations providing common functionality
 """
 
+import argparse
 from pathlib import Path
 
 # Read version from VERSION file
@@ -13,6 +14,24 @@ except Exception:
     __version__ = "4.1.5"  # Fallback
 
 
+def token_count_type(value: str) -> int:
+    """argparse type for token counts such as 20000 or 20k"""
+    from ..services.context_footprint import parse_token_count
+    try:
+        return parse_token_count(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def token_limit_type(value: str) -> int:
+    """argparse type for token limits such as 0, 20000 or 20k"""
+    from ..services.context_footprint import parse_token_count
+    try:
+        return parse_token_count(value, allow_zero=True)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def get_command_info():
     """Get information about available commands"""
     return {
@@ -35,6 +54,16 @@ def get_command_info():
             "name": "backup",
             "description": "Backup and restore SuperClaude installations",
             "module": "setup.cli.commands.backup"
+        },
+        "mcp": {
+            "name": "mcp",
+            "description": "Prefetch MCP servers for offline installs",
+            "module": "setup.cli.commands.mcp"
+        },
+        "analyze-context": {
+            "name": "analyze-context",
+            "description": "Measure the context loaded through CLAUDE.md imports",
+            "module": "setup.cli.commands.analyze_context"
         }
     }
 
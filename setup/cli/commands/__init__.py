@@ -1,18 +1,37 @@
 """
 SuperClaude CLI Commands
 Individual command implementations for the CLI interface
+
+Operation classes are imported on first access so that loading one command
+module does not pull in the dependencies of all the others.
 """
 
+import importlib
+
 from ..base import OperationBase
-from .install import InstallOperation
-from .uninstall import UninstallOperation
-from .update import UpdateOperation
-from .backup import BackupOperation
+
+_OPERATION_MODULES = {
+    'InstallOperation': 'install',
+    'UninstallOperation': 'uninstall',
+    'UpdateOperation': 'update',
+    'BackupOperation': 'backup',
+    'MCPOperation': 'mcp',
+    'AnalyzeContextOperation': 'analyze_context'
+}
 
 __all__ = [
     'OperationBase',
     'InstallOperation',
     'UninstallOperation', 
     'UpdateOperation',
-    'BackupOperation'
-]
\ No newline at end of file
+    'BackupOperation',
+    'MCPOperation',
+    'AnalyzeContextOperation'
+]
+
+
+def __getattr__(name):
+    if name in _OPERATION_MODULES:
+        module = importlib.import_module(f"{__name__}.{_OPERATION_MODULES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
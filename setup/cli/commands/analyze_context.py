@@ -0,0 +1,222 @@
+"""
+SuperClaude Analyze Context Operation Module
+Reports the context footprint of the framework files imported by CLAUDE.md
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from ...services.context_footprint import ContextAnalyzer, ContextReport
+from ...utils.ui import display_header, display_table, display_success, display_error, format_size, Colors
+from ...utils.logger import get_logger
+from ..base import token_limit_type
+from . import OperationBase
+
+
+class AnalyzeContextOperation(OperationBase):
+    """Context footprint analysis operation implementation"""
+
+    def __init__(self):
+        super().__init__("analyze-context")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register analyze-context CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "analyze-context",
+        help="Measure the context loaded through CLAUDE.md imports",
+        description="Walk the @import graph from CLAUDE.md and report bytes, lines and approximate "
+                    "tokens per file and category, plus content duplicated across files",
+        epilog="""
+Examples:
+  SuperClaude analyze-context                              # Report for ~/.claude
+  SuperClaude analyze-context --output context.json        # Also save a JSON report (e.g. as a CI artifact)
+  SuperClaude analyze-context --max-tokens 20k             # Fail if the total exceeds 20k tokens
+  SuperClaude analyze-context --max-category-tokens "Behavioral Modes=3000" --max-duplicate-tokens 0
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="FILE",
+        help="Write the JSON report to FILE"
+    )
+
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of largest files to list (default: 20, 0 = all)"
+    )
+
+    budgets = parser.add_argument_group("Budgets (exit with status 1 when exceeded)")
+    budgets.add_argument(
+        "--max-tokens",
+        type=token_limit_type,
+        help="Maximum total tokens"
+    )
+    budgets.add_argument(
+        "--max-file-tokens",
+        type=token_limit_type,
+        help="Maximum tokens of any single file"
+    )
+    budgets.add_argument(
+        "--max-category-tokens",
+        action="append",
+        default=[],
+        metavar="CATEGORY=TOKENS",
+        help="Maximum tokens of a category (repeatable)"
+    )
+    budgets.add_argument(
+        "--max-duplicate-tokens",
+        type=token_limit_type,
+        help="Maximum tokens spent on content duplicated across files"
+    )
+
+    return parser
+
+
+def parse_category_budgets(values: List[str]) -> Dict[str, int]:
+    """
+    Parse CATEGORY=TOKENS budget arguments
+
+    Raises:
+        ValueError: If a value is malformed
+    """
+    budgets = {}
+    for value in values:
+        category, sep, tokens = value.rpartition("=")
+        if not sep or not category or not tokens.isdigit():
+            raise ValueError(f"Invalid category budget '{value}', expected CATEGORY=TOKENS")
+        budgets[category] = int(tokens)
+    return budgets
+
+
+def check_budgets(report: ContextReport, args: argparse.Namespace) -> List[str]:
+    """
+    Compare a report against the budget arguments
+
+    Args:
+        report: Context report
+        args: Parsed arguments
+
+    Returns:
+        List of budget violations (empty if within budget)
+    """
+    violations = []
+    if args.max_tokens is not None and report.total_tokens > args.max_tokens:
+        violations.append(f"Total context is {report.total_tokens} tokens (budget {args.max_tokens})")
+
+    if args.max_file_tokens is not None:
+        for footprint in report.files:
+            if footprint.tokens > args.max_file_tokens:
+                violations.append(f"{footprint.path.name} is {footprint.tokens} tokens "
+                                  f"(file budget {args.max_file_tokens})")
+
+    categories = report.by_category()
+    for category, budget in parse_category_budgets(args.max_category_tokens).items():
+        tokens = categories.get(category, {}).get("tokens", 0)
+        if tokens > budget:
+            violations.append(f"Category '{category}' is {tokens} tokens (budget {budget})")
+
+    if args.max_duplicate_tokens is not None and report.duplicate_tokens > args.max_duplicate_tokens:
+        violations.append(f"Duplicated content costs {report.duplicate_tokens} tokens "
+                          f"(budget {args.max_duplicate_tokens})")
+    return violations
+
+
+def display_report(report: ContextReport, top: int) -> None:
+    """Print a context report as tables"""
+    def relative(path: Path) -> str:
+        try:
+            return str(path.relative_to(report.root.parent))
+        except ValueError:
+            return str(path)
+
+    categories = report.by_category()
+    rows = [[category, totals["files"], format_size(totals["bytes"]), totals["lines"], totals["tokens"],
+             f"{totals['tokens'] / max(report.total_tokens, 1):.0%}"]
+            for category, totals in categories.items()]
+    rows.append(["Total", len(report.files), format_size(report.total_bytes), report.total_lines,
+                 report.total_tokens, "100%"])
+    display_table(["Category", "Files", "Size", "Lines", "~Tokens", "Share"], rows, "Context by category")
+
+    files = sorted(report.files, key=lambda f: f.tokens, reverse=True)
+    if top:
+        files = files[:top]
+    display_table(["File", "Category", "Size", "Lines", "~Tokens"],
+                  [[relative(f.path), f.category, format_size(f.bytes), f.lines, f.tokens] for f in files],
+                  "Largest files")
+
+    if report.duplicates:
+        display_table(["Wasted ~Tokens", "Files", "Content"],
+                      [[d.wasted_tokens, ", ".join(p.name for p in d.files), d.preview + "..."]
+                       for d in report.duplicates],
+                      f"Duplicated content ({report.duplicate_tokens} tokens)")
+
+    for path, parent in report.missing:
+        print(f"{Colors.YELLOW}Missing import: {relative(path)} (from {relative(parent)}){Colors.RESET}")
+    print()
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute analyze-context operation with parsed arguments"""
+    operation = AnalyzeContextOperation()
+    if args.json:
+        # Keep stdout valid JSON for CI; log messages go to stderr
+        get_logger().set_console_stream(sys.stderr)
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        parse_category_budgets(args.max_category_tokens)
+        report = ContextAnalyzer(args.install_dir).analyze()
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    except FileNotFoundError:
+        logger.error(f"No CLAUDE.md found in {args.install_dir}")
+        return 1
+
+    violations = check_budgets(report, args)
+
+    if args.json or args.output:
+        data = report.to_dict()
+        data["budget_violations"] = violations
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        if args.json:
+            print(json.dumps(data, indent=2))
+            return 1 if violations else 0
+
+    if not args.quiet:
+        from setup.cli.base import __version__
+        display_header(
+            f"SuperClaude Context Analysis v{__version__}",
+            f"Context loaded through {report.root}"
+        )
+        display_report(report, args.top)
+
+    if violations:
+        for violation in violations:
+            display_error(violation)
+        return 1
+
+    if not args.quiet:
+        display_success(f"~{report.total_tokens} tokens of context in {len(report.files)} files")
+    return 0
@@ -3,25 +3,33 @@ SuperClaude Backup Operation Module
 Refactored from backup.py for unified CLI hub
 """
 
+import fnmatch
+import io
+import os
 import sys
 import time
 import tarfile
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from ...utils.paths import get_home_directory
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Dict, Any, Set, Tuple
 import argparse
 
+from ...services.backups import BackupCatalog, BackupStore, iter_backup_files
 from ...services.settings import SettingsService
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ...utils.logger import get_logger
-from ... import DEFAULT_INSTALL_DIR
+from ... import DEFAULT_INSTALL_DIR, __version__
 from . import OperationBase
 
+# Installation metadata, archived with the installation files
+INSTALL_METADATA_NAME = ".superclaude-metadata.json"
+
 
 class BackupOperation(OperationBase):
     """Backup operation implementation"""
@@ -41,9 +49,11 @@ def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
         epilog="""
 Examples:
   SuperClaude backup --create               # Create new backup
+  SuperClaude backup --create --dedup       # Store only changed files (deduplicated)
   SuperClaude backup --list --verbose       # List available backups (verbose)
   SuperClaude backup --restore              # Interactive restore
   SuperClaude backup --restore backup.tar.gz  # Restore specific backup
+  SuperClaude backup --restore backup.tar --component agents  # Roll back one component
   SuperClaude backup --info backup.tar.gz   # Show backup information
   SuperClaude backup --cleanup --force      # Clean up old backups (forced)
         """,
@@ -98,6 +108,20 @@ Examples:
         help="Custom backup name (for --create)"
     )
     
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(1, 10),
+        metavar="{1-9}",
+        help="Compression level for gzip/bzip2 (1 = fastest, default: 9)"
+    )
+    
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Create the backup in the deduplicated store (only changed files are stored)"
+    )
+    
     parser.add_argument(
         "--compress",
         choices=["none", "gzip", "bzip2"],
@@ -112,6 +136,32 @@ Examples:
         help="Overwrite existing files during restore"
     )
     
+    parser.add_argument(
+        "--component",
+        action="append",
+        help="Restore only the files of this component (repeatable)"
+    )
+    
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="GLOB",
+        help="Restore only files matching this glob, e.g. 'agents/*.md' (repeatable)"
+    )
+    
+    parser.add_argument(
+        "--paths",
+        nargs="+",
+        help="Restore only these files or directories (relative to the install dir)"
+    )
+    
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Parallel extraction workers for uncompressed archives (default: 4)"
+    )
+    
     # Cleanup options
     parser.add_argument(
         "--keep",
@@ -144,8 +194,48 @@ def check_installation_exists(install_dir: Path) -> bool:
     return settings_manager.check_installation_exists() or settings_manager.check_v2_installation_exists()
 
 
-def get_backup_info(backup_path: Path) -> Dict[str, Any]:
-    """Get information about a backup file"""
+def is_store_backup(backup_path: Path) -> bool:
+    """Check whether a path is a deduplicated backup manifest"""
+    return backup_path.suffix == ".json" and backup_path.parent.name == "manifests"
+
+
+def store_for_manifest(manifest_path: Path) -> BackupStore:
+    """Get the backup store that owns a manifest (<backup-dir>/store/manifests/<name>.json)"""
+    return BackupStore(manifest_path.parent.parent.parent)
+
+
+def resolve_backup_path(name: str, backup_dir: Path) -> Path:
+    """
+    Resolve a backup given on the command line to its archive or manifest path
+    
+    Args:
+        name: Backup file name, path or deduplicated backup name
+        backup_dir: Backup directory
+        
+    Returns:
+        Path to the backup archive or store manifest
+    """
+    backup_path = Path(name)
+    if not backup_path.is_absolute():
+        backup_path = backup_dir / backup_path
+    
+    if not backup_path.exists():
+        manifest_path = BackupStore(backup_dir).manifests_dir / f"{Path(name).stem}.json"
+        if manifest_path.exists():
+            return manifest_path
+    
+    return backup_path
+
+
+def get_backup_info(backup_path: Path, catalog: Optional[BackupCatalog] = None) -> Dict[str, Any]:
+    """
+    Get information about a backup file
+    
+    Args:
+        backup_path: Backup archive or store manifest
+        catalog: Backup catalog to answer from; the archive is only opened
+            when it has no current catalog entry, and the result is recorded
+    """
     info = {
         "path": backup_path,
         "exists": backup_path.exists(),
@@ -157,32 +247,48 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     if not backup_path.exists():
         return info
     
+    if is_store_backup(backup_path):
+        try:
+            manifest = store_for_manifest(backup_path).load_manifest(backup_path.stem)
+            info["size"] = sum(entry["size"] for entry in manifest["files"].values())
+            info["created"] = datetime.fromisoformat(manifest["created"])
+            info["metadata"] = manifest.get("metadata", {})
+            info["files"] = len(manifest["files"])
+            info["dedup"] = True
+        except Exception as e:
+            info["error"] = str(e)
+        return info
+    
+    entry = catalog.get(backup_path) if catalog else None
+    if entry:
+        info["size"] = entry["archive_size"]
+        info["created"] = datetime.fromisoformat(entry["created"])
+        info["metadata"] = entry["metadata"]
+        info["files"] = entry["files"]
+        return info
+    
     try:
         # Get file stats
         stats = backup_path.stat()
         info["size"] = stats.st_size
         info["created"] = datetime.fromtimestamp(stats.st_mtime)
         
-        # Try to read metadata from backup
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
-        
-        with tarfile.open(backup_path, mode) as tar:
-            # Look for metadata file
-            try:
-                metadata_member = tar.getmember("backup_metadata.json")
-                metadata_file = tar.extractfile(metadata_member)
-                if metadata_file:
-                    info["metadata"] = json.loads(metadata_file.read().decode())
-            except KeyError:
-                pass  # No metadata file
+        # Read both metadata files and index the members in a single pass
+        info["install_metadata"] = None
+        with tarfile.open(backup_path, get_archive_read_mode(backup_path)) as tar:
+            members = []
+            for member in tar:
+                members.append(member)
+                if member.name == "backup_metadata.json":
+                    info["metadata"] = read_json_member(tar, member) or {}
+                elif member.name == INSTALL_METADATA_NAME:
+                    info["install_metadata"] = read_json_member(tar, member)
             
-            # Get list of files in backup
-            info["files"] = len(tar.getnames())
+            info["files"] = len(members)
+            info["members"] = index_archive_members(members)
+        
+        if catalog:
+            catalog.record(backup_path, info)
             
     except Exception as e:
         info["error"] = str(e)
@@ -190,6 +296,87 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     return info
 
 
+def get_archive_read_mode(backup_path: Path) -> str:
+    """Get the tarfile read mode for a backup archive"""
+    if backup_path.suffix == ".gz":
+        return "r:gz"
+    elif backup_path.suffix == ".bz2":
+        return "r:bz2"
+    return "r"
+
+
+def read_json_member(tar: tarfile.TarFile, member: tarfile.TarInfo) -> Optional[Any]:
+    """Parse a JSON member of an archive, None if it can't be read"""
+    try:
+        data = tar.extractfile(member)
+        return json.loads(data.read().decode()) if data else None
+    except (ValueError, tarfile.TarError):
+        return None
+
+
+def index_archive_members(members: List[tarfile.TarInfo]) -> Dict[str, List[Any]]:
+    """
+    Build a member index of the files, directories and symlinks in an archive
+    
+    Hard links and special files are not indexed and so never restored.
+    
+    Returns:
+        Dict mapping member name to [data offset, size, mode, mtime, kind,
+        link target], kind being "file", "dir" or "symlink"; the offset is
+        only seekable in uncompressed archives
+    """
+    index = {}
+    for member in members:
+        if member.name == "backup_metadata.json":
+            continue
+        if member.isfile():
+            kind = "file"
+        elif member.isdir():
+            kind = "dir"
+        elif member.issym():
+            kind = "symlink"
+        else:
+            continue
+        index[member.name] = [member.offset_data, member.size, member.mode, int(member.mtime),
+                              kind, member.linkname]
+    return index
+
+
+def get_catalog_entry(backup_path: Path, catalog: BackupCatalog) -> Dict[str, Any]:
+    """
+    Get the catalog entry of an archive, scanning the archive only if not cataloged
+    
+    Args:
+        backup_path: Backup archive
+        catalog: Backup catalog holding indexes
+        
+    Returns:
+        Catalog entry with the member index ("members") and the archived
+        installation metadata ("install_metadata")
+        
+    Raises:
+        ValueError: If the archive can't be read
+    """
+    entry = catalog.get(backup_path)
+    if entry and "members" in entry:
+        return entry
+    
+    info = get_backup_info(backup_path)
+    if "error" in info:
+        raise ValueError(info["error"])
+    entry = catalog.record(backup_path, info)
+    catalog.save()
+    return entry
+
+
+def get_backup_archives(backup_dir: Path) -> List[Path]:
+    """Get tarball backups in a backup directory (excluding partial writes)"""
+    return [
+        backup_file for backup_file in backup_dir.glob("*.tar*")
+        if backup_file.is_file() and not backup_file.name.endswith(".partial")
+    ]
+
+
 def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
     """List all available backups"""
     backups = []
@@ -197,11 +384,26 @@ def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
     if not backup_dir.exists():
         return backups
     
-    # Find all backup files
-    for backup_file in backup_dir.glob("*.tar*"):
-        if backup_file.is_file():
-            info = get_backup_info(backup_file)
-            backups.append(info)
+    # Find all backup files, reading archives only when the catalog is stale
+    catalog = BackupCatalog(backup_dir)
+    archives = get_backup_archives(backup_dir)
+    for backup_file in archives:
+        info = get_backup_info(backup_file, catalog)
+        backups.append(info)
+    catalog.prune(archives)
+    catalog.save()
+    
+    # Add deduplicated backups from the backup store
+    for stored in BackupStore(backup_dir).list_backups():
+        backups.append({
+            "path": stored["path"],
+            "exists": True,
+            "size": stored["size"],
+            "created": stored["created"],
+            "metadata": stored["metadata"],
+            "files": stored["files"],
+            "dedup": True
+        })
     
     # Sort by creation date (newest first)
     backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
@@ -226,6 +428,8 @@ def display_backup_list(backups: List[Dict[str, Any]]) -> None:
         size = format_size(backup["size"]) if backup["size"] > 0 else "unknown"
         created = backup["created"].strftime("%Y-%m-%d %H:%M") if backup["created"] else "unknown"
         files = str(backup.get("files", "unknown"))
+        if backup.get("dedup"):
+            name = f"{backup['path'].stem} (dedup)"
         
         print(f"{name:<30} {size:<10} {created:<20} {files:<8}")
     
@@ -282,6 +486,9 @@ def create_backup(args: argparse.Namespace) -> bool:
         else:
             backup_name = f"superclaude_backup_{timestamp}"
         
+        if getattr(args, 'dedup', False):
+            return create_store_backup(args, backup_dir, backup_name)
+        
         # Determine compression
         if args.compress == "gzip":
             backup_file = backup_dir / f"{backup_name}.tar.gz"
@@ -301,39 +508,69 @@ def create_backup(args: argparse.Namespace) -> bool:
         # Create backup
         start_time = time.time()
         
-        with tarfile.open(backup_file, mode) as tar:
-            # Add metadata file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(metadata, temp_file, indent=2)
-                temp_file.flush()
-                tar.add(temp_file.name, arcname="backup_metadata.json")
-                Path(temp_file.name).unlink()  # Clean up temp file
+        # Linked files (see install --link-mode) are archived by content
+        open_kwargs = {"dereference": True}
+        if mode != "w" and getattr(args, 'compress_level', None):
+            open_kwargs["compresslevel"] = args.compress_level
+        
+        with tarfile.open(backup_file, mode, **open_kwargs) as tar:
+            # Add metadata file straight from memory
+            metadata_bytes = json.dumps(metadata, indent=2).encode()
+            metadata_info = tarfile.TarInfo("backup_metadata.json")
+            metadata_info.size = len(metadata_bytes)
+            metadata_info.mtime = int(time.time())
+            metadata_info.mode = 0o644
+            tar.addfile(metadata_info, io.BytesIO(metadata_bytes))
             
-            # Add installation directory contents (excluding backups and local dirs)
+            # Stream installation directory contents (excluding backups and local dirs)
             files_added = 0
-            for item in args.install_dir.rglob("*"):
-                if item.is_file() and item != backup_file:
-                    try:
-                        # Create relative path for archive
-                        rel_path = item.relative_to(args.install_dir)
-                        
-                        # Skip files in excluded directories
-                        if rel_path.parts and rel_path.parts[0] in ["backups", "local"]:
-                            continue
-                            
-                        tar.add(item, arcname=str(rel_path))
-                        files_added += 1
+            install_metadata = None
+            for item, rel_path in iter_backup_files(args.install_dir):
+                if item == backup_file:
+                    continue
+                try:
+                    if rel_path == INSTALL_METADATA_NAME:
+                        # Archived from memory so the catalog holds exactly what was archived
+                        data = item.read_bytes()
+                        info = tar.gettarinfo(item, arcname=rel_path)
+                        info.size = len(data)
+                        tar.addfile(info, io.BytesIO(data))
+                        try:
+                            install_metadata = json.loads(data.decode())
+                        except ValueError:
+                            pass
+                    else:
+                        tar.add(item, arcname=rel_path, recursive=False)
+                    files_added += 1
+                    
+                    if files_added % 10 == 0:
+                        logger.debug(f"Added {files_added} files to backup")
                         
-                        if files_added % 10 == 0:
-                            logger.debug(f"Added {files_added} files to backup")
-                            
-                    except Exception as e:
-                        logger.warning(f"Could not add {item} to backup: {e}")
+                except Exception as e:
+                    logger.warning(f"Could not add {item} to backup: {e}")
+            
+            # Members written so far are known without reading the archive back
+            members = tar.getmembers()
         
         duration = time.time() - start_time
         file_size = backup_file.stat().st_size
         
+        # Index the new archive so listing and restores never have to scan it
+        if mode == "w":
+            # Data offsets are only set when reading; uncompressed headers are
+            # cheap to walk and the offsets allow seeking restores
+            with tarfile.open(backup_file, "r") as tar:
+                members = tar.getmembers()
+        catalog_info = {
+            "files": files_added + 1,
+            "metadata": metadata,
+            "members": index_archive_members(members),
+            "install_metadata": install_metadata
+        }
+        catalog = BackupCatalog(backup_dir)
+        catalog.record(backup_file, catalog_info)
+        catalog.save()
+        
         logger.success(f"Backup created successfully in {duration:.1f} seconds")
         logger.info(f"Backup file: {backup_file}")
         logger.info(f"Files archived: {files_added}")
@@ -346,6 +583,236 @@ def create_backup(args: argparse.Namespace) -> bool:
         return False
 
 
+def create_store_backup(args: argparse.Namespace, backup_dir: Path, backup_name: str) -> bool:
+    """Create a backup in the deduplicated backup store"""
+    logger = get_logger()
+    store = BackupStore(backup_dir)
+    
+    logger.info(f"Creating deduplicated backup: {backup_name}")
+    start_time = time.time()
+    store_size_before = store.get_store_size()
+    
+    manifest_path = store.create(args.install_dir, backup_name, create_backup_metadata(args.install_dir))
+    
+    duration = time.time() - start_time
+    files_added = len(store.load_manifest(backup_name)["files"])
+    
+    logger.success(f"Backup created successfully in {duration:.1f} seconds")
+    logger.info(f"Backup manifest: {manifest_path}")
+    logger.info(f"Files recorded: {files_added}")
+    logger.info(f"New data stored: {format_size(store.get_store_size() - store_size_before)}")
+    
+    return True
+
+
+# Fallback member locations per component, as (directory, filename glob), for
+# backups whose archived metadata has no file manifest for the component
+COMPONENT_RESTORE_PATTERNS = {
+    "core": ("", "*.md"),
+    "modes": ("", "MODE_*.md"),
+    "mcp_docs": ("", "MCP_*.md"),
+    "agents": ("agents", "*.md"),
+    "commands": ("commands/sc", "*.md"),
+}
+
+
+def component_member_names(component: str, names: List[str],
+                           archived_metadata: Dict[str, Any]) -> Set[str]:
+    """
+    Get the archive members belonging to a component
+    
+    Args:
+        component: Component name
+        names: Member names in the backup
+        archived_metadata: .superclaude-metadata.json from the backup
+        
+    Returns:
+        Set of member names
+    """
+    manifest = archived_metadata.get("file_manifests", {}).get(component)
+    if manifest:
+        return set(manifest) & set(names)
+    
+    if component not in COMPONENT_RESTORE_PATTERNS:
+        raise ValueError(f"Unknown component '{component}'")
+    
+    directory, pattern = COMPONENT_RESTORE_PATTERNS[component]
+    selected = set()
+    for name in names:
+        parent, _, filename = name.rpartition("/")
+        if parent != directory or not fnmatch.fnmatch(filename, pattern):
+            continue
+        # Top-level core files exclude those owned by the modes/mcp_docs components
+        if component == "core" and (filename.startswith("MODE_") or filename.startswith("MCP_")):
+            continue
+        selected.add(name)
+    return selected
+
+
+def select_restore_members(names: List[str], args: argparse.Namespace,
+                           read_member: Callable[[str], Optional[bytes]]) -> List[str]:
+    """
+    Apply --component, --include and --paths restore filters
+    
+    Args:
+        names: Member names in the backup
+        args: Parsed arguments
+        read_member: Reads a member's content (used for archived metadata)
+        
+    Returns:
+        Selected member names (all names when no filter is given)
+    """
+    components = getattr(args, 'component', None) or []
+    includes = getattr(args, 'include', None) or []
+    paths = [p.strip("/") for p in (getattr(args, 'paths', None) or [])]
+    
+    if not (components or includes or paths):
+        return list(names)
+    
+    selected = set()
+    
+    if components:
+        archived_metadata = {}
+        raw = read_member(INSTALL_METADATA_NAME)
+        if raw:
+            try:
+                archived_metadata = json.loads(raw.decode())
+            except ValueError:
+                pass
+        for component in components:
+            selected |= component_member_names(component, names, archived_metadata)
+    
+    for name in names:
+        if any(fnmatch.fnmatch(name, pattern) for pattern in includes):
+            selected.add(name)
+        elif any(name == path or name.startswith(path + "/") for path in paths):
+            selected.add(name)
+    
+    return [name for name in names if name in selected]
+
+
+def resolve_restore_target(install_dir: Path, name: str) -> Path:
+    """
+    Resolve where a member is restored, rejecting paths outside install_dir
+    
+    Raises:
+        ValueError: If the member would be written outside install_dir
+    """
+    root = install_dir.resolve()
+    target = (install_dir / name).resolve()
+    if target != root and root not in target.parents:
+        raise ValueError(f"Refusing to restore outside installation directory: {name}")
+    return target
+
+
+def restore_non_file_members(index: Dict[str, List[Any]], targets: Dict[str, Path],
+                             install_dir: Path) -> Tuple[int, List[str]]:
+    """
+    Recreate the directories and symlinks among the restore targets
+    
+    Symlinks pointing outside install_dir are refused.
+    
+    Returns:
+        Tuple of (members restored, error messages)
+    """
+    restored = 0
+    errors = []
+    root = install_dir.resolve()
+    for name, target in sorted(targets.items()):
+        _, _, mode, mtime, kind, linkname = index[name]
+        try:
+            if kind == "dir":
+                target.mkdir(parents=True, exist_ok=True)
+                os.chmod(target, mode & 0o777)
+            elif kind == "symlink":
+                link_target = (target.parent / linkname).resolve()
+                if link_target != root and root not in link_target.parents:
+                    raise ValueError(f"link target {linkname} is outside the installation directory")
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if target.is_symlink() or target.exists():
+                    target.unlink()
+                os.symlink(linkname, target)
+            else:
+                continue
+            restored += 1
+        except (OSError, ValueError) as e:
+            errors.append(f"Could not restore {name}: {e}")
+    return restored, errors
+
+
+def write_restored_file(target: Path, source, size: int, mode: int, mtime: int) -> None:
+    """Write restored file data atomically and apply its mode and mtime"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.restore")
+    with open(temp_path, 'wb') as f:
+        remaining = size
+        while remaining > 0:
+            chunk = source.read(min(65536, remaining))
+            if not chunk:
+                raise IOError(f"Unexpected end of archive data for {target.name}")
+            f.write(chunk)
+            remaining -= len(chunk)
+    os.chmod(temp_path, mode & 0o777)
+    os.utime(temp_path, (mtime, mtime))
+    os.replace(temp_path, target)
+
+
+def restore_members_parallel(backup_path: Path, index: Dict[str, List[Any]],
+                             targets: Dict[str, Path], jobs: int) -> Tuple[int, List[str]]:
+    """
+    Restore members of an uncompressed archive by seeking to their data
+    
+    Each worker opens its own handle, so members are extracted concurrently
+    without reading the rest of the archive.
+    """
+    def extract(name: str) -> None:
+        offset, size, mode, mtime = index[name][:4]
+        with open(backup_path, 'rb') as f:
+            f.seek(offset)
+            write_restored_file(targets[name], f, size, mode, mtime)
+    
+    restored = 0
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {name: executor.submit(extract, name) for name in targets}
+        for name, future in futures.items():
+            try:
+                future.result()
+                restored += 1
+            except Exception as e:
+                errors.append(f"Could not restore {name}: {e}")
+    return restored, errors
+
+
+def restore_members_streaming(backup_path: Path, targets: Dict[str, Path]) -> Tuple[int, List[str]]:
+    """
+    Restore members of a compressed archive in one forward pass
+    
+    Stops reading as soon as every selected member has been extracted.
+    """
+    restored = 0
+    errors = []
+    pending = set(targets)
+    stream_mode = get_archive_read_mode(backup_path).replace(":", "|")
+    
+    with tarfile.open(backup_path, stream_mode) as tar:
+        for member in tar:
+            if member.name not in pending:
+                continue
+            pending.discard(member.name)
+            try:
+                write_restored_file(targets[member.name], tar.extractfile(member),
+                                    member.size, member.mode, int(member.mtime))
+                restored += 1
+            except Exception as e:
+                errors.append(f"Could not restore {member.name}: {e}")
+            if not pending:
+                break
+    
+    errors.extend(f"Member not found in archive: {name}" for name in sorted(pending))
+    return restored, errors
+
+
 def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
     """Restore from a backup file"""
     logger = get_logger()
@@ -355,61 +822,84 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
             logger.error(f"Backup file not found: {backup_path}")
             return False
         
-        # Check backup file
-        info = get_backup_info(backup_path)
-        if "error" in info:
-            logger.error(f"Invalid backup file: {info['error']}")
-            return False
-        
         logger.info(f"Restoring from backup: {backup_path}")
+        start_time = time.time()
         
-        # Determine compression
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
+        if is_store_backup(backup_path):
+            store = store_for_manifest(backup_path)
+            manifest = store.load_manifest(backup_path.stem)
+            
+            def read_member(name: str) -> Optional[bytes]:
+                entry = manifest["files"].get(name)
+                blob = store.objects_dir / entry["sha256"][:2] / entry["sha256"] if entry else None
+                return blob.read_bytes() if blob and blob.exists() else None
+            
+            selected = select_restore_members(list(manifest["files"]), args, read_member)
         else:
-            mode = "r"
+            catalog = BackupCatalog(backup_path.parent)
+            try:
+                entry = get_catalog_entry(backup_path, catalog)
+            except ValueError as e:
+                logger.error(f"Invalid backup file: {e}")
+                return False
+            index = entry["members"]
+            
+            def read_member(name: str) -> Optional[bytes]:
+                # Only the archived metadata is read, and the catalog holds it
+                if name == INSTALL_METADATA_NAME and entry.get("install_metadata") is not None:
+                    return json.dumps(entry["install_metadata"]).encode()
+                return None
+            
+            selected = select_restore_members(list(index), args, read_member)
         
-        # Create backup of current installation if it exists
-        if check_installation_exists(args.install_dir) and not args.dry_run:
-            logger.info("Creating backup of current installation before restore")
-            # This would call create_backup internally
+        if not selected:
+            logger.warning("No files in the backup match the restore filters")
+            return False
+        
+        # Resolve targets, skipping existing files unless overwriting
+        targets = {}
+        for name in selected:
+            target_path = resolve_restore_target(args.install_dir, name)
+            if not is_store_backup(backup_path) and index[name][4] == "dir" and target_path.is_dir():
+                continue
+            if target_path.exists() and not args.overwrite:
+                logger.warning(f"Skipping existing file: {target_path}")
+                continue
+            targets[name] = target_path
+        
+        if args.dry_run:
+            for name in targets:
+                logger.info(f"Would restore {name}")
+            logger.info(f"Would restore {len(targets)} of {len(selected)} selected files")
+            return True
         
         # Extract backup
-        start_time = time.time()
-        files_restored = 0
+        if is_store_backup(backup_path):
+            files_restored, errors = store.restore(
+                backup_path.stem, args.install_dir, overwrite=args.overwrite, paths=set(targets)
+            )
+        else:
+            # Directories first so files restore into them, symlinks are cheap
+            files_restored, errors = restore_non_file_members(index, targets, args.install_dir)
+            file_targets = {name: path for name, path in targets.items() if index[name][4] == "file"}
+            if get_archive_read_mode(backup_path) == "r":
+                restored, file_errors = restore_members_parallel(
+                    backup_path, index, file_targets, getattr(args, 'jobs', None) or 4
+                )
+            else:
+                restored, file_errors = restore_members_streaming(backup_path, file_targets)
+            files_restored += restored
+            errors += file_errors
         
-        with tarfile.open(backup_path, mode) as tar:
-            # Extract all files except metadata
-            for member in tar.getmembers():
-                if member.name == "backup_metadata.json":
-                    continue
-                
-                try:
-                    target_path = args.install_dir / member.name
-                    
-                    # Check if file exists and overwrite flag
-                    if target_path.exists() and not args.overwrite:
-                        logger.warning(f"Skipping existing file: {target_path}")
-                        continue
-                    
-                    # Extract file
-                    tar.extract(member, args.install_dir)
-                    files_restored += 1
-                    
-                    if files_restored % 10 == 0:
-                        logger.debug(f"Restored {files_restored} files")
-                        
-                except Exception as e:
-                    logger.warning(f"Could not restore {member.name}: {e}")
+        for error in errors:
+            logger.warning(error)
         
         duration = time.time() - start_time
         
-        logger.success(f"Restore completed successfully in {duration:.1f} seconds")
+        logger.success(f"Restore completed in {duration:.1f} seconds")
         logger.info(f"Files restored: {files_restored}")
         
-        return True
+        return not errors
         
     except Exception as e:
         logger.exception(f"Failed to restore backup: {e}")
@@ -475,12 +965,20 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         
         logger.info(f"Cleaning up {len(to_remove)} old backups")
         
+        catalog = BackupCatalog(backup_dir)
         for backup in to_remove:
             try:
                 backup["path"].unlink()
+                catalog.remove(backup["path"])
                 logger.info(f"Removed backup: {backup['path'].name}")
             except Exception as e:
                 logger.warning(f"Could not remove {backup['path'].name}: {e}")
+        catalog.save()
+        
+        # Reclaim blobs that no remaining deduplicated backup references
+        if any(backup.get("dedup") for backup in to_remove):
+            removed, freed = BackupStore(backup_dir).gc()
+            logger.info(f"Removed {removed} unreferenced blobs ({format_size(freed)})")
         
         return True
         
@@ -541,18 +1039,16 @@ def run(args: argparse.Namespace) -> int:
                     return 0
             else:
                 # Specific backup file
-                backup_path = Path(args.restore)
-                if not backup_path.is_absolute():
-                    backup_path = backup_dir / backup_path
+                backup_path = resolve_backup_path(args.restore, backup_dir)
             
             success = restore_backup(backup_path, args)
             
         elif args.info:
-            backup_path = Path(args.info)
-            if not backup_path.is_absolute():
-                backup_path = backup_dir / backup_path
+            backup_path = resolve_backup_path(args.info, backup_dir)
             
-            info = get_backup_info(backup_path)
+            catalog = BackupCatalog(backup_path.parent)
+            info = get_backup_info(backup_path, catalog)
+            catalog.save()
             if info["exists"]:
                 print(f"\n{Colors.CYAN}Backup Information:{Colors.RESET}")
                 print(f"File: {info['path']}")
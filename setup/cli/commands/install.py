@@ -13,6 +13,7 @@ import argparse
 from ...core.installer import Installer
 from ...core.registry import ComponentRegistry
 from ...services.config import ConfigService
+from ...services.files import LINK_MODES
 from ...core.validator import Validator
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
@@ -22,6 +23,7 @@ from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT, DATA_DIR
 from . import OperationBase
+from ..base import token_count_type
 
 
 class InstallOperation(OperationBase):
@@ -45,6 +47,7 @@ Examples:
   SuperClaude install --dry-run                # Dry-run mode  
   SuperClaude install --components core mcp    # Specific components
   SuperClaude install --verbose --force        # Verbose with force mode
+  SuperClaude install --parallel --max-workers 4  # Install dependency levels concurrently
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -66,6 +69,88 @@ Examples:
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--dedup-backup",
+        action="store_true",
+        help="Store the pre-install backup in the deduplicated backup store instead of a tarball"
+    )
+    
+    parser.add_argument(
+        "--backup-level",
+        type=int,
+        choices=range(1, 10),
+        metavar="{1-9}",
+        help="gzip level for the pre-install backup (1 = fastest, default: 9)"
+    )
+    
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        help="How installed files refer to the packaged framework files "
+             "(default: copy, or the mode used by the previous install); "
+             "unsupported modes fall back to copy"
+    )
+    
+    parser.add_argument(
+        "--doc-variant",
+        choices=["full", "compact"],
+        default="full",
+        help="Install the full framework docs or compact variants without examples, "
+             "decorative tables and extra whitespace (default: full)"
+    )
+    
+    parser.add_argument(
+        "--context-budget",
+        type=token_count_type,
+        metavar="TOKENS",
+        help="Cap the framework docs @imported by CLAUDE.md (e.g. 20k); docs are chosen by "
+             "their features.json priority, the rest stay installed but are not imported"
+    )
+    
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Install independent components concurrently, one dependency level at a time"
+    )
+    
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Maximum concurrent component installs with --parallel (default: 4)"
+    )
+    
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop installing remaining components after the first failure"
+    )
+    
+    parser.add_argument(
+        "--mcp-workers",
+        type=int,
+        default=4,
+        help="Maximum MCP servers to provision concurrently (default: 4, 1 = serial)"
+    )
+    
+    parser.add_argument(
+        "--mcp-server-timeout",
+        type=int,
+        help="Time limit in seconds for installing and registering each MCP server"
+    )
+    
+    parser.add_argument(
+        "--mcp-offline",
+        action="store_true",
+        help="Only install MCP servers from the prefetched artifact cache (see 'SuperClaude mcp prefetch')"
+    )
+    
+    parser.add_argument(
+        "--mcp-cache-dir",
+        type=Path,
+        help="MCP artifact cache directory (default: .superclaude-cache/mcp in the install directory)"
+    )
+    
     parser.add_argument(
         "--list-components",
         action="store_true",
@@ -450,7 +535,8 @@ def run_system_diagnostics(validator: Validator) -> None:
         print("  3. Run 'SuperClaude install --diagnose' again to verify")
 
 
-def perform_installation(components: List[str], args: argparse.Namespace, config_manager: ConfigService = None) -> bool:
+def perform_installation(components: List[str], args: argparse.Namespace, config_manager: ConfigService = None,
+                         registry: Optional[ComponentRegistry] = None) -> bool:
     """Perform the actual installation"""
     logger = get_logger()
     start_time = time.time()
@@ -459,8 +545,9 @@ def perform_installation(components: List[str], args: argparse.Namespace, config
         # Create installer
         installer = Installer(args.install_dir, dry_run=args.dry_run)
         
-        # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        # Reuse the caller's registry so components planned for display are not rescanned
+        if registry is None:
+            registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
         registry.discover_components()
         
         # Create component instances
@@ -490,9 +577,30 @@ def perform_installation(components: List[str], args: argparse.Namespace, config
             "force": args.force,
             "backup": not args.no_backup,
             "dry_run": args.dry_run,
-            "selected_mcp_servers": getattr(config_manager, '_installation_context', {}).get("selected_mcp_servers", [])
+            "selected_mcp_servers": getattr(config_manager, '_installation_context', {}).get("selected_mcp_servers", []),
+            "dedup_backup": getattr(args, 'dedup_backup', False),
+            "backup_compresslevel": getattr(args, 'backup_level', None),
+            "parallel": getattr(args, 'parallel', False),
+            "max_workers": getattr(args, 'max_workers', 4),
+            "fail_fast": getattr(args, 'fail_fast', False),
+            "mcp_max_workers": getattr(args, 'mcp_workers', 4),
+            "mcp_server_timeout": getattr(args, 'mcp_server_timeout', None),
+            "mcp_offline": getattr(args, 'mcp_offline', False),
+            "mcp_cache_dir": getattr(args, 'mcp_cache_dir', None),
+            "link_mode": getattr(args, 'link_mode', None),
+            "context_budget": getattr(args, 'context_budget', None),
+            "doc_variant": getattr(args, 'doc_variant', "full")
         }
         
+        config_manager = config_manager or ConfigService(DATA_DIR)
+        if config["context_budget"]:
+            config["context_priorities"] = config_manager.get_context_priorities()
+        if config["doc_variant"] == "compact":
+            config["compact_sections"] = config_manager.get_compact_sections()
+        
+        if config["parallel"]:
+            config["install_levels"] = registry.get_installation_order(ordered_components)
+        
         success = installer.install_components(ordered_components, config)
         
         # Update progress
@@ -614,7 +722,7 @@ def run(args: argparse.Namespace) -> int:
         
         # Handle diagnostic mode
         if args.diagnose:
-            validator = Validator()
+            validator = Validator(install_dir=args.install_dir)
             run_system_diagnostics(validator)
             return 0
         
@@ -625,7 +733,7 @@ def run(args: argparse.Namespace) -> int:
         registry.discover_components()
         
         config_manager = ConfigService(DATA_DIR)
-        validator = Validator()
+        validator = Validator(install_dir=args.install_dir)
         
         # Validate configuration
         config_errors = config_manager.validate_config_files()
@@ -674,7 +782,7 @@ def run(args: argparse.Namespace) -> int:
                     return 0
         
         # Perform installation
-        success = perform_installation(resolved_components, args, config_manager)
+        success = perform_installation(resolved_components, args, config_manager, registry)
         
         if success:
             if not args.quiet:
@@ -0,0 +1,173 @@
+"""
+SuperClaude MCP Operation Module
+Prefetches MCP server packages into a local artifact cache for offline installs
+"""
+
+import argparse
+import json
+import subprocess
+from pathlib import Path
+from typing import List
+
+from ...components.mcp import MCPComponent
+from ...services.mcp_cache import MCPArtifactCache
+from ...utils.ui import display_header, display_info, display_success, display_error, display_warning, Colors
+from ...utils.logger import get_logger
+from . import OperationBase
+
+
+class MCPOperation(OperationBase):
+    """MCP artifact cache operation implementation"""
+
+    def __init__(self):
+        super().__init__("mcp")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register mcp CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "mcp",
+        help="Prefetch MCP servers for offline installation",
+        description="Resolve MCP servers into a local artifact cache with a lockfile of exact versions",
+        epilog="""
+Examples:
+  SuperClaude mcp prefetch                        # Cache every known MCP server
+  SuperClaude mcp prefetch --servers context7 serena
+  SuperClaude mcp status                          # Show cached versions
+  SuperClaude install --mcp-offline               # Install from the cache only
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "action",
+        choices=["prefetch", "status"],
+        help="prefetch: download and pin artifacts; status: show the lockfile"
+    )
+
+    parser.add_argument(
+        "--servers",
+        nargs="+",
+        metavar="NAME",
+        help="Servers to prefetch (default: all known servers)"
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Artifact cache directory (default: .superclaude-cache/mcp in the install directory)"
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=900,
+        help="Timeout in seconds for each download/build step (default: 900)"
+    )
+
+    return parser
+
+
+def prefetch_servers(cache: MCPArtifactCache, servers: List[str], definitions: dict, timeout: int,
+                     dry_run: bool = False) -> List[str]:
+    """
+    Prefetch servers into the artifact cache
+
+    Args:
+        cache: Artifact cache
+        servers: Server names
+        definitions: Server definitions from MCPComponent.mcp_servers
+        timeout: Timeout in seconds per step
+        dry_run: Only show what would be fetched
+
+    Returns:
+        Names of servers that failed
+    """
+    failed = []
+    for name in servers:
+        source = cache.resolve_source(definitions[name])
+        if source is None:
+            display_warning(f"{name}: no cacheable package source, skipping")
+            continue
+
+        if dry_run:
+            display_info(f"Would prefetch {name} ({source['type']} {source['spec']})")
+            continue
+
+        display_info(f"Prefetching {name} ({source['spec']})...")
+        try:
+            entry = cache.prefetch(name, definitions[name], timeout=timeout)
+        except (ValueError, RuntimeError, OSError, KeyError, json.JSONDecodeError,
+                subprocess.TimeoutExpired) as e:
+            display_error(f"{name}: {e}")
+            failed.append(name)
+            continue
+        display_success(f"{name}: {entry['package']} {entry['version']}")
+    return failed
+
+
+def display_cache_status(cache: MCPArtifactCache, definitions: dict) -> None:
+    """Show cached versions and whether their artifacts are intact"""
+    lock = cache.load_lock()
+    print(f"\n{Colors.CYAN}MCP artifact cache:{Colors.RESET} {cache.cache_dir}")
+    for name in definitions:
+        entry = lock.get(name)
+        if not entry:
+            print(f"  {name:<22} {Colors.YELLOW}not cached{Colors.RESET}")
+        elif cache.verify(name):
+            print(f"  {name:<22} {Colors.GREEN}{entry['package']} {entry['version']}{Colors.RESET}")
+        else:
+            print(f"  {name:<22} {Colors.RED}{entry['package']} {entry['version']} (artifacts missing or modified){Colors.RESET}")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute mcp operation with parsed arguments"""
+    operation = MCPOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        if not args.quiet:
+            from setup.cli.base import __version__
+            display_header(
+                f"SuperClaude MCP v{__version__}",
+                "MCP server artifact cache"
+            )
+
+        definitions = MCPComponent(args.install_dir).mcp_servers
+        cache = MCPArtifactCache(args.cache_dir, install_dir=args.install_dir)
+
+        if args.action == "status":
+            display_cache_status(cache, definitions)
+            return 0
+
+        servers = args.servers or list(definitions)
+        unknown = [name for name in servers if name not in definitions]
+        if unknown:
+            logger.error(f"Unknown MCP servers: {', '.join(unknown)}")
+            return 1
+
+        failed = prefetch_servers(cache, servers, definitions, args.timeout, dry_run=args.dry_run)
+        if failed:
+            logger.error(f"Failed to prefetch: {', '.join(failed)}")
+            return 1
+
+        if not args.dry_run:
+            display_success(f"Lockfile written to {cache.lock_file}")
+        return 0
+
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}MCP prefetch cancelled by user{Colors.RESET}")
+        return 130
+    except Exception as e:
+        logger.exception(f"Unexpected error during MCP operation: {e}")
+        return 1
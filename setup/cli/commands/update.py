@@ -12,7 +12,9 @@ import argparse
 
 from ...core.installer import Installer
 from ...core.registry import ComponentRegistry
+from ...services.config import ConfigService
 from ...services.settings import SettingsService
+from ...services.files import LINK_MODES
 from ...core.validator import Validator
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
@@ -22,6 +24,7 @@ from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT, DATA_DIR
 from . import OperationBase
+from ..base import token_count_type
 
 
 class UpdateOperation(OperationBase):
@@ -78,6 +81,30 @@ Examples:
     )
     
     # Update options
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        help="How installed files refer to the packaged framework files "
+             "(default: copy, or the mode used by the previous install); "
+             "unsupported modes fall back to copy"
+    )
+    
+    parser.add_argument(
+        "--doc-variant",
+        choices=["full", "compact"],
+        default="full",
+        help="Install the full framework docs or compact variants without examples, "
+             "decorative tables and extra whitespace (default: full)"
+    )
+    
+    parser.add_argument(
+        "--context-budget",
+        type=token_count_type,
+        metavar="TOKENS",
+        help="Cap the framework docs @imported by CLAUDE.md (e.g. 20k); docs are chosen by "
+             "their features.json priority, the rest stay installed but are not imported"
+    )
+    
     parser.add_argument(
         "--reinstall",
         action="store_true",
@@ -333,9 +360,18 @@ def perform_update(components: List[str], args: argparse.Namespace, registry: Co
             "backup": backup,
             "dry_run": args.dry_run,
             "update_mode": True,
+            "link_mode": getattr(args, 'link_mode', None),
+            "context_budget": getattr(args, 'context_budget', None),
+            "doc_variant": getattr(args, 'doc_variant', "full"),
             "selected_mcp_servers": list(mcp_instance.mcp_servers.keys()) if "mcp" in component_instances else []
         }
         
+        config_manager = ConfigService(DATA_DIR)
+        if config["context_budget"]:
+            config["context_priorities"] = config_manager.get_context_priorities()
+        if config["doc_variant"] == "compact":
+            config["compact_sections"] = config_manager.get_compact_sections()
+        
         success = installer.update_components(components, config)
         
         # Update progress
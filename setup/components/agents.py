@@ -134,15 +134,13 @@ class AgentsComponent(Component):
             
             self.logger.info(f"Updating agents component from {current_version} to {target_version}")
             
-            # Create backup of existing agents
+            # Back up only the agents this update will overwrite or remove
             backup_files = []
-            for filename in self.component_files:
-                file_path = self.install_component_subdir / filename
-                if file_path.exists():
-                    backup_path = self.file_manager.backup_file(file_path)
-                    if backup_path:
-                        backup_files.append(backup_path)
-                        self.logger.debug(f"Backed up agent: {filename}")
+            for file_path in self._get_files_to_overwrite():
+                backup_path = self.file_manager.backup_file(file_path)
+                if backup_path:
+                    backup_files.append(backup_path)
+                    self.logger.debug(f"Backed up agent: {file_path.name}")
             
             # Perform installation (will overwrite existing files)
             if self._install(config):
@@ -173,13 +171,7 @@ class AgentsComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Add overhead for directories and metadata
         total_size += 5120  # ~5KB overhead
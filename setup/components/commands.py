@@ -162,18 +162,13 @@ class CommandsComponent(Component):
             
             self.logger.info(f"Updating commands component from {current_version} to {target_version}")
             
-            # Create backup of existing command files
-            commands_dir = self.install_dir / "commands" / "sc"
+            # Back up only the command files this update will overwrite or remove
             backup_files = []
-            
-            if commands_dir.exists():
-                for filename in self.component_files:
-                    file_path = commands_dir / filename
-                    if file_path.exists():
-                        backup_path = self.file_manager.backup_file(file_path)
-                        if backup_path:
-                            backup_files.append(backup_path)
-                            self.logger.debug(f"Backed up {filename}")
+            for file_path in self._get_files_to_overwrite():
+                backup_path = self.file_manager.backup_file(file_path)
+                if backup_path:
+                    backup_files.append(backup_path)
+                    self.logger.debug(f"Backed up {file_path.name}")
             
             # Perform installation (overwrites existing files)
             success = self.install(config)
@@ -243,13 +238,7 @@ class CommandsComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Add overhead for directory and settings
         total_size += 5120  # ~5KB overhead
@@ -13,6 +13,8 @@ from setup import __version__
 class CoreComponent(Component):
     """Core SuperClaude framework files component"""
     
+    SUPPORTS_COMPACT_DOCS = True
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize core component"""
         super().__init__(install_dir)
@@ -148,15 +150,13 @@ class CoreComponent(Component):
             
             self.logger.info(f"Updating core component from {current_version} to {target_version}")
             
-            # Create backup of existing files
+            # Back up only the files this update will overwrite or remove
             backup_files = []
-            for filename in self.component_files:
-                file_path = self.install_dir / filename
-                if file_path.exists():
-                    backup_path = self.file_manager.backup_file(file_path)
-                    if backup_path:
-                        backup_files.append(backup_path)
-                        self.logger.debug(f"Backed up {filename}")
+            for file_path in self._get_files_to_overwrite():
+                backup_path = self.file_manager.backup_file(file_path)
+                if backup_path:
+                    backup_files.append(backup_path)
+                    self.logger.debug(f"Backed up {file_path.name}")
             
             # Perform installation (overwrites existing files)
             success = self.install(config)
@@ -233,13 +233,7 @@ class CoreComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Add overhead for settings.json and directories
         total_size += 10240  # ~10KB overhead
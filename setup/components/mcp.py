@@ -7,12 +7,16 @@ import platform
 import shlex
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from setup import __version__
 
 from ..core.base import Component
+from ..services.mcp_cache import MCPArtifactCache
 from ..utils.ui import display_info, display_warning
 
 
@@ -23,6 +27,17 @@ class MCPComponent(Component):
         """Initialize MCP component"""
         super().__init__(install_dir)
         self.installed_servers_in_session: List[str] = []
+        # Parsed `claude mcp list` output, taken once and reused until an
+        # add/remove invalidates it (None means "not loaded yet")
+        self._server_snapshot: Optional[Dict[str, Dict[str, str]]] = None
+        self._server_snapshot_error: Optional[str] = None
+        # Serializes `claude mcp add/remove` (they rewrite the same Claude
+        # config file) and snapshot loads when servers install concurrently
+        self._mcp_config_lock = threading.RLock()
+        self._artifact_cache: Optional[MCPArtifactCache] = None
+        # Deadline and collected user messages of the server being installed
+        # by the current thread (see _install_server_safely)
+        self._server_state = threading.local()
         
         # Define MCP servers to install
         self.mcp_servers = {
@@ -247,7 +262,7 @@ class MCPComponent(Component):
                     ["uv", "--version"],
                     capture_output=True,
                     text=True,
-                    timeout=10
+                    timeout=self._get_server_timeout(config, 10)
                 )
                 if uv_check.returncode != 0:
                     self.logger.error(f"uv not found - required for {server_name} installation")
@@ -268,28 +283,16 @@ class MCPComponent(Component):
                 cmd_parts,
                 capture_output=True,
                 text=True,
-                timeout=900   # 15 minutes
+                timeout=self._get_server_timeout(config, 900)   # 15 minutes
             )
 
             if result.returncode == 0:
                 self.logger.success(f"Successfully installed MCP server (user scope): {server_name}")
 
-                # For Serena, we need to handle the run command specially
-                if server_name == "serena":
-                    # Serena needs project-specific registration, use current working directory
-                    current_dir = os.getcwd()
-                    serena_run_cmd = f"{run_command} --project {shlex.quote(current_dir)}"
-                    self.logger.info(f"Registering {server_name} with Claude CLI for project: {current_dir}")
-                    reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(serena_run_cmd)
-                else:
-                    self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {run_command}")
-                    reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(run_command)
-
-                reg_result = self._run_command_cross_platform(
-                    reg_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
+                run_cmd = self._get_run_command(server_info)
+                self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {shlex.join(run_cmd)}")
+                reg_result = self._register_mcp_server(
+                    server_name, run_cmd, self._get_server_timeout(config, 120)
                 )
 
                 if reg_result.returncode == 0:
@@ -338,7 +341,7 @@ class MCPComponent(Component):
                     ["uvx", "--version"],
                     capture_output=True,
                     text=True,
-                    timeout=10
+                    timeout=self._get_server_timeout(config, 10)
                 )
                 if uvx_check.returncode != 0:
                     self.logger.error(f"uvx not found - required for {server_name} installation")
@@ -359,21 +362,17 @@ class MCPComponent(Component):
                 cmd_parts,
                 capture_output=True,
                 text=True,
-                timeout=300   # 5 minutes for GitHub clone and build
+                timeout=self._get_server_timeout(config, 300)   # 5 minutes for GitHub clone and build
             )
 
             if result.returncode == 0:
                 self.logger.success(f"Successfully tested GitHub MCP server: {server_name}")
 
                 # Register with Claude CLI using the run command
-                self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {run_command}")
-                reg_cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name] + shlex.split(run_command)
-
-                reg_result = self._run_command_cross_platform(
-                    reg_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
+                run_cmd = self._get_run_command(server_info)
+                self.logger.info(f"Registering {server_name} with Claude CLI. Run command: {shlex.join(run_cmd)}")
+                reg_result = self._register_mcp_server(
+                    server_name, run_cmd, self._get_server_timeout(config, 120)
                 )
 
                 if reg_result.returncode == 0:
@@ -395,8 +394,59 @@ class MCPComponent(Component):
             self.logger.error(f"Error installing MCP server {server_name} from GitHub: {e}")
             return False
 
-    def _check_mcp_server_installed(self, server_name: str) -> bool:
-        """Check if MCP server is already installed"""
+    def _parse_mcp_list_output(self, output: str) -> Dict[str, Dict[str, str]]:
+        """
+        Parse `claude mcp list` output into a server state mapping
+
+        Lines look like ``name: command args - ✓ Connected``; bare server
+        names are accepted as well.
+
+        Args:
+            output: stdout of `claude mcp list`
+
+        Returns:
+            Dict mapping lower-cased server name to {"command", "status"}
+        """
+        servers = {}
+        for line in output.strip().split('\n'):
+            line = line.strip()
+            if not line or line.startswith('#') or line.lower().startswith(('no ', 'checking')):
+                continue
+
+            if ':' in line:
+                name, rest = line.split(':', 1)
+            else:
+                name, _, rest = line.partition(' ')
+
+            name = name.strip().lower()
+            if not name or ' ' in name:
+                continue
+
+            command, _, status = rest.strip().rpartition(' - ')
+            if not command:
+                command, status = status, ""
+
+            servers[name] = {"command": command.strip(), "status": status.strip()}
+
+        return servers
+
+    def _get_mcp_server_snapshot(self, refresh: bool = False) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Get the cached `claude mcp list` snapshot, running the CLI at most once
+
+        Args:
+            refresh: Discard the cached snapshot and query the CLI again
+
+        Returns:
+            Server state mapping, or None if the CLI could not be queried
+        """
+        with self._mcp_config_lock:
+            if self._server_snapshot is not None and not refresh:
+                return self._server_snapshot
+            return self._load_mcp_server_snapshot()
+
+    def _load_mcp_server_snapshot(self) -> Optional[Dict[str, Dict[str, str]]]:
+        """Run `claude mcp list` and store the parsed snapshot"""
         try:
             result = self._run_command_cross_platform(
                 ["claude", "mcp", "list"],
@@ -404,19 +454,140 @@ class MCPComponent(Component):
                 text=True,
                 timeout=60
             )
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            self._server_snapshot_error = str(e)
+            self.logger.warning(f"Error listing MCP servers: {e}")
+            return None
 
-            if result.returncode != 0:
-                self.logger.warning(f"Could not list MCP servers: {result.stderr}")
-                return False
+        if result.returncode != 0:
+            self._server_snapshot_error = result.stderr.strip() if result.stderr else "Unknown error"
+            self.logger.warning(f"Could not list MCP servers: {result.stderr}")
+            return None
+
+        self._server_snapshot = self._parse_mcp_list_output(result.stdout or "")
+        self._server_snapshot_error = None
+        return self._server_snapshot
+
+    def _invalidate_mcp_server_snapshot(self) -> None:
+        """Drop the cached server snapshot after Claude's MCP config changed"""
+        self._server_snapshot = None
+
+    def _record_mcp_config_change(self, server_name: str, result: subprocess.CompletedProcess,
+                                  command: Optional[List[str]] = None) -> None:
+        """
+        Keep the server snapshot in sync after `claude mcp add/remove`
+
+        A successful add or remove is applied to the cached snapshot so later
+        lookups don't need another `claude mcp list`; any failure invalidates
+        the snapshot since the CLI state is then unknown.
+
+        Args:
+            server_name: Server that was added or removed
+            result: Result of the `claude mcp add/remove` call
+            command: Registered run command for an add, None for a remove
+        """
+        if result.returncode != 0 or self._server_snapshot is None:
+            self._invalidate_mcp_server_snapshot()
+        elif command is None:
+            self._server_snapshot.pop(server_name.lower(), None)
+        else:
+            self._server_snapshot[server_name.lower()] = {
+                "command": " ".join(str(part) for part in command),
+                "status": "added"
+            }
+
+    def _register_mcp_server(self, server_name: str, command: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """
+        Register a server with `claude mcp add -s user`
 
-            # Parse output to check if server is installed
-            output = result.stdout.lower()
-            return server_name.lower() in output
+        Registrations are serialized because the Claude CLI rewrites its
+        config file on every add; concurrent adds could drop each other.
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-            self.logger.warning(f"Error checking MCP server status: {e}")
+        Args:
+            server_name: Server name to register
+            command: Command Claude should run to start the server
+            timeout: Timeout in seconds for the CLI call
+
+        Returns:
+            CompletedProcess result
+        """
+        with self._mcp_config_lock:
+            result = self._run_command_cross_platform(
+                ["claude", "mcp", "add", "-s", "user", "--", server_name] + command,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            self._record_mcp_config_change(server_name, result, command)
+            return result
+
+    def _get_run_command(self, server_info: Dict[str, Any]) -> List[str]:
+        """
+        Build the command Claude runs to start a uv/GitHub-based server
+
+        Args:
+            server_info: Server definition with a ``run_command``
+
+        Returns:
+            Run command as an argument list
+        """
+        command = shlex.split(server_info["run_command"])
+        if server_info["name"] == "serena":
+            # Serena needs project-specific registration, use current working directory
+            command += ["--project", os.getcwd()]
+        return command
+
+    def _get_server_timeout(self, config: Dict[str, Any], default: float) -> float:
+        """
+        Get the timeout of one install step of the current server
+
+        With config["mcp_server_timeout"] set, all steps of a server share a
+        deadline that many seconds after its install started, so a server
+        with several steps can't run past the limit.
+
+        Args:
+            config: Installation configuration
+            default: Usual timeout of the step in seconds
+
+        Returns:
+            Step timeout in seconds
+
+        Raises:
+            subprocess.TimeoutExpired: If the server's deadline has passed
+        """
+        limit = config.get("mcp_server_timeout")
+        if not limit:
+            return default
+
+        deadline = getattr(self._server_state, "deadline", None)
+        if deadline is None:
+            return min(default, int(limit))
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired("MCP server install", int(limit))
+        return min(default, remaining)
+
+    def _display(self, display: Callable[[str], None], message: str) -> None:
+        """Show a user-facing message, or collect it while installing on a worker thread"""
+        messages = getattr(self._server_state, "messages", None)
+        if messages is None:
+            display(message)
+        else:
+            messages.append((display, message))
+
+    def _check_mcp_server_installed(self, server_name: str) -> bool:
+        """Check if MCP server is already installed"""
+        snapshot = self._get_mcp_server_snapshot()
+        if snapshot is None:
             return False
 
+        server_name = server_name.lower()
+        return any(
+            name == server_name or self._normalize_server_name(name) == server_name
+            for name in snapshot
+        )
+
     def _detect_existing_mcp_servers_from_config(self) -> List[str]:
         """Detect existing MCP servers from Claude Desktop config"""
         detected_servers = []
@@ -465,34 +636,17 @@ class MCPComponent(Component):
         """Detect existing MCP servers from Claude CLI"""
         detected_servers = []
 
-        try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.returncode != 0:
-                self.logger.debug(f"Could not list MCP servers: {result.stderr}")
-                return detected_servers
+        snapshot = self._get_mcp_server_snapshot()
+        if snapshot is None:
+            return detected_servers
 
-            # Parse the output to extract server names
-            output_lines = result.stdout.strip().split('\n')
-            for line in output_lines:
-                line = line.strip().lower()
-                if line and not line.startswith('#') and not line.startswith('no'):
-                    # Extract server name (usually the first word or before first space/colon)
-                    server_name = line.split()[0] if line.split() else ""
-                    normalized_name = self._normalize_server_name(server_name)
-                    if normalized_name and normalized_name in self.mcp_servers:
-                        detected_servers.append(normalized_name)
+        for server_name in snapshot:
+            normalized_name = self._normalize_server_name(server_name)
+            if normalized_name and normalized_name in self.mcp_servers and normalized_name not in detected_servers:
+                detected_servers.append(normalized_name)
 
-            if detected_servers:
-                self.logger.info(f"Detected existing MCP servers from CLI: {detected_servers}")
-
-        except Exception as e:
-            self.logger.warning(f"Could not detect existing MCP servers from CLI: {e}")
+        if detected_servers:
+            self.logger.info(f"Detected existing MCP servers from CLI: {detected_servers}")
 
         return detected_servers
 
@@ -541,8 +695,71 @@ class MCPComponent(Component):
 
         return valid_servers
     
+    def _get_artifact_cache(self, config: Dict[str, Any]) -> MCPArtifactCache:
+        """Get the prefetched artifact cache (config["mcp_cache_dir"] overrides its location)"""
+        if self._artifact_cache is None:
+            cache_dir = config.get("mcp_cache_dir")
+            self._artifact_cache = MCPArtifactCache(Path(cache_dir) if cache_dir else None,
+                                                    install_dir=self.install_dir)
+        return self._artifact_cache
+
+    def _install_from_artifact_cache(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> Optional[bool]:
+        """
+        Register a server from the prefetched artifact cache, without network access
+
+        Args:
+            server_info: Server definition
+            config: Installation configuration; with ``mcp_offline`` set,
+                servers missing from the cache fail instead of being
+                downloaded
+
+        Returns:
+            Install success, or None if the server is not cached and may be
+            installed from the network
+        """
+        server_name = server_info["name"]
+        cache = self._get_artifact_cache(config)
+        with self._mcp_config_lock:  # The cache loads its lockfile lazily
+            command = cache.offline_command(server_name)
+
+        if command is None:
+            if config.get("mcp_offline"):
+                self.logger.error(f"MCP server {server_name} is not in the artifact cache {cache.cache_dir} "
+                                  f"(run 'SuperClaude mcp prefetch')")
+                return False
+            return None
+
+        if self._check_mcp_server_installed(server_name):
+            self.logger.info(f"MCP server {server_name} already installed")
+            return True
+
+        if "api_key_env" in server_info and not os.getenv(server_info["api_key_env"]):
+            self.logger.warning(f"Proceeding without {server_info['api_key_env']} - {server_name} may not function properly")
+
+        if server_name == "serena":
+            # Serena needs project-specific registration, use current working directory
+            command = command + ["--project", os.getcwd()]
+
+        if config.get("dry_run"):
+            self.logger.info(f"Would register cached MCP server (user scope): {server_name} {' '.join(command)}")
+            return True
+
+        self.logger.info(f"Registering {server_name} from the artifact cache")
+        result = self._register_mcp_server(server_name, command, self._get_server_timeout(config, 120))
+        if result.returncode == 0:
+            self.logger.success(f"Successfully installed MCP server from cache (user scope): {server_name}")
+            return True
+
+        error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+        self.logger.error(f"Failed to register cached MCP server {server_name}: {error_msg}")
+        return False
+
     def _install_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> bool:
         """Install a single MCP server"""
+        cached = self._install_from_artifact_cache(server_info, config)
+        if cached is not None:
+            return cached
+
         if server_info.get("install_method") == "uv":
             return self._install_uv_mcp_server(server_info, config)
         elif server_info.get("install_method") == "github":
@@ -572,14 +789,13 @@ class MCPComponent(Component):
                 api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
                 
                 if not config.get("dry_run", False):
-                    display_info(f"MCP server '{server_name}' requires an API key")
-                    display_info(f"Environment variable: {api_key_env}")
-                    display_info(f"Description: {api_key_desc}")
+                    self._display(display_info, f"MCP server '{server_name}' requires an API key")
+                    self._display(display_info, f"Environment variable: {api_key_env}")
+                    self._display(display_info, f"Description: {api_key_desc}")
                     
                     # Check if API key is already set
-                    import os
                     if not os.getenv(api_key_env):
-                        display_warning(f"API key {api_key_env} not found in environment")
+                        self._display(display_warning, f"API key {api_key_env} not found in environment")
                         self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
             
             # Install using Claude CLI
@@ -592,11 +808,8 @@ class MCPComponent(Component):
                 
                 self.logger.debug(f"Running: claude mcp add -s user {server_name} {' '.join(install_args)}")
                 
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "add", "-s", "user", "--", server_name] + install_args,
-                    capture_output=True,
-                    text=True,
-                    timeout=120  # 2 minutes timeout for installation
+                result = self._register_mcp_server(
+                    server_name, install_args, self._get_server_timeout(config, 120)  # 2 minutes timeout for installation
                 )
             else:
                 # Use npm_package
@@ -606,11 +819,8 @@ class MCPComponent(Component):
                 
                 self.logger.debug(f"Running: claude mcp add -s user {server_name} {command} -y {npm_package}")
                 
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "add", "-s", "user", "--", server_name, command, "-y", npm_package],
-                    capture_output=True,
-                    text=True,
-                    timeout=120  # 2 minutes timeout for installation
+                result = self._register_mcp_server(
+                    server_name, [command, "-y", npm_package], self._get_server_timeout(config, 120)  # 2 minutes timeout for installation
                 )
             
             if result.returncode == 0:
@@ -640,12 +850,14 @@ class MCPComponent(Component):
             
             self.logger.debug(f"Running: claude mcp remove {server_name} (auto-detect scope)")
             
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "remove", server_name],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            with self._mcp_config_lock:
+                result = self._run_command_cross_platform(
+                    ["claude", "mcp", "remove", server_name],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+                self._record_mcp_config_change(server_name, result)
             
             if result.returncode == 0:
                 self.logger.success(f"Successfully uninstalled MCP server: {server_name}")
@@ -695,34 +907,38 @@ class MCPComponent(Component):
 
         self.logger.info(f"Managing MCP servers: {', '.join(all_servers)}")
 
-        # Install/verify each server
+        # Servers already registered are verified from the snapshot; the
+        # rest are provisioned concurrently (npm/uvx work runs in parallel,
+        # registration with the Claude CLI is serialized)
         installed_count = 0
         failed_servers = []
         verified_servers = []
+        to_install = []
 
         for server_name in all_servers:
-            if server_name in self.mcp_servers:
-                server_info = self.mcp_servers[server_name]
-
-                # Check if already installed and working
-                if self._check_mcp_server_installed(server_name):
-                    self.logger.info(f"MCP server {server_name} already installed and working")
-                    installed_count += 1
-                    verified_servers.append(server_name)
-                else:
-                    # Try to install
-                    if self._install_mcp_server(server_info, config):
-                        installed_count += 1
-                        verified_servers.append(server_name)
-                    else:
-                        failed_servers.append(server_name)
+            if server_name not in self.mcp_servers:
+                self.logger.warning(f"Unknown MCP server '{server_name}' cannot be managed by SuperClaude")
+            elif self._check_mcp_server_installed(server_name):
+                self.logger.info(f"MCP server {server_name} already installed and working")
+                installed_count += 1
+                verified_servers.append(server_name)
+            else:
+                to_install.append(server_name)
+
+        results = self._provision_servers(to_install, config)
 
-                        # Check if this is a required server
-                        if server_info.get("required", False):
-                            self.logger.error(f"Required MCP server {server_name} failed to install")
-                            return False
+        for server_name in to_install:
+            if results[server_name]:
+                installed_count += 1
+                verified_servers.append(server_name)
             else:
-                self.logger.warning(f"Unknown MCP server '{server_name}' cannot be managed by SuperClaude")
+                failed_servers.append(server_name)
+
+        required_failed = [s for s in failed_servers if self.mcp_servers[s].get("required", False)]
+        if required_failed:
+            for server_name in required_failed:
+                self.logger.error(f"Required MCP server {server_name} failed to install")
+            return False
 
         # Update the list of successfully managed servers
         self.installed_servers_in_session = verified_servers
@@ -730,24 +946,15 @@ class MCPComponent(Component):
         # Verify installation
         if not config.get("dry_run", False):
             self.logger.info("Verifying MCP server installation...")
-            try:
-                result = self._run_command_cross_platform(
-                    ["claude", "mcp", "list"],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-
-                if result.returncode == 0:
-                    self.logger.debug("MCP servers list:")
-                    for line in result.stdout.strip().split('\n'):
-                        if line.strip():
-                            self.logger.debug(f"  {line.strip()}")
-                else:
-                    self.logger.warning("Could not verify MCP server installation")
-
-            except Exception as e:
-                self.logger.warning(f"Could not verify MCP installation: {e}")
+            # Re-query only if servers were added this session, to confirm them
+            pending = any(state["status"] == "added" for state in (self._server_snapshot or {}).values())
+            snapshot = self._get_mcp_server_snapshot(refresh=pending)
+            if snapshot is not None:
+                self.logger.debug("MCP servers list:")
+                for name, state in snapshot.items():
+                    self.logger.debug(f"  {name}: {state['command']} {state['status']}".rstrip())
+            else:
+                self.logger.warning("Could not verify MCP server installation")
 
         if failed_servers:
             self.logger.warning(f"Some MCP servers failed to install: {failed_servers}")
@@ -757,6 +964,68 @@ class MCPComponent(Component):
 
         return self._post_install()
 
+    def _provision_servers(self, server_names: List[str], config: Dict[str, Any]) -> Dict[str, bool]:
+        """
+        Install MCP servers on a bounded worker pool
+
+        Args:
+            server_names: Servers to install
+            config: Installation configuration; ``mcp_max_workers`` sets the
+                pool size (default 4, 1 installs serially)
+
+        Returns:
+            Dict mapping server name to install success
+        """
+        if not server_names:
+            return {}
+
+        max_workers = max(1, min(int(config.get("mcp_max_workers") or 4), len(server_names)))
+        if max_workers == 1:
+            return {name: self._install_server_safely(name, config) for name in server_names}
+
+        self.logger.info(f"Installing {len(server_names)} MCP servers with {max_workers} workers...")
+        messages = {name: [] for name in server_names}
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sc-mcp") as executor:
+            futures = {
+                executor.submit(self._install_server_safely, name, config, messages[name]): name
+                for name in server_names
+            }
+            # Show each server's messages together, from this thread, as it finishes
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name] = future.result()
+                for display, message in messages[name]:
+                    display(message)
+        return {name: results[name] for name in server_names}
+
+    def _install_server_safely(self, server_name: str, config: Dict[str, Any],
+                               messages: Optional[List[Tuple[Callable[[str], None], str]]] = None) -> bool:
+        """
+        Install one server, turning unexpected errors into a failure result
+
+        Args:
+            server_name: Server to install
+            config: Installation configuration; ``mcp_server_timeout`` bounds
+                the whole install of the server
+            messages: If given, user-facing messages are collected here
+                instead of being printed
+
+        Returns:
+            True if the server was installed
+        """
+        limit = config.get("mcp_server_timeout")
+        self._server_state.deadline = time.monotonic() + int(limit) if limit else None
+        self._server_state.messages = messages
+        try:
+            return self._install_mcp_server(self.mcp_servers[server_name], config)
+        except Exception as e:
+            self.logger.error(f"Error installing MCP server {server_name}: {e}")
+            return False
+        finally:
+            self._server_state.deadline = None
+            self._server_state.messages = None
+
     def _post_install(self) -> bool:
         """Post-installation tasks"""
         # Update metadata
@@ -889,28 +1158,16 @@ class MCPComponent(Component):
             errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
         
         # Check if Claude CLI is available and validate installed servers
-        try:
-            result = self._run_command_cross_platform(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.returncode != 0:
-                errors.append("Could not communicate with Claude CLI for MCP server verification")
-            else:
-                claude_mcp_output = result.stdout.lower()
-
-                # Get the list of servers that should be installed from metadata
-                installed_servers = self.settings_manager.get_metadata_setting("mcp.servers", [])
-
-                for server_name in installed_servers:
-                    if server_name.lower() not in claude_mcp_output:
-                        errors.append(f"Installed MCP server '{server_name}' not found in 'claude mcp list' output.")
+        snapshot = self._get_mcp_server_snapshot(refresh=True)
+        if snapshot is None:
+            errors.append("Could not communicate with Claude CLI for MCP server verification")
+        else:
+            # Get the list of servers that should be installed from metadata
+            installed_servers = self.settings_manager.get_metadata_setting("mcp.servers", [])
 
-        except Exception as e:
-            errors.append(f"Could not verify MCP server installation: {e}")
+            for server_name in installed_servers:
+                if not self._check_mcp_server_installed(server_name):
+                    errors.append(f"Installed MCP server '{server_name}' not found in 'claude mcp list' output.")
         
         return len(errors) == 0, errors
     
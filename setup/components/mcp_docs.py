@@ -13,6 +13,8 @@ from ..services.claude_md import CLAUDEMdService
 class MCPDocsComponent(Component):
     """MCP documentation component - installs docs for selected MCP servers"""
     
+    SUPPORTS_COMPACT_DOCS = True
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP docs component"""
         # Initialize attributes before calling parent constructor
@@ -53,6 +55,7 @@ class MCPDocsComponent(Component):
     def set_selected_servers(self, selected_servers: List[str]) -> None:
         """Set which MCP servers were selected for documentation installation"""
         self.selected_servers = selected_servers
+        self._install_plan = None  # Files to install depend on the selection
         self.logger.debug(f"MCP docs will be installed for: {selected_servers}")
     
     def get_files_to_install(self) -> List[Tuple[Path, Path]]:
@@ -204,27 +207,19 @@ class MCPDocsComponent(Component):
             return False
 
         # Get files to install
-        files_to_install = self.get_files_to_install()
+        files_to_install = self.get_install_plan().pairs
 
         if not files_to_install:
             self.logger.warning("No MCP documentation files found to install")
             return False
 
-        # Copy documentation files
-        success_count = 0
-        successfully_copied_files = []
-
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                successfully_copied_files.append(source.name)
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        # Copy added/changed documentation files
+        success, report = self._sync_files(files_to_install, config)
+        success_count = len(files_to_install) - len(report["failed"])
+        successfully_copied_files = [source.name for source, target in files_to_install
+                                     if self._get_manifest_key(target) not in report["failed"]]
 
-        if success_count != len(files_to_install):
+        if not success:
             self.logger.error(f"Only {success_count}/{len(files_to_install)} documentation files copied successfully")
             return False
 
@@ -326,16 +321,7 @@ class MCPDocsComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        source_dir = self._get_source_dir()
-        total_size = 0
-        
-        if source_dir and source_dir.exists() and self.selected_servers:
-            for server_name in self.selected_servers:
-                if server_name in self.server_docs_map:
-                    doc_file = self.server_docs_map[server_name]
-                    file_path = source_dir / doc_file
-                    if file_path.exists():
-                        total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Minimum size estimate
         total_size = max(total_size, 10240)  # At least 10KB
@@ -13,6 +13,8 @@ from ..services.claude_md import CLAUDEMdService
 class ModesComponent(Component):
     """SuperClaude behavioral modes component"""
     
+    SUPPORTS_COMPACT_DOCS = True
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize modes component"""
         super().__init__(install_dir, Path(""))
@@ -38,24 +40,17 @@ class ModesComponent(Component):
             return False
 
         # Get files to install
-        files_to_install = self.get_files_to_install()
+        files_to_install = self.get_install_plan().pairs
 
         if not files_to_install:
             self.logger.warning("No mode files found to install")
             return False
 
-        # Copy mode files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        # Copy added/changed mode files
+        success, report = self._sync_files(files_to_install, config)
+        success_count = len(files_to_install) - len(report["failed"])
 
-        if success_count != len(files_to_install):
+        if not success:
             self.logger.error(f"Only {success_count}/{len(files_to_install)} mode files copied successfully")
             return False
 
@@ -149,14 +144,7 @@ class ModesComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        source_dir = self._get_source_dir()
-        total_size = 0
-        
-        if source_dir and source_dir.exists():
-            for filename in self.component_files:
-                file_path = source_dir / filename
-                if file_path.exists():
-                    total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Minimum size estimate
         total_size = max(total_size, 20480)  # At least 20KB
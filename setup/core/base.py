@@ -2,19 +2,25 @@
 Abstract base class for installable components
 """
 
+import os
 from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple, Optional, Any
 from pathlib import Path
-import json
+from .install_plan import InstallPlan
+from ..utils.compact_docs import COMPACT_DIR_NAME, build_compact_docs, compact_docs_current
 from ..services.files import FileService
 from ..services.settings import SettingsService
 from ..utils.logger import get_logger
+from ..utils.paths import get_cache_directory
 from ..utils.security import SecurityValidator
 
 
 class Component(ABC):
     """Base class for all installable components"""
     
+    # Whether the component's docs have a compact variant (see utils.compact_docs)
+    SUPPORTS_COMPACT_DOCS = False
+    
     def __init__(self, install_dir: Optional[Path] = None, component_subdir: Path = Path('')):
         """
         Initialize component with installation directory
@@ -31,6 +37,11 @@ class Component(ABC):
         self.component_files = self._discover_component_files()
         self.file_manager = FileService()
         self.install_component_subdir = self.install_dir / component_subdir
+        self.file_changes: Dict[str, List[str]] = {}
+        self._install_plan: Optional[InstallPlan] = None
+        self._install_plan_key: Optional[Tuple[str, ...]] = None
+        self.doc_variant = "full"
+        self.compact_sections: Dict[str, List[str]] = {}
     
     @abstractmethod
     def get_metadata(self) -> Dict[str, str]:
@@ -68,12 +79,12 @@ class Component(ABC):
             errors.append(f"Source directory not found: {source_dir}")
             return False, errors
 
-        # Check if all required framework files exist
-        missing_files = []
-        for filename in self.component_files:
-            source_file = source_dir / filename
-            if not source_file.exists():
-                missing_files.append(filename)
+        plan = self.get_install_plan()
+
+        # Check if all required framework files exist (sources may be compact variants)
+        planned_names = {planned.source.name for planned in plan.files}
+        missing_files = [filename for filename in self.component_files
+                         if filename not in planned_names]
 
         if missing_files:
             errors.append(f"Missing component files: {missing_files}")
@@ -90,12 +101,9 @@ class Component(ABC):
         if not is_safe:
             errors.extend(validation_errors)
 
-        # Get files to install
-        files_to_install = self.get_files_to_install()
-
         # Validate all files for security
         is_safe, security_errors = SecurityValidator.validate_component_files(
-            files_to_install, source_dir, self.install_component_subdir
+            plan.pairs, source_dir, self.install_component_subdir
         )
         if not is_safe:
             errors.extend(security_errors)
@@ -122,6 +130,63 @@ class Component(ABC):
                 files.append((source, target))
 
         return files
+
+    def get_install_plan(self) -> InstallPlan:
+        """
+        Get the component's installation plan, resolving it on first use
+
+        The plan is shared by prerequisite validation, size estimates,
+        installation and verification, so sources are scanned, stat'ed and
+        hashed once per run. It is rebuilt if component_files changes.
+
+        Returns:
+            InstallPlan for get_files_to_install()
+        """
+        key = (self.doc_variant,) + tuple(self.component_files)
+        if self._install_plan is None or self._install_plan_key != key:
+            files = self.get_files_to_install()
+            if self.doc_variant == "compact":
+                files = self._get_compact_files(files)
+            self._install_plan = InstallPlan.build(files, self.file_manager.get_file_hash)
+            self._install_plan_key = key
+        return self._install_plan
+
+    def set_doc_variant(self, variant: str, sections: Optional[Dict[str, List[str]]] = None) -> None:
+        """
+        Choose between the full docs and their compact variant
+
+        Args:
+            variant: "full" or "compact" (ignored unless SUPPORTS_COMPACT_DOCS)
+            sections: Optional section allowlists by filename for compact docs
+        """
+        self.doc_variant = variant if self.SUPPORTS_COMPACT_DOCS else "full"
+        self.compact_sections = sections or {}
+
+    def _get_compact_files(self, files: List[Tuple[Path, Path]]) -> List[Tuple[Path, Path]]:
+        """
+        Swap Markdown sources for their compact variants
+
+        Uses the variants shipped next to the docs when they are current;
+        otherwise builds them into the installation's cache directory, never
+        into the (possibly read-only) package tree. Falls back to the full
+        docs if the compact variants can't be built.
+        """
+        source_dir = self._get_source_dir()
+        docs = [source.name for source, _ in files if source.suffix == ".md" and source.parent == source_dir]
+        if not source_dir or not docs:
+            return files
+
+        compact_dir = source_dir / COMPACT_DIR_NAME
+        try:
+            if not compact_docs_current(source_dir, docs, self.compact_sections, compact_dir):
+                compact_dir = build_compact_docs(
+                    source_dir, docs, self.compact_sections,
+                    get_cache_directory(self.install_dir) / COMPACT_DIR_NAME / source_dir.name)
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(f"Could not build compact docs for {repr(self)}, installing full docs: {e}")
+            return files
+
+        return [(compact_dir / source.name if source.name in docs else source, target) for source, target in files]
     
     def get_settings_modifications(self) -> Dict[str, Any]:
         """
@@ -135,6 +200,7 @@ class Component(ABC):
         return {}
     
     def install(self, config: Dict[str, Any]) -> bool:
+        self.set_doc_variant(config.get("doc_variant", "full"), config.get("compact_sections"))
         try:
             return self._install(config)
         except Exception as e:
@@ -160,20 +226,13 @@ class Component(ABC):
             return False
 
         # Get files to install
-        files_to_install = self.get_files_to_install()
+        files_to_install = self.get_install_plan().pairs
 
-        # Copy framework files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
+        # Copy added/changed framework files
+        success, report = self._sync_files(files_to_install, config)
+        success_count = len(files_to_install) - len(report["failed"])
 
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
-
-        if success_count != len(files_to_install):
+        if not success:
             self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
             return False
 
@@ -181,6 +240,189 @@ class Component(ABC):
 
         return self._post_install()
 
+
+    def plan_file_sync(self, files_to_install: List[Tuple[Path, Path]], force: bool = False,
+                       link_mode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Compare files to install against the component's installed file manifest
+
+        Files whose installed copy still matches its manifest entry (size and
+        mtime) are only re-hashed on the source side; files without an entry
+        or modified locally are compared by content.
+
+        Args:
+            files_to_install: List of (source, target) tuples
+            force: Treat every existing file as changed
+            link_mode: Deployment mode (see FileService.deploy_file); files
+                       installed with another mode are redeployed. None keeps
+                       each file's recorded mode.
+
+        Returns:
+            Dict with "added", "changed" and "unchanged" lists of (source, target)
+            tuples, "removed" list of (target, manifest entry) tuples for files
+            no longer shipped, "manifest" entries for unchanged files, "hashes"
+            of the source files that were hashed and the "link_modes" to deploy with
+        """
+        previous = self.settings_manager.get_file_manifest(self.get_metadata()['name'])
+        install_plan = self.get_install_plan()
+        plan = {"added": [], "changed": [], "unchanged": [], "removed": [], "manifest": {}, "hashes": {},
+                "link_modes": {}}
+        shipped = set()
+
+        for source, target in files_to_install:
+            key = self._get_manifest_key(target)
+            shipped.add(key)
+            entry = previous.get(key)
+            recorded_mode = entry.get("link_mode", "copy") if entry else "copy"
+            plan["link_modes"][key] = link_mode or recorded_mode
+
+            if not target.exists():
+                plan["added"].append((source, target))
+                continue
+
+            if force or (entry and plan["link_modes"][key] != recorded_mode):
+                plan["changed"].append((source, target))
+                continue
+
+            planned = install_plan.get(source)
+            source_size = planned.size if planned else source.stat().st_size
+            if entry and self._matches_manifest_entry(target, entry):
+                # Installed copy untouched: only the source can have changed
+                if source_size == entry.get("size"):
+                    source_hash = planned.sha256 if planned else self.file_manager.get_file_hash(source)
+                    plan["hashes"][key] = source_hash
+                    if source_hash == entry.get("sha256"):
+                        plan["unchanged"].append((source, target))
+                        plan["manifest"][key] = entry
+                        continue
+            elif source_size == target.stat().st_size:
+                source_hash = planned.sha256 if planned else self.file_manager.get_file_hash(source)
+                plan["hashes"][key] = source_hash
+                if source_hash == self.file_manager.get_file_hash(target):
+                    plan["unchanged"].append((source, target))
+                    plan["manifest"][key] = self._build_manifest_entry(target, source_hash)
+                    continue
+
+            plan["changed"].append((source, target))
+
+        for key, entry in previous.items():
+            if key not in shipped:
+                plan["removed"].append((self.install_dir / key, entry))
+
+        return plan
+
+    def _sync_files(self, files_to_install: List[Tuple[Path, Path]], config: Dict[str, Any]) -> Tuple[bool, Dict[str, List[str]]]:
+        """
+        Copy only added or changed files and record the new file manifest
+
+        In update mode, files that were installed by a previous version but are
+        no longer shipped are deleted, unless they were modified locally.
+
+        Args:
+            files_to_install: List of (source, target) tuples
+            config: Installation configuration
+
+        Returns:
+            Tuple of (success: bool, report: Dict mapping "added", "changed",
+            "removed", "unchanged" and "failed" to install-relative paths)
+        """
+        plan = self.plan_file_sync(files_to_install, force=config.get("force", False),
+                                   link_mode=config.get("link_mode"))
+        manifest = dict(plan["manifest"])
+        report = {
+            "added": [], "changed": [], "removed": [], "failed": [],
+            "unchanged": [self._get_manifest_key(target) for _, target in plan["unchanged"]]
+        }
+
+        to_deploy = plan["added"] + plan["changed"]
+        install_plan = self.get_install_plan()
+        status_by_target = {target: status for status in ("added", "changed") for _, target in plan[status]}
+        copy_report = self.file_manager.copy_files(
+            to_deploy,
+            link_modes={target: plan["link_modes"][self._get_manifest_key(target)] for _, target in to_deploy},
+            skip_identical=False,  # The plan already compared contents
+            source_hashes={source: install_plan.get(source).sha256 for source, _ in to_deploy
+                           if install_plan.get(source)},
+            max_workers=config.get("copy_workers", 8)
+        )
+
+        fallbacks = []
+        for target in copy_report["copied"]:
+            key = self._get_manifest_key(target)
+            link_mode = plan["link_modes"][key]
+            source_hash = plan["hashes"].get(key) or copy_report["hashes"].get(target)
+            manifest[key] = self._build_manifest_entry(target, source_hash)
+            manifest[key]["link_mode"] = link_mode
+            report[status_by_target[target]].append(key)
+            if copy_report["link_modes"].get(target, link_mode) != link_mode:
+                fallbacks.append(key)
+
+        for target, error in copy_report["failed"].items():
+            key = self._get_manifest_key(target)
+            report["failed"].append(key)
+            self.logger.error(f"Failed to copy {key}: {error}")
+
+        # One log record per batch; per-file records dominate large installs
+        for status in ("added", "changed"):
+            if report[status]:
+                self.logger.debug(f"Deployed {len(report[status])} {status} files: {', '.join(report[status])}")
+        if fallbacks:
+            self.logger.debug(f"Copied {len(fallbacks)} files whose link mode is not supported here: {', '.join(fallbacks)}")
+
+        for target, entry in plan["removed"]:
+            key = self._get_manifest_key(target)
+            if not os.path.lexists(target):
+                continue
+            if not config.get("update_mode"):
+                manifest[key] = entry  # Keep tracking it so a later update can remove it
+            elif (target.is_symlink() or self._matches_manifest_entry(target, entry) or
+                  self.file_manager.get_file_hash(target) == entry.get("sha256")):
+                if self.file_manager.remove_file(target):
+                    report["removed"].append(key)
+                    self.logger.debug(f"Removed {key} (no longer shipped)")
+            else:
+                self.logger.warning(f"Keeping locally modified file no longer shipped: {key}")
+
+        self.settings_manager.set_file_manifest(self.get_metadata()['name'], manifest)
+        self.file_changes = report
+
+        self.logger.info(
+            f"{self.get_metadata()['name']}: {len(report['added'])} added, {len(report['changed'])} changed, "
+            f"{len(report['removed'])} removed, {len(report['unchanged'])} unchanged"
+        )
+        return len(report["failed"]) == 0, report
+
+    def _get_files_to_overwrite(self) -> List[Path]:
+        """
+        Get installed files that an update would overwrite or delete
+
+        Returns:
+            List of existing target paths that are changed or no longer shipped
+        """
+        plan = self.plan_file_sync(self.get_install_plan().pairs)
+        targets = [target for _, target in plan["changed"]]
+        targets.extend(target for target, _ in plan["removed"])
+        return [target for target in targets if target.exists()]
+
+    def _get_manifest_key(self, target: Path) -> str:
+        """Get the install-relative manifest key for a target path"""
+        try:
+            return target.relative_to(self.install_dir).as_posix()
+        except ValueError:
+            return target.as_posix()
+
+    def _build_manifest_entry(self, target: Path, sha256: Optional[str]) -> Dict[str, Any]:
+        """Build a manifest entry from an installed file"""
+        stat = target.stat()
+        return {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": sha256}
+
+    def _matches_manifest_entry(self, target: Path, entry: Dict[str, Any]) -> bool:
+        """Check whether an installed file is unchanged since it was recorded"""
+        try:
+            stat = target.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry.get("size") and stat.st_mtime == entry.get("mtime")
     
     @abstractmethod
     def _post_install(self) -> bool:
@@ -235,20 +477,13 @@ class Component(ABC):
             Version string if installed, None otherwise
         """
         self.logger.debug("Checking installed version")
-        metadata_file = self.install_dir / ".superclaude-metadata.json"
-        if metadata_file.exists():
-            self.logger.debug("Metadata file exists, reading version")
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                component_name = self.get_metadata()['name']
-                version = metadata.get('components', {}).get(component_name, {}).get('version')
-                self.logger.debug(f"Found version: {version}")
-                return version
-            except Exception as e:
-                self.logger.warning(f"Failed to read version from metadata: {e}")
-        else:
-            self.logger.debug("Metadata file does not exist")
+        try:
+            component_name = self.get_metadata()['name']
+            version = self.settings_manager.get_component_version(component_name)
+            self.logger.debug(f"Found version: {version}")
+            return version
+        except Exception as e:
+            self.logger.warning(f"Failed to read version from metadata: {e}")
         return None
     
     def is_installed(self) -> bool:
@@ -270,10 +505,24 @@ class Component(ABC):
         errors = []
         
         # Check if all files exist
-        for _, target in self.get_files_to_install():
-            if not target.exists():
+        plan = self.get_install_plan()
+        for target in plan.targets:
+            if target.is_symlink() and not target.exists():
+                errors.append(f"Broken link: {target} -> {os.readlink(target)}")
+            elif not target.exists():
                 errors.append(f"Missing file: {target}")
         
+        # Hardlinks/symlinks are cut off when the source package is upgraded;
+        # a file that is neither linked nor identical to its source is stale
+        manifest = self.settings_manager.get_file_manifest(self.get_metadata()['name'])
+        for planned in plan.files:
+            entry = manifest.get(self._get_manifest_key(planned.target), {})
+            if (entry.get("link_mode") in ("hardlink", "symlink") and planned.target.exists()
+                    and not self.file_manager.is_linked(planned.target, planned.source)
+                    and self.file_manager.get_file_hash(planned.target) != planned.sha256):
+                errors.append(f"Stale {entry['link_mode']}: {planned.target} no longer matches "
+                              f"{planned.source} (re-run install)")
+        
         # Check version in metadata
         if not self.get_installed_version():
             errors.append("Component not registered in .superclaude-metadata.json")
@@ -287,14 +536,7 @@ class Component(ABC):
         Returns:
             Estimated size in bytes
         """
-        total_size = 0
-        for source, _ in self.get_files_to_install():
-            if source.exists():
-                if source.is_file():
-                    total_size += source.stat().st_size
-                elif source.is_dir():
-                    total_size += sum(f.stat().st_size for f in source.rglob('*') if f.is_file())
-        return total_size
+        return self.get_install_plan().total_size
 
     def _discover_component_files(self) -> List[str]:
         """
@@ -0,0 +1,91 @@
+"""
+Immutable per-component installation plan
+Resolves a component's files once (one stat and one hash per source) so
+validation, size estimates, installation and verification share the result
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class PlannedFile:
+    """A source file resolved for installation"""
+
+    source: Path
+    target: Path
+    size: int
+    sha256: Optional[str] = None  # None for directory sources
+
+
+@dataclass(frozen=True)
+class InstallPlan:
+    """
+    Files a component will install, resolved in a single pass
+
+    Build with InstallPlan.build(); sources that did not exist when the
+    plan was built are listed in `missing` instead of `files`.
+    """
+
+    files: Tuple[PlannedFile, ...]
+    missing: Tuple[Tuple[Path, Path], ...] = ()
+    _by_source: Dict[Path, PlannedFile] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_by_source", {planned.source: planned for planned in self.files})
+
+    @classmethod
+    def build(cls, files: List[Tuple[Path, Path]], hasher: Callable[[Path], Optional[str]]) -> "InstallPlan":
+        """
+        Resolve (source, target) pairs into a plan
+
+        Args:
+            files: List of (source, target) tuples
+            hasher: Function returning a file's sha256 (None if unreadable)
+
+        Returns:
+            InstallPlan with sizes and hashes of every existing source
+        """
+        planned = []
+        missing = []
+        for source, target in files:
+            try:
+                stat = source.stat()
+            except OSError:
+                missing.append((source, target))
+                continue
+
+            if source.is_dir():
+                size = 0
+                for root, _, names in os.walk(source):
+                    for name in names:
+                        try:
+                            size += os.stat(os.path.join(root, name)).st_size
+                        except OSError:
+                            pass
+                planned.append(PlannedFile(source, target, size))
+            else:
+                planned.append(PlannedFile(source, target, stat.st_size, hasher(source)))
+
+        return cls(tuple(planned), tuple(missing))
+
+    @property
+    def pairs(self) -> List[Tuple[Path, Path]]:
+        """(source, target) tuples of the files that exist"""
+        return [(planned.source, planned.target) for planned in self.files]
+
+    @property
+    def targets(self) -> List[Path]:
+        """Target paths of all files, including those with missing sources"""
+        return [planned.target for planned in self.files] + [target for _, target in self.missing]
+
+    @property
+    def total_size(self) -> int:
+        """Total size in bytes of all planned sources"""
+        return sum(planned.size for planned in self.files)
+
+    def get(self, source: Path) -> Optional[PlannedFile]:
+        """Get the planned entry for a source path"""
+        return self._by_source.get(source)
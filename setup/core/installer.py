@@ -4,10 +4,16 @@ Base installer logic for SuperClaude installation system fixed some issues
 
 from typing import List, Dict, Optional, Set, Tuple, Any
 from pathlib import Path
+import os
 import shutil
-import tempfile
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .base import Component
+from ..services.backups import BackupStore, iter_backup_files
+from ..services.claude_md import CLAUDEMdService
+from ..services.context_footprint import ContextBudget
 from ..utils.logger import get_logger
 
 
@@ -29,14 +35,16 @@ class Installer:
         self.dry_run = dry_run
         self.components: Dict[str, Component] = {}
         from ..services.settings import SettingsService
-        settings_manager = SettingsService(self.install_dir)
-        self.installed_components: Set[str] = set(settings_manager.get_installed_components().keys())
+        self.settings_manager = SettingsService(self.install_dir)
+        self.installed_components: Set[str] = set(self.settings_manager.get_installed_components().keys())
         self.updated_components: Set[str] = set()
 
         self.failed_components: Set[str] = set()
         self.skipped_components: Set[str] = set()
+        self.component_results: Dict[str, bool] = {}
         self.backup_path: Optional[Path] = None
         self.logger = get_logger()
+        self._state_lock = threading.Lock()
 
     def register_component(self, component: Component) -> None:
         """
@@ -100,6 +108,42 @@ class Installer:
 
         return resolved
 
+    def get_installation_levels(self, ordered_names: List[str]) -> List[List[str]]:
+        """
+        Group already-resolved components into dependency levels
+
+        Components in the same level have no dependencies on each other and
+        can be installed in parallel once all previous levels are done.
+
+        Args:
+            ordered_names: Component names as returned by resolve_dependencies
+
+        Returns:
+            List of levels, each a list of component names in resolved order
+
+        Raises:
+            ValueError: If the remaining components cannot be ordered
+        """
+        levels = []
+        remaining = list(ordered_names)
+        done: Set[str] = set()
+
+        while remaining:
+            current_level = []
+            for name in remaining:
+                deps = set(self.components[name].get_dependencies()) & set(ordered_names)
+                if deps <= done:
+                    current_level.append(name)
+
+            if not current_level:
+                raise ValueError("Circular dependency detected in installation order calculation")
+
+            levels.append(current_level)
+            done.update(current_level)
+            remaining = [name for name in remaining if name not in done]
+
+        return levels
+
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
         Validate system requirements for all registered components
@@ -120,7 +164,15 @@ class Installer:
         except Exception as e:
             errors.append(f"Could not check disk space: {e}")
 
-        # Check write permissions
+        # Check write permissions (a dry run only inspects the nearest existing directory)
+        if self.dry_run:
+            existing = self.install_dir
+            while not existing.exists() and existing != existing.parent:
+                existing = existing.parent
+            if not os.access(existing, os.W_OK):
+                errors.append(f"No write permission to {existing}")
+            return len(errors) == 0, errors
+
         test_file = self.install_dir / ".write_test"
         try:
             self.install_dir.mkdir(parents=True, exist_ok=True)
@@ -131,12 +183,20 @@ class Installer:
 
         return len(errors) == 0, errors
 
-    def create_backup(self) -> Optional[Path]:
+    def create_backup(self, dedup: bool = False, compresslevel: int = 9) -> Optional[Path]:
         """
         Create backup of existing installation
         
+        Files are streamed straight from the install directory into the
+        archive; the "backups" and "local" directories are excluded.
+        
+        Args:
+            dedup: Store the backup in the content-addressed BackupStore
+                instead of writing a full tarball
+            compresslevel: gzip level (1 = fastest, 9 = smallest)
+        
         Returns:
-            Path to backup archive or None if no existing installation
+            Path to backup archive (or store manifest) or None if no existing installation
         """
         if not self.install_dir.exists():
             return None
@@ -153,33 +213,34 @@ class Installer:
         backup_name = f"superclaude_backup_{timestamp}"
         backup_path = backup_dir / f"{backup_name}.tar.gz"
 
-        # Create temporary directory for backup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_backup = Path(temp_dir) / backup_name
+        if dedup:
+            store = BackupStore(backup_dir)
+            self.backup_path = store.create(self.install_dir, backup_name, {"source": "installer"})
+            return self.backup_path
 
-            # Ensure temp backup directory exists
-            temp_backup.mkdir(parents=True, exist_ok=True)
-
-            # Copy all files except backups and local directories
-            for item in self.install_dir.iterdir():
-                if item.name not in ["backups", "local"]:
+        # Write to a partial file so an interrupted backup never looks complete.
+        # Always create an archive, even if empty, to ensure it's a valid tarball
+        partial_path = backup_path.with_name(backup_path.name + ".partial")
+        files_added = 0
+        try:
+            # Linked files (see --link-mode) are archived by content
+            with tarfile.open(partial_path, "w:gz", compresslevel=compresslevel, dereference=True) as tar:
+                for path, rel_path in iter_backup_files(self.install_dir):
                     try:
-                        if item.is_file():
-                            shutil.copy2(item, temp_backup / item.name)
-                        elif item.is_dir():
-                            shutil.copytree(item, temp_backup / item.name)
-                    except Exception as e:
+                        tar.add(path, arcname=rel_path, recursive=False)
+                        files_added += 1
+                    except OSError as e:
                         # Log warning but continue backup process
-                        self.logger.warning(f"Could not backup {item.name}: {e}")
-
-            # Always create an archive, even if empty, to ensure it's a valid tarball
-            base_path = backup_dir / backup_name
-            shutil.make_archive(str(base_path), 'gztar', temp_backup)
+                        self.logger.warning(f"Could not backup {rel_path}: {e}")
+            os.replace(partial_path, backup_path)
+        except Exception:
+            partial_path.unlink(missing_ok=True)
+            raise
 
-            if not any(temp_backup.iterdir()):
-                self.logger.warning(
-                    f"No files to backup, created empty backup archive: {backup_path.name}"
-                )
+        if files_added == 0:
+            self.logger.warning(
+                f"No files to backup, created empty backup archive: {backup_path.name}"
+            )
 
         self.backup_path = backup_path
         return backup_path
@@ -203,7 +264,9 @@ class Installer:
 
         # Skip if already installed and not in update mode, unless component is reinstallable
         if not component.is_reinstallable() and component_name in self.installed_components and not config.get("update_mode"):
-            self.skipped_components.add(component_name)
+            with self._state_lock:
+                self.skipped_components.add(component_name)
+                self.component_results[component_name] = True
             self.logger.info(f"Skipping already installed component: {component_name}")
             return True
 
@@ -213,7 +276,7 @@ class Installer:
             self.logger.error(f"Prerequisites failed for {component_name}:")
             for error in errors:
                 self.logger.error(f"  - {error}")
-            self.failed_components.add(component_name)
+            self._record_result(component_name, False)
             return False
 
         # Perform installation
@@ -224,24 +287,37 @@ class Installer:
             else:
                 success = component.install(config)
 
-            if success:
-                self.installed_components.add(component_name)
-                self.updated_components.add(component_name)
-            else:
-                self.failed_components.add(component_name)
-
+            self._record_result(component_name, success)
             return success
 
         except Exception as e:
             self.logger.error(f"Error installing {component_name}: {e}")
-            self.failed_components.add(component_name)
+            self._record_result(component_name, False)
             return False
 
+    def _record_result(self, component_name: str, success: bool) -> None:
+        """Record the outcome of a component installation (thread-safe)"""
+        with self._state_lock:
+            self.component_results[component_name] = success
+            if success:
+                self.installed_components.add(component_name)
+                self.updated_components.add(component_name)
+            else:
+                self.failed_components.add(component_name)
+
     def install_components(self,
                            component_names: List[str],
                            config: Optional[Dict[str, Any]] = None) -> bool:
         """
         Install multiple components in dependency order
+
+        When ``config["parallel"]`` is set, components are installed level by
+        level on a bounded thread pool of
+        ``config["max_workers"]`` threads. Levels are taken from
+        ``config["install_levels"]`` (ComponentRegistry.get_installation_order)
+        or computed with get_installation_levels. ``config["fail_fast"]`` stops
+        scheduling further components once one has failed; otherwise the
+        remaining components are still attempted.
         
         Args:
             component_names: List of component names to install
@@ -271,24 +347,142 @@ class Installer:
         if self.install_dir.exists() and not self.dry_run:
             self.logger.info("Creating backup of existing installation...")
             try:
-                self.create_backup()
+                self.create_backup(
+                    dedup=config.get("dedup_backup", False),
+                    compresslevel=config.get("backup_compresslevel") or 9
+                )
             except Exception as e:
                 self.logger.error(f"Failed to create backup: {e}")
                 return False
 
+        # Components' metadata, settings and CLAUDE.md updates are buffered
+        # and each file is written once
+        budget = None
+        if config.get("context_budget"):
+            budget = ContextBudget(config["context_budget"], config.get("context_priorities", {}))
+
+        if self.dry_run:
+            # Nothing is written, so the install lock and deferred writes are skipped
+            return self._install_ordered(ordered_names, config)
+
+        all_success = False
+        try:
+            with CLAUDEMdService(self.install_dir).session(budget):
+                try:
+                    with self.settings_manager.transaction():
+                        all_success = self._install_ordered(ordered_names, config)
+                except (OSError, ValueError) as e:
+                    # The settings/metadata write failed; CLAUDE.md is still written
+                    self.logger.error(f"Failed to save installation settings: {e}")
+                    all_success = False
+        except (OSError, UnicodeDecodeError) as e:
+            # Imports were only added in memory; the deferred write failed
+            self.logger.error(f"Failed to update CLAUDE.md: {e}")
+            all_success = False
+
+        self._run_post_install_validation()
+
+        return all_success
+
+    def _install_ordered(self, ordered_names: List[str], config: Dict[str, Any]) -> bool:
+        """Install components in dependency order, in parallel levels if configured"""
+        if config.get("parallel"):
+            return self._install_levels_parallel(ordered_names, config)
+
         # Install each component
         all_success = True
         for name in ordered_names:
             self.logger.info(f"Installing {name}...")
             if not self.install_component(name, config):
                 all_success = False
+                if config.get("fail_fast"):
+                    self._skip_remaining(ordered_names)
+                    break
                 # Continue installing other components even if one fails
+        return all_success
 
-        if not self.dry_run:
-            self._run_post_install_validation()
+    def _install_levels_parallel(self, ordered_names: List[str], config: Dict[str, Any]) -> bool:
+        """
+        Install components level by level, running each level concurrently
+
+        Args:
+            ordered_names: Resolved component names
+            config: Installation configuration
+
+        Returns:
+            True if all successful, False if any failed
+        """
+        if config.get("install_levels"):
+            # Levels from ComponentRegistry.get_installation_order; keep the
+            # resolved order inside each level for deterministic scheduling
+            position = {name: i for i, name in enumerate(ordered_names)}
+            levels = [
+                sorted((name for name in level if name in position), key=position.get)
+                for level in config["install_levels"]
+            ]
+            levels = [level for level in levels if level]
+            scheduled = {name for level in levels for name in level}
+            if scheduled != set(ordered_names):
+                self.logger.warning("Installation levels do not match resolved components, recomputing")
+                levels = None
+        else:
+            levels = None
+
+        if levels is None:
+            try:
+                levels = self.get_installation_levels(ordered_names)
+            except ValueError as e:
+                self.logger.error(f"Dependency resolution error: {e}")
+                return False
+
+        max_workers = max(1, int(config.get("max_workers") or 4))
+        fail_fast = config.get("fail_fast", False)
+        all_success = True
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sc-install") as executor:
+            for level_num, level in enumerate(levels, 1):
+                runnable = [
+                    name for name in level
+                    if not (set(self.components[name].get_dependencies()) & self.failed_components)
+                ]
+                for name in level:
+                    if name not in runnable:
+                        self.logger.error(f"Skipping {name}: a dependency failed to install")
+                        self._record_result(name, False)
+                        all_success = False
+
+                self.logger.info(f"Installing level {level_num}/{len(levels)}: {', '.join(runnable)}")
+                futures = {
+                    name: executor.submit(self.install_component, name, config)
+                    for name in runnable
+                }
+
+                # Collect in resolved order so results and logs are deterministic
+                for name, future in futures.items():
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error installing {name}: {e}")
+                        self._record_result(name, False)
+                        success = False
+                    if not success:
+                        all_success = False
+
+                if not all_success and fail_fast:
+                    remaining = [name for later in levels[level_num:] for name in later]
+                    self._skip_remaining(remaining)
+                    break
 
         return all_success
 
+    def _skip_remaining(self, names: List[str]) -> None:
+        """Mark components that were never attempted because of fail-fast"""
+        for name in names:
+            if name not in self.component_results:
+                self.logger.warning(f"Not installing {name} (fail-fast after earlier failure)")
+                with self._state_lock:
+                    self.skipped_components.add(name)
+
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
         self.logger.info("Running post-installation validation...")
@@ -332,6 +526,7 @@ class Installer:
             'installed': list(self.installed_components),
             'failed': list(self.failed_components),
             'skipped': list(self.skipped_components),
+            'results': dict(self.component_results),
             'backup_path': str(self.backup_path) if self.backup_path else None,
             'install_dir': str(self.install_dir),
             'dry_run': self.dry_run
@@ -4,25 +4,37 @@ Component registry for auto-discovery and dependency resolution
 
 import importlib
 import inspect
-from typing import Dict, List, Set, Optional, Type
+import json
+import os
+from typing import Any, Dict, List, Set, Optional, Tuple, Type
 from pathlib import Path
 from .base import Component
 from ..utils.logger import get_logger
+from .. import __version__
 
 
 class ComponentRegistry:
     """Auto-discovery and management of installable components"""
     
-    def __init__(self, components_dir: Path):
+    DISCOVERY_CACHE_VERSION = 1
+    
+    def __init__(self, components_dir: Path, cache_file: Optional[Path] = None, use_cache: bool = True):
         """
         Initialize component registry
         
         Args:
             components_dir: Directory containing component modules
+            cache_file: Discovery cache (defaults to __pycache__/component-discovery.json
+                        in components_dir)
+            use_cache: Set False to always import and instantiate components to discover them
         """
         self.components_dir = components_dir
+        self.cache_file = cache_file or components_dir / "__pycache__" / "component-discovery.json"
+        self.use_cache = use_cache
+        self.component_specs: Dict[str, Dict[str, Any]] = {}
         self.component_classes: Dict[str, Type[Component]] = {}
         self.component_instances: Dict[str, Component] = {}
+        self._install_dir_instances: Dict[Tuple[str, Path], Component] = {}
         self.dependency_graph: Dict[str, Set[str]] = {}
         self._discovered = False
         self.logger = get_logger()
@@ -31,19 +43,43 @@ class ComponentRegistry:
         """
         Auto-discover all component classes in components directory
         
+        Discovery results (name, class path, metadata, dependencies) are
+        cached keyed on the component modules' size and mtime, so component
+        modules are only imported when a component is actually used.
+        
         Args:
             force_reload: Force rediscovery even if already done
         """
         if self._discovered and not force_reload:
             return
         
+        self.component_specs.clear()
         self.component_classes.clear()
         self.component_instances.clear()
+        self._install_dir_instances.clear()
         self.dependency_graph.clear()
         
         if not self.components_dir.exists():
             return
         
+        fingerprint = self._get_modules_fingerprint()
+        specs = None
+        if self.use_cache and not force_reload:
+            specs = self._load_discovery_cache(fingerprint)
+        
+        if specs is None:
+            self._scan_components()
+            if self.use_cache:
+                self._save_discovery_cache(fingerprint)
+        else:
+            self.component_specs.update(specs)
+        
+        # Build dependency graph
+        self._build_dependency_graph()
+        self._discovered = True
+    
+    def _scan_components(self) -> None:
+        """Import every component module and record its components"""
         # Add components directory to Python path temporarily
         import sys
         original_path = sys.path.copy()
@@ -55,7 +91,7 @@ class ComponentRegistry:
                 sys.path.insert(0, str(setup_dir))
             
             # Discover all Python files in components directory
-            for py_file in self.components_dir.glob("*.py"):
+            for py_file in sorted(self.components_dir.glob("*.py")):
                 if py_file.name.startswith("__"):
                     continue
                 
@@ -65,10 +101,6 @@ class ComponentRegistry:
         finally:
             # Restore original Python path
             sys.path = original_path
-        
-        # Build dependency graph
-        self._build_dependency_graph()
-        self._discovered = True
     
     def _load_component_module(self, module_name: str) -> None:
         """
@@ -94,6 +126,12 @@ class ComponentRegistry:
                         metadata = instance.get_metadata()
                         component_name = metadata["name"]
                         
+                        self.component_specs[component_name] = {
+                            "module": obj.__module__,
+                            "class": obj.__name__,
+                            "metadata": metadata,
+                            "dependencies": list(instance.get_dependencies())
+                        }
                         self.component_classes[component_name] = obj
                         self.component_instances[component_name] = instance
                         
@@ -103,15 +141,73 @@ class ComponentRegistry:
         except Exception as e:
             self.logger.warning(f"Could not load component module {module_name}: {e}")
     
+    def _get_modules_fingerprint(self) -> Dict[str, Any]:
+        """Get the version and (size, mtime) of every component module"""
+        files = {}
+        for py_file in self.components_dir.glob("*.py"):
+            try:
+                stat = py_file.stat()
+            except OSError:
+                continue
+            files[py_file.name] = [stat.st_size, stat.st_mtime_ns]
+        
+        return {
+            "version": __version__,
+            "components_dir": str(self.components_dir.resolve()),
+            "files": files
+        }
+    
+    def _load_discovery_cache(self, fingerprint: Dict[str, Any]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Get cached component specs if the component modules are unchanged"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if data.get("cache_version") != self.DISCOVERY_CACHE_VERSION or data.get("fingerprint") != fingerprint:
+            return None
+        return data.get("components")
+    
+    def _save_discovery_cache(self, fingerprint: Dict[str, Any]) -> None:
+        """Write component specs to the discovery cache"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_file.with_suffix(".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "cache_version": self.DISCOVERY_CACHE_VERSION,
+                    "fingerprint": fingerprint,
+                    "components": self.component_specs
+                }, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.cache_file)
+        except OSError as e:
+            # Read-only installs just rediscover on every run
+            self.logger.debug(f"Could not write component discovery cache {self.cache_file}: {e}")
+    
     def _build_dependency_graph(self) -> None:
         """Build dependency graph for all discovered components"""
-        for name, instance in self.component_instances.items():
-            try:
-                dependencies = instance.get_dependencies()
-                self.dependency_graph[name] = set(dependencies)
-            except Exception as e:
-                self.logger.warning(f"Could not get dependencies for {name}: {e}")
-                self.dependency_graph[name] = set()
+        for name, spec in self.component_specs.items():
+            self.dependency_graph[name] = set(spec.get("dependencies", []))
+    
+    def _load_component_class(self, component_name: str) -> Optional[Type[Component]]:
+        """Import a discovered component's class on first use"""
+        if component_name in self.component_classes:
+            return self.component_classes[component_name]
+        
+        spec = self.component_specs.get(component_name)
+        if spec is None:
+            return None
+        
+        try:
+            module = importlib.import_module(spec["module"])
+            component_class = getattr(module, spec["class"])
+        except (ImportError, AttributeError) as e:
+            self.logger.warning(f"Could not load component {component_name}: {e}")
+            return None
+        
+        self.component_classes[component_name] = component_class
+        return component_class
     
     def get_component_class(self, component_name: str) -> Optional[Type[Component]]:
         """
@@ -124,7 +220,7 @@ class ComponentRegistry:
             Component class or None if not found
         """
         self.discover_components()
-        return self.component_classes.get(component_name)
+        return self._load_component_class(component_name)
     
     def get_component_instance(self, component_name: str, install_dir: Optional[Path] = None) -> Optional[Component]:
         """
@@ -132,24 +228,35 @@ class ComponentRegistry:
         
         Args:
             component_name: Name of component
-            install_dir: Installation directory (creates new instance with this dir)
+            install_dir: Installation directory (one instance is kept per
+                         directory, so its install plan is shared by all phases)
             
         Returns:
             Component instance or None if not found
         """
         self.discover_components()
         
-        if install_dir is not None:
-            # Create new instance with specified install directory
-            component_class = self.component_classes.get(component_name)
-            if component_class:
-                try:
-                    return component_class(install_dir)
-                except Exception as e:
-                    self.logger.error(f"Error creating component instance {component_name}: {e}")
-                    return None
-        
-        return self.component_instances.get(component_name)
+        if install_dir is None and component_name in self.component_instances:
+            return self.component_instances[component_name]
+        if install_dir is not None and (component_name, install_dir) in self._install_dir_instances:
+            return self._install_dir_instances[(component_name, install_dir)]
+        
+        component_class = self._load_component_class(component_name)
+        if not component_class:
+            return None
+        
+        try:
+            if install_dir is not None:
+                instance = component_class(install_dir)
+                self._install_dir_instances[(component_name, install_dir)] = instance
+                return instance
+            
+            instance = component_class()
+            self.component_instances[component_name] = instance
+            return instance
+        except Exception as e:
+            self.logger.error(f"Error creating component instance {component_name}: {e}")
+            return None
     
     def list_components(self) -> List[str]:
         """
@@ -159,7 +266,7 @@ class ComponentRegistry:
             List of component names
         """
         self.discover_components()
-        return list(self.component_classes.keys())
+        return list(self.component_specs.keys())
     
     def get_component_metadata(self, component_name: str) -> Optional[Dict[str, str]]:
         """
@@ -172,13 +279,8 @@ class ComponentRegistry:
             Component metadata dict or None if not found
         """
         self.discover_components()
-        instance = self.component_instances.get(component_name)
-        if instance:
-            try:
-                return instance.get_metadata()
-            except Exception:
-                return None
-        return None
+        spec = self.component_specs.get(component_name)
+        return dict(spec["metadata"]) if spec else None
     
     def resolve_dependencies(self, component_names: List[str]) -> List[str]:
         """
@@ -294,13 +396,9 @@ class ComponentRegistry:
         self.discover_components()
         components = []
         
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                if metadata.get("category") == category:
-                    components.append(name)
-            except Exception:
-                continue
+        for name, spec in self.component_specs.items():
+            if spec["metadata"].get("category") == category:
+                components.append(name)
         
         return components
     
@@ -377,20 +475,14 @@ class ComponentRegistry:
         
         # Group components by category
         categories = {}
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                category = metadata.get("category", "unknown")
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(name)
-            except Exception:
-                if "unknown" not in categories:
-                    categories["unknown"] = []
-                categories["unknown"].append(name)
+        for name, spec in self.component_specs.items():
+            category = spec["metadata"].get("category", "unknown")
+            if category not in categories:
+                categories[category] = []
+            categories[category].append(name)
         
         return {
-            "total_components": len(self.component_classes),
+            "total_components": len(self.component_specs),
             "categories": categories,
             "dependency_graph": {name: list(deps) for name, deps in self.dependency_graph.items()},
             "validation_errors": self.validate_dependency_graph()
@@ -2,13 +2,16 @@
 System validation for SuperClaude installation requirements
 """
 
+import functools
 import subprocess
 import sys
 import shutil
-from typing import Tuple, List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple, List, Dict, Any, Optional
 from pathlib import Path
 import re
 from ..utils.paths import get_home_directory
+from ..services.probe_cache import ProbeCache
 
 # Handle packaging import - if not available, use a simple version comparison
 try:
@@ -54,9 +57,41 @@ except ImportError:
 class Validator:
     """System requirements validator"""
     
-    def __init__(self):
-        """Initialize validator"""
+    def __init__(self, probe_cache: Optional[ProbeCache] = None, use_probe_cache: bool = True,
+                 max_workers: int = 8, install_dir: Optional[Path] = None):
+        """
+        Initialize validator
+        
+        Args:
+            probe_cache: Persistent cache for tool probes (kept in the cache
+                directory of install_dir if None)
+            use_probe_cache: Set False to always spawn probe commands
+            max_workers: Maximum concurrent checks (1 runs them sequentially)
+            install_dir: Installation directory (defaults to ~/.claude)
+        """
         self.validation_cache: Dict[str, Any] = {}
+        self.max_workers = max_workers
+        if probe_cache is None and use_probe_cache:
+            probe_cache = ProbeCache(install_dir=install_dir)
+        self.probe_cache = probe_cache
+    
+    def _run_probe(self, cmd_parts: List[str], timeout: int = 10) -> subprocess.CompletedProcess:
+        """
+        Run a tool probe command such as `node --version`
+        
+        Results are reused across runs through the probe cache while the
+        executable is unchanged.
+        """
+        if self.probe_cache is not None:
+            return self.probe_cache.run(cmd_parts, timeout=timeout)
+        
+        return subprocess.run(
+            cmd_parts,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            shell=(sys.platform == "win32")
+        )
     
     def check_python(self, min_version: str = "3.8", max_version: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -115,14 +150,8 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if node is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Check if node is installed
+            result = self._run_probe(['node', '--version'])
             
             if result.returncode != 0:
                 help_msg = self.get_installation_help("node")
@@ -183,14 +212,8 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if claude is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['claude', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Check if claude is installed
+            result = self._run_probe(['claude', '--version'])
             
             if result.returncode != 0:
                 help_msg = self.get_installation_help("claude_cli")
@@ -253,13 +276,7 @@ class Validator:
             # Split command into parts
             cmd_parts = command.split()
             
-            result = subprocess.run(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            result = self._run_probe(cmd_parts)
             
             if result.returncode != 0:
                 result_tuple = (False, f"{tool_name} not found or command failed")
@@ -383,54 +400,62 @@ class Validator:
         Returns:
             Tuple of (all_passed: bool, error_messages: List[str])
         """
-        errors = []
+        # (label, check, optional) - independent probes run concurrently
+        checks: List[Tuple[str, Callable[[], Tuple[bool, str]], bool]] = []
         
         # Check Python requirements
         if "python" in requirements:
             python_req = requirements["python"]
-            success, message = self.check_python(
-                python_req["min_version"],
-                python_req.get("max_version")
-            )
-            if not success:
-                errors.append(f"Python: {message}")
+            checks.append(("Python", functools.partial(
+                self.check_python, python_req["min_version"], python_req.get("max_version")
+            ), False))
         
         # Check Node.js requirements
         if "node" in requirements:
             node_req = requirements["node"]
-            success, message = self.check_node(
-                node_req["min_version"],
-                node_req.get("max_version")
-            )
-            if not success:
-                errors.append(f"Node.js: {message}")
+            checks.append(("Node.js", functools.partial(
+                self.check_node, node_req["min_version"], node_req.get("max_version")
+            ), False))
         
         # Check disk space
         if "disk_space_mb" in requirements:
-            success, message = self.check_disk_space(
-                get_home_directory(),
-                requirements["disk_space_mb"]
-            )
-            if not success:
-                errors.append(f"Disk space: {message}")
+            checks.append(("Disk space", functools.partial(
+                self.check_disk_space, get_home_directory(), requirements["disk_space_mb"]
+            ), False))
         
-        # Check external tools
+        # Check external tools, skipping optional tools that fail
         if "external_tools" in requirements:
             for tool_name, tool_req in requirements["external_tools"].items():
-                # Skip optional tools that fail
-                is_optional = tool_req.get("optional", False)
-                
-                success, message = self.check_external_tool(
-                    tool_name,
-                    tool_req["command"],
-                    tool_req.get("min_version")
-                )
-                
-                if not success and not is_optional:
-                    errors.append(f"{tool_name}: {message}")
+                checks.append((tool_name, functools.partial(
+                    self.check_external_tool, tool_name, tool_req["command"], tool_req.get("min_version")
+                ), tool_req.get("optional", False)))
+        
+        results = self._run_checks([check for _, check, _ in checks])
+        
+        errors = []
+        for (label, _, is_optional), (success, message) in zip(checks, results):
+            if not success and not is_optional:
+                errors.append(f"{label}: {message}")
         
         return len(errors) == 0, errors
     
+    def _run_checks(self, checks: List[Callable[[], Tuple[bool, str]]]) -> List[Tuple[bool, str]]:
+        """
+        Run independent checks concurrently
+        
+        Args:
+            checks: Zero-argument check callables
+            
+        Returns:
+            Check results in the same order as checks
+        """
+        if len(checks) <= 1 or self.max_workers <= 1:
+            return [check() for check in checks]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(checks))) as executor:
+            futures = [executor.submit(check) for check in checks]
+            return [future.result() for future in futures]
+    
     def validate_component_requirements(self, component_names: List[str], all_requirements: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
         Validate requirements for specific components
@@ -590,8 +615,17 @@ class Validator:
             "recommendations": []
         }
         
+        # Probe everything at once; total time is bounded by the slowest probe
+        results = self._run_checks([
+            self.check_python,
+            self.check_node,
+            self.check_claude_cli,
+            functools.partial(self.check_disk_space, get_home_directory())
+        ])
+        (python_success, python_msg), (node_success, node_msg), \
+            (claude_success, claude_msg), (disk_success, disk_msg) = results
+        
         # Check Python
-        python_success, python_msg = self.check_python()
         diagnostics["checks"]["python"] = {
             "status": "pass" if python_success else "fail",
             "message": python_msg
@@ -601,7 +635,6 @@ class Validator:
             diagnostics["recommendations"].append(self.get_installation_help("python"))
         
         # Check Node.js
-        node_success, node_msg = self.check_node()
         diagnostics["checks"]["node"] = {
             "status": "pass" if node_success else "fail", 
             "message": node_msg
@@ -611,7 +644,6 @@ class Validator:
             diagnostics["recommendations"].append(self.get_installation_help("node"))
         
         # Check Claude CLI
-        claude_success, claude_msg = self.check_claude_cli()
         diagnostics["checks"]["claude_cli"] = {
             "status": "pass" if claude_success else "fail",
             "message": claude_msg
@@ -621,7 +653,6 @@ class Validator:
             diagnostics["recommendations"].append(self.get_installation_help("claude_cli"))
         
         # Check disk space
-        disk_success, disk_msg = self.check_disk_space(get_home_directory())
         diagnostics["checks"]["disk_space"] = {
             "status": "pass" if disk_success else "fail",
             "message": disk_msg
@@ -650,19 +681,10 @@ class Validator:
         for tool_alternatives, display_name in tool_checks:
             tool_found = False
             for tool in tool_alternatives:
-                try:
-                    result = subprocess.run(
-                        ["which" if sys.platform != "win32" else "where", tool],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        shell=(sys.platform == "win32")
-                    )
-                    if result.returncode == 0:
-                        tool_found = True
-                        break
-                except Exception:
-                    continue
+                # PATH lookup in-process instead of spawning which/where
+                if shutil.which(tool):
+                    tool_found = True
+                    break
             
             if not tool_found:
                 # Only report as missing if none of the alternatives were found
@@ -682,5 +704,7 @@ class Validator:
             )
     
     def clear_cache(self) -> None:
-        """Clear validation cache"""
+        """Clear validation cache, including persisted probe results"""
         self.validation_cache.clear()
+        if self.probe_cache is not None:
+            self.probe_cache.clear()
@@ -3,14 +3,24 @@ SuperClaude Services Module
 Business logic services for the SuperClaude installation system
 """
 
+from .backups import BackupCatalog, BackupStore
 from .claude_md import CLAUDEMdService
 from .config import ConfigService
+from .context_footprint import ContextAnalyzer, ContextBudget
 from .files import FileService
+from .mcp_cache import MCPArtifactCache
+from .probe_cache import ProbeCache
 from .settings import SettingsService
 
 __all__ = [
+    'BackupCatalog',
+    'BackupStore',
     'CLAUDEMdService',
     'ConfigService', 
+    'ContextAnalyzer',
+    'ContextBudget',
     'FileService',
+    'MCPArtifactCache',
+    'ProbeCache',
     'SettingsService'
 ]
\ No newline at end of file
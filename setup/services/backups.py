@@ -0,0 +1,446 @@
+"""
+Backup storage services for SuperClaude installations
+BackupStore keeps each file once as a sha256-keyed blob, with a JSON manifest
+per backup; BackupCatalog indexes tarball backups for fast listing
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.paths import CACHE_DIR_NAME
+
+
+# Top-level directories and files never included in backups
+BACKUP_EXCLUDE_DIRS = ("backups", "local", CACHE_DIR_NAME)
+BACKUP_EXCLUDE_FILES = (".superclaude.lock",)
+
+
+def iter_backup_files(install_dir: Path, exclude_dirs: Tuple[str, ...] = BACKUP_EXCLUDE_DIRS) -> Iterator[Tuple[Path, str]]:
+    """
+    Walk an installation directory, yielding the files that belong in a backup
+
+    Excluded top-level directories are pruned instead of being walked.
+
+    Args:
+        install_dir: Installation directory
+        exclude_dirs: Top-level directory names to skip
+
+    Yields:
+        Tuples of (absolute path, install-relative POSIX path), sorted per directory
+    """
+    for root, dirs, files in os.walk(install_dir):
+        root_path = Path(root)
+        if root_path == install_dir:
+            dirs[:] = [d for d in dirs if d not in exclude_dirs]
+            files = [f for f in files if f not in BACKUP_EXCLUDE_FILES]
+        dirs.sort()
+
+        for filename in sorted(files):
+            path = root_path / filename
+            if path.is_file():
+                yield path, path.relative_to(install_dir).as_posix()
+
+
+class BackupStore:
+    """Deduplicated backup store keyed by file content hash"""
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup store
+
+        Args:
+            backup_dir: Backup directory; the store lives in its "store" subdirectory
+        """
+        self.root = backup_dir / "store"
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+        self.logger = get_logger()
+
+    def create(self, install_dir: Path, name: str, metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Back up an installation, writing only blobs that are not stored yet
+
+        Files whose size and mtime match the most recent backup reuse its hash
+        without being read again.
+
+        Args:
+            install_dir: Installation directory to back up
+            name: Backup name
+            metadata: Extra metadata stored in the manifest
+
+        Returns:
+            Path to the backup manifest
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+
+        previous = self._latest_manifest()
+        previous_files = previous.get("files", {}) if previous else {}
+
+        files = {}
+        new_blobs = 0
+        new_bytes = 0
+
+        for path, rel_path in iter_backup_files(install_dir):
+            try:
+                stat = path.stat()
+                entry = previous_files.get(rel_path)
+                if (entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime
+                        and self._object_path(entry["sha256"]).exists()):
+                    digest = entry["sha256"]
+                else:
+                    digest = self._hash_file(path)
+                    if self._store_object(path, digest):
+                        new_blobs += 1
+                        new_bytes += stat.st_size
+
+                files[rel_path] = {
+                    "sha256": digest,
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                    "mode": stat.st_mode & 0o777
+                }
+            except OSError as e:
+                self.logger.warning(f"Could not backup {rel_path}: {e}")
+
+        manifest = {
+            "name": name,
+            "created": datetime.now().isoformat(),
+            "install_dir": str(install_dir),
+            "metadata": metadata or {},
+            "files": files
+        }
+
+        manifest_path = self.manifests_dir / f"{name}.json"
+        self._write_json(manifest_path, manifest)
+
+        self.logger.debug(f"Stored {len(files)} files in backup {name} ({new_blobs} new blobs, {new_bytes} bytes)")
+        return manifest_path
+
+    def restore(self, name: str, install_dir: Path, overwrite: bool = False,
+                paths: Optional[Set[str]] = None) -> Tuple[int, List[str]]:
+        """
+        Rebuild files from a backup manifest
+
+        Args:
+            name: Backup name
+            install_dir: Directory to restore into
+            overwrite: Replace files that already exist
+            paths: Only restore these install-relative paths
+
+        Returns:
+            Tuple of (files_restored: int, error_messages: List[str])
+        """
+        manifest = self.load_manifest(name)
+        restored = 0
+        errors = []
+
+        for rel_path, entry in manifest["files"].items():
+            if paths is not None and rel_path not in paths:
+                continue
+
+            target = install_dir / rel_path
+            if target.exists() and not overwrite:
+                continue
+
+            blob = self._object_path(entry["sha256"])
+            if not blob.exists():
+                errors.append(f"Missing blob for {rel_path}: {entry['sha256']}")
+                continue
+
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(blob, target)
+                os.chmod(target, entry.get("mode", 0o644))
+                os.utime(target, (entry["mtime"], entry["mtime"]))
+                restored += 1
+            except OSError as e:
+                errors.append(f"Could not restore {rel_path}: {e}")
+
+        return restored, errors
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """
+        List stored backups
+
+        Returns:
+            List of dicts with name, path, created, files and size, newest first
+        """
+        backups = []
+        if not self.manifests_dir.exists():
+            return backups
+
+        for manifest_path in self.manifests_dir.glob("*.json"):
+            try:
+                manifest = self._read_json(manifest_path)
+            except ValueError as e:
+                self.logger.warning(str(e))
+                continue
+
+            backups.append({
+                "name": manifest["name"],
+                "path": manifest_path,
+                "created": datetime.fromisoformat(manifest["created"]),
+                "files": len(manifest["files"]),
+                "size": sum(entry["size"] for entry in manifest["files"].values()),
+                "metadata": manifest.get("metadata", {})
+            })
+
+        backups.sort(key=lambda backup: backup["created"], reverse=True)
+        return backups
+
+    def load_manifest(self, name: str) -> Dict[str, Any]:
+        """
+        Load a backup manifest
+
+        Args:
+            name: Backup name
+
+        Returns:
+            Manifest dict
+
+        Raises:
+            FileNotFoundError: If the backup does not exist
+        """
+        manifest_path = self.manifests_dir / f"{name}.json"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Backup not found: {name}")
+        return self._read_json(manifest_path)
+
+    def delete(self, name: str) -> bool:
+        """
+        Delete a backup manifest (blobs are reclaimed by gc)
+
+        Args:
+            name: Backup name
+
+        Returns:
+            True if the backup was deleted, False if not found
+        """
+        manifest_path = self.manifests_dir / f"{name}.json"
+        if not manifest_path.exists():
+            return False
+        manifest_path.unlink()
+        return True
+
+    def gc(self) -> Tuple[int, int]:
+        """
+        Remove blobs no longer referenced by any manifest
+
+        Returns:
+            Tuple of (blobs_removed: int, bytes_freed: int)
+        """
+        if not self.objects_dir.exists():
+            return 0, 0
+
+        referenced = set()
+        for manifest_path in self.manifests_dir.glob("*.json"):
+            try:
+                manifest = self._read_json(manifest_path)
+            except ValueError:
+                # Never collect blobs while a manifest cannot be read
+                self.logger.warning(f"Skipping garbage collection, unreadable manifest: {manifest_path}")
+                return 0, 0
+            referenced.update(entry["sha256"] for entry in manifest["files"].values())
+
+        removed = 0
+        freed = 0
+        for blob in self.objects_dir.glob("*/*"):
+            if blob.name not in referenced:
+                freed += blob.stat().st_size
+                blob.unlink()
+                removed += 1
+
+        return removed, freed
+
+    def get_store_size(self) -> int:
+        """Get total size of stored blobs in bytes"""
+        if not self.objects_dir.exists():
+            return 0
+        return sum(blob.stat().st_size for blob in self.objects_dir.glob("*/*"))
+
+    def _latest_manifest(self) -> Optional[Dict[str, Any]]:
+        """Load the most recently created manifest, if any"""
+        backups = self.list_backups()
+        if not backups:
+            return None
+        return self._read_json(backups[0]["path"])
+
+    def _object_path(self, digest: str) -> Path:
+        """Get the blob path for a content hash"""
+        return self.objects_dir / digest[:2] / digest
+
+    def _store_object(self, path: Path, digest: str) -> bool:
+        """
+        Copy a file into the object store unless the blob already exists
+
+        Returns:
+            True if a new blob was written
+        """
+        blob = self._object_path(digest)
+        if blob.exists():
+            return False
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=blob.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as dst, open(path, 'rb') as src:
+                shutil.copyfileobj(src, dst)
+            os.replace(temp_name, blob)
+        except Exception:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return True
+
+    def _hash_file(self, path: Path) -> str:
+        """Calculate sha256 of a file"""
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _read_json(self, path: Path) -> Dict[str, Any]:
+        """Read a JSON file"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not read backup manifest {path}: {e}")
+
+    def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
+        """Write a JSON file atomically"""
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(temp_path, path)
+
+
+class BackupCatalog:
+    """
+    Sidecar index of backup archives in a backup directory
+
+    Caches what listing and selective restores need (size, file count,
+    metadata, member index and archived installation metadata) per archive
+    so archives are only scanned when they are new or changed on disk.
+    """
+
+    CATALOG_NAME = ".catalog.json"
+    CATALOG_VERSION = 2
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup catalog
+
+        Args:
+            backup_dir: Backup directory containing the archives
+        """
+        self.backup_dir = backup_dir
+        self.catalog_file = backup_dir / self.CATALOG_NAME
+        self.logger = get_logger()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def get(self, archive: Path) -> Optional[Dict[str, Any]]:
+        """
+        Get the catalog entry of an archive if it is still current
+
+        Args:
+            archive: Archive path
+
+        Returns:
+            Entry dict, or None if missing or the archive changed on disk
+        """
+        entry = self._load().get(archive.name)
+        if entry is None:
+            return None
+
+        try:
+            stat = archive.stat()
+        except OSError:
+            return None
+
+        if entry.get("archive_size") != stat.st_size or entry.get("archive_mtime_ns") != stat.st_mtime_ns:
+            return None
+        return entry
+
+    def record(self, archive: Path, info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add or replace the entry of an archive
+
+        Args:
+            archive: Archive path
+            info: Backup info with "files", "metadata" and optional "members"
+                and "install_metadata"
+
+        Returns:
+            The stored entry
+        """
+        stat = archive.stat()
+        metadata = info.get("metadata", {})
+        entry = {
+            "archive_size": stat.st_size,
+            "archive_mtime_ns": stat.st_mtime_ns,
+            "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "files": info.get("files"),
+            "framework_version": metadata.get("framework_version"),
+            "components": metadata.get("components", {}),
+            "metadata": metadata
+        }
+        if "members" in info:
+            entry["members"] = info["members"]
+            entry["install_metadata"] = info.get("install_metadata")
+
+        self._load()[archive.name] = entry
+        self._dirty = True
+        return entry
+
+    def remove(self, archive: Path) -> None:
+        """Drop the entry of a deleted archive"""
+        if self._load().pop(archive.name, None) is not None:
+            self._dirty = True
+
+    def prune(self, archives: List[Path]) -> None:
+        """Drop entries for archives that no longer exist"""
+        names = {archive.name for archive in archives}
+        for name in list(self._load()):
+            if name not in names:
+                del self._entries[name]
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the catalog if it changed"""
+        if not self._dirty:
+            return
+
+        try:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = self.catalog_file.with_suffix(".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": self.CATALOG_VERSION, "backups": self._entries}, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.catalog_file)
+            self._dirty = False
+        except OSError as e:
+            # The catalog is only a cache; listing still works without it
+            self.logger.warning(f"Could not write backup catalog {self.catalog_file}: {e}")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load catalog entries, starting empty if missing or unreadable"""
+        if self._entries is None:
+            self._entries = {}
+            if self.catalog_file.exists():
+                try:
+                    with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if data.get("version") == self.CATALOG_VERSION:
+                        self._entries = data.get("backups", {})
+                except (json.JSONDecodeError, IOError, AttributeError) as e:
+                    self.logger.debug(f"Ignoring unreadable backup catalog: {e}")
+        return self._entries
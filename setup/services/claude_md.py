@@ -2,12 +2,221 @@
 CLAUDE.md Manager for preserving user customizations while managing framework imports
 """
 
+import os
 import re
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Set, Dict, Optional
+from typing import Iterator, List, Set, Dict, Optional
+from ..utils.locking import InterProcessLock, fsync_directory, get_install_lock
 from ..utils.logger import get_logger
 
 
+# Serializes CLAUDE.md rewrites when components are installed concurrently
+_claude_md_lock = threading.RLock()
+
+FRAMEWORK_MARKER = "# ===================================================\n# SuperClaude Framework Components"
+IMPORT_RE = re.compile(r'^@([^\s\n]+\.md)\s*$', re.MULTILINE)
+
+DEFAULT_CONTENT = """# SuperClaude Entry Point
+
+This file serves as the entry point for the SuperClaude framework.
+You can add your own custom instructions and configurations here.
+
+The SuperClaude framework components will be automatically imported below.
+"""
+
+
+def parse_framework_imports(content: str) -> Dict[str, List[str]]:
+    """
+    Parse framework imports organized by category
+    
+    Args:
+        content: Full CLAUDE.md content
+        
+    Returns:
+        Dict mapping category names to lists of imported files
+    """
+    imports_by_category = {}
+    
+    if FRAMEWORK_MARKER not in content:
+        return imports_by_category
+    
+    current_category = None
+    for line in content.split(FRAMEWORK_MARKER)[1].split('\n'):
+        line = line.strip()
+        
+        # Skip section header lines and empty lines
+        if line.startswith('# ===') or not line:
+            continue
+        
+        # Category header (starts with # but not the section divider)
+        if line.startswith('# '):
+            current_category = line[2:].strip()
+            imports_by_category.setdefault(current_category, [])
+        
+        # Import line (starts with @)
+        elif line.startswith('@') and current_category:
+            import_file = line[1:].strip()
+            if import_file not in imports_by_category[current_category]:
+                imports_by_category[current_category].append(import_file)
+    
+    return imports_by_category
+
+
+def render_framework_section(files_by_category: Dict[str, List[str]]) -> str:
+    """
+    Render imports as categorized framework sections
+    
+    Args:
+        files_by_category: Dict mapping category names to lists of files
+        
+    Returns:
+        Formatted import sections (empty if there are no categories)
+    """
+    if not files_by_category:
+        return ""
+    
+    sections = [
+        "# ===================================================",
+        "# SuperClaude Framework Components",
+        "# ===================================================",
+        "",
+    ]
+    for category, files in files_by_category.items():
+        if files:
+            sections.append(f"# {category}")
+            sections.extend(f"@{file}" for file in sorted(files))
+            sections.append("")
+    
+    return "\n".join(sections)
+
+
+class ClaudeMdDocument:
+    """
+    Parsed CLAUDE.md: the user's content plus framework imports by category
+    
+    Edits only touch the in-memory model; CLAUDEMdService.session() writes
+    the rendered document back once.
+    """
+    
+    def __init__(self, content: Optional[str]):
+        """
+        Parse CLAUDE.md content
+        
+        Args:
+            content: File content, or None if CLAUDE.md doesn't exist yet
+        """
+        self.original = content
+        text = DEFAULT_CONTENT if content is None else content
+        if FRAMEWORK_MARKER in text:
+            self.user_content = text.split(FRAMEWORK_MARKER)[0].rstrip()
+        else:
+            self.user_content = text.rstrip()
+        self.categories = parse_framework_imports(text)
+        self.user_imports = set(IMPORT_RE.findall(self.user_content))
+        self.changed = False
+    
+    @property
+    def imports(self) -> Set[str]:
+        """All imported filenames, in user content or framework sections"""
+        return self.user_imports.union(*self.categories.values())
+    
+    @property
+    def import_count(self) -> int:
+        """Number of framework imports"""
+        return sum(len(files) for files in self.categories.values())
+    
+    def add_imports(self, files: List[str], category: str) -> List[str]:
+        """
+        Add files not imported yet to a category
+        
+        Args:
+            files: Filenames to import
+            category: Category name for organizing imports
+            
+        Returns:
+            The files that were added
+        """
+        # Adding imports always materializes CLAUDE.md, even with nothing new
+        if self.original is None:
+            self.changed = True
+        
+        existing = self.imports
+        new_files = []
+        for file in files:
+            if file not in existing:
+                existing.add(file)
+                new_files.append(file)
+        
+        if new_files:
+            self.categories.setdefault(category, []).extend(new_files)
+            self.changed = True
+        return new_files
+    
+    def remove_imports(self, files: List[str]) -> List[str]:
+        """
+        Remove files from all framework categories
+        
+        Args:
+            files: Filenames to remove
+            
+        Returns:
+            The files that were removed
+        """
+        removed = []
+        for category_files in self.categories.values():
+            for file in files:
+                if file in category_files:
+                    category_files.remove(file)
+                    removed.append(file)
+        
+        if removed:
+            self.categories = {k: v for k, v in self.categories.items() if v}
+            self.changed = True
+        return removed
+    
+    def render(self) -> str:
+        """Render the document as CLAUDE.md content"""
+        parts = []
+        if self.user_content.strip():
+            parts.append(self.user_content)
+            parts.append("")  # Blank line before framework section
+        
+        framework_section = render_framework_section(self.categories)
+        if framework_section:
+            parts.append(framework_section)
+        
+        return "\n".join(parts)
+
+
+class _Session:
+    """CLAUDE.md document shared by one install directory"""
+    
+    def __init__(self, document: ClaudeMdDocument, process_lock: InterProcessLock):
+        self.depth = 0
+        self.document = document
+        self.budget = None
+        self.process_lock = process_lock
+
+
+# Open sessions by install directory, shared by every CLAUDEMdService
+# pointing at it (see CLAUDEMdService.session)
+_sessions: Dict[Path, _Session] = {}
+
+
+def _reset_after_fork() -> None:
+    """Drop the parent's open sessions in a forked child so its writes reach disk"""
+    global _claude_md_lock
+    _sessions.clear()
+    _claude_md_lock = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 class CLAUDEMdService:
     """Manages CLAUDE.md file updates while preserving user customizations"""
     
@@ -21,6 +230,7 @@ class CLAUDEMdService:
         self.install_dir = install_dir
         self.claude_md_path = install_dir / "CLAUDE.md"
         self.logger = get_logger()
+        self._session_key = Path(os.path.abspath(install_dir))
     
     def read_existing_imports(self) -> Set[str]:
         """
@@ -29,25 +239,9 @@ class CLAUDEMdService:
         Returns:
             Set of already imported filenames (without @)
         """
-        existing_imports = set()
-        
-        if not self.claude_md_path.exists():
-            return existing_imports
-        
-        try:
-            with open(self.claude_md_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find all @import statements using regex
-            import_pattern = r'^@([^\s\n]+\.md)\s*$'
-            matches = re.findall(import_pattern, content, re.MULTILINE)
-            existing_imports.update(matches)
-            
-            self.logger.debug(f"Found existing imports: {existing_imports}")
-            
-        except Exception as e:
-            self.logger.warning(f"Could not read existing CLAUDE.md imports: {e}")
-        
+        content = self.read_existing_content()
+        existing_imports = set(IMPORT_RE.findall(content))
+        self.logger.debug(f"Found existing imports: {existing_imports}")
         return existing_imports
     
     def read_existing_content(self) -> str:
@@ -77,16 +271,7 @@ class CLAUDEMdService:
         Returns:
             User content without framework imports
         """
-        # Look for framework imports section marker
-        framework_marker = "# ===================================================\n# SuperClaude Framework Components"
-        
-        if framework_marker in content:
-            user_content = content.split(framework_marker)[0].rstrip()
-        else:
-            # If no framework section exists, preserve all content
-            user_content = content.rstrip()
-        
-        return user_content
+        return ClaudeMdDocument(content).user_content
     
     def organize_imports_by_category(self, files_by_category: Dict[str, List[str]]) -> str:
         """
@@ -98,27 +283,59 @@ class CLAUDEMdService:
         Returns:
             Formatted import sections
         """
-        if not files_by_category:
-            return ""
-        
-        sections = []
-        
-        # Framework imports section header
-        sections.append("# ===================================================")
-        sections.append("# SuperClaude Framework Components")
-        sections.append("# ===================================================")
-        sections.append("")
-        
-        # Add each category
-        for category, files in files_by_category.items():
-            if files:
-                sections.append(f"# {category}")
-                for file in sorted(files):
-                    sections.append(f"@{file}")
-                sections.append("")
-        
-        return "\n".join(sections)
+        return render_framework_section(files_by_category)
     
+    @contextmanager
+    def session(self, budget=None) -> Iterator[ClaudeMdDocument]:
+        """
+        Batch CLAUDE.md import changes into a single write
+
+        While a session is open, every CLAUDEMdService for this install
+        directory (in any thread) edits one parsed copy of CLAUDE.md, loaded
+        once. The outermost session writes the file atomically when it exits,
+        and only if its content changed; an exception discards the changes.
+        The install directory's cross-process lock is held from the read to
+        the write, so other SuperClaude processes can't lose their changes.
+
+        Args:
+            budget: Optional ContextBudget; before writing, framework imports
+                that don't fit it are dropped (the files stay installed)
+
+        Yields:
+            The shared in-memory document
+        """
+        with _claude_md_lock:
+            session = _sessions.get(self._session_key)
+            if session is None:
+                process_lock = get_install_lock(self.install_dir)
+                process_lock.acquire()
+                try:
+                    document = self._load_document()
+                except BaseException:
+                    process_lock.release()
+                    raise
+                session = _sessions[self._session_key] = _Session(document, process_lock)
+            session.depth += 1
+            if budget is not None:
+                session.budget = budget
+
+        committed = False
+        try:
+            yield session.document
+            committed = True
+        finally:
+            with _claude_md_lock:
+                session.depth -= 1
+                if session.depth == 0:
+                    del _sessions[self._session_key]
+                    try:
+                        if committed:
+                            if session.budget is not None:
+                                self._apply_budget(session.document, session.budget)
+                            self._save_document(session.document)
+                    finally:
+                        session.process_lock.release()
+
     def add_imports(self, files: List[str], category: str = "Framework") -> bool:
         """
         Add new imports with duplicate checking and user content preservation
@@ -131,59 +348,102 @@ class CLAUDEMdService:
             True if successful, False otherwise
         """
         try:
-            # Ensure CLAUDE.md exists
-            self.ensure_claude_md_exists()
-            
-            # Read existing content and imports
-            existing_content = self.read_existing_content()
-            existing_imports = self.read_existing_imports()
-            
-            # Filter out files already imported
-            new_files = [f for f in files if f not in existing_imports]
-            
-            if not new_files:
-                self.logger.info("All files already imported, no changes needed")
-                return True
-            
+            with _claude_md_lock, self.session() as document:
+                new_files = document.add_imports(files, category)
+        except Exception as e:
+            self.logger.error(f"Failed to update CLAUDE.md: {e}")
+            return False
+
+        if not new_files:
+            self.logger.info("All files already imported, no changes needed")
+        else:
             self.logger.info(f"Adding {len(new_files)} new imports to category '{category}': {new_files}")
+        return True
+
+    def remove_imports(self, files: List[str]) -> bool:
+        """
+        Remove specific imports from CLAUDE.md
+        
+        Args:
+            files: List of filenames to remove from imports
             
-            # Extract user content (preserve everything before framework section)
-            user_content = self.extract_user_content(existing_content)
-            
-            # Parse existing framework imports by category
-            existing_framework_imports = self._parse_existing_framework_imports(existing_content)
-            
-            # Add new files to the specified category
-            if category not in existing_framework_imports:
-                existing_framework_imports[category] = []
-            existing_framework_imports[category].extend(new_files)
-            
-            # Build new content
-            new_content_parts = []
-            
-            # Add user content
-            if user_content.strip():
-                new_content_parts.append(user_content)
-                new_content_parts.append("")  # Add blank line before framework section
-            
-            # Add organized framework imports
-            framework_section = self.organize_imports_by_category(existing_framework_imports)
-            if framework_section:
-                new_content_parts.append(framework_section)
-            
-            # Write updated content
-            new_content = "\n".join(new_content_parts)
-            
-            with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            self.logger.success(f"Updated CLAUDE.md with {len(new_files)} new imports")
-            return True
-            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with _claude_md_lock, self.session() as document:
+                removed = document.remove_imports(files)
         except Exception as e:
-            self.logger.error(f"Failed to update CLAUDE.md: {e}")
+            self.logger.error(f"Failed to remove imports from CLAUDE.md: {e}")
             return False
-    
+
+        if removed:
+            self.logger.info(f"Removed {len(removed)} imports from CLAUDE.md")
+        return True
+
+    def _apply_budget(self, document: ClaudeMdDocument, budget) -> List[str]:
+        """
+        Drop the lowest-priority framework imports until the rest fit a budget
+
+        Args:
+            document: Document to trim
+            budget: ContextBudget with the token cap and import priorities
+
+        Returns:
+            Names of the imports that were dropped
+        """
+        from .context_footprint import estimate_tokens
+
+        costs = {}
+        for files in document.categories.values():
+            for name in files:
+                try:
+                    costs[name] = estimate_tokens((self.install_dir / name).read_text(encoding='utf-8'))
+                except (OSError, UnicodeDecodeError):
+                    costs[name] = 0
+
+        kept, excluded = budget.select(costs)
+        used = sum(costs[name] for name in kept)
+        self.logger.info(f"Context budget: importing {len(kept)} framework docs "
+                         f"(~{used} of {budget.tokens} tokens)")
+        if excluded:
+            self.logger.info(f"Installed but not imported to stay within the budget: {', '.join(sorted(excluded))}")
+            document.remove_imports(excluded)
+        return excluded
+
+    def _load_document(self) -> ClaudeMdDocument:
+        """Read and parse CLAUDE.md once"""
+        if not self.claude_md_path.exists():
+            return ClaudeMdDocument(None)
+        with open(self.claude_md_path, 'r', encoding='utf-8') as f:
+            return ClaudeMdDocument(f.read())
+
+    def _save_document(self, document: ClaudeMdDocument) -> None:
+        """Write a document atomically if its content changed"""
+        content = document.render() if document.changed else document.original
+        if content == document.original:
+            self.logger.debug("CLAUDE.md unchanged, skipping write")
+            return
+
+        self.claude_md_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=self.claude_md_path.parent, prefix=".CLAUDE.md.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_name, self.claude_md_path)
+            fsync_directory(self.claude_md_path.parent)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+
+        if document.original is None:
+            self.logger.info("Created CLAUDE.md with default content")
+        self.logger.success(f"Updated CLAUDE.md ({document.import_count} framework imports)")
+        document.original = content
+        document.changed = False
+
     def _parse_existing_framework_imports(self, content: str) -> Dict[str, List[str]]:
         """
         Parse existing framework imports organized by category
@@ -194,41 +454,7 @@ class CLAUDEMdService:
         Returns:
             Dict mapping category names to lists of imported files
         """
-        imports_by_category = {}
-        
-        # Look for framework imports section
-        framework_marker = "# ===================================================\n# SuperClaude Framework Components"
-        
-        if framework_marker not in content:
-            return imports_by_category
-        
-        # Extract framework section
-        framework_section = content.split(framework_marker)[1] if framework_marker in content else ""
-        
-        # Parse categories and imports
-        lines = framework_section.split('\n')
-        current_category = None
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip section header lines and empty lines
-            if line.startswith('# ===') or not line:
-                continue
-            
-            # Category header (starts with # but not the section divider)
-            if line.startswith('# ') and not line.startswith('# ==='):
-                current_category = line[2:].strip()  # Remove "# "
-                if current_category not in imports_by_category:
-                    imports_by_category[current_category] = []
-            
-            # Import line (starts with @)
-            elif line.startswith('@') and current_category:
-                import_file = line[1:].strip()  # Remove "@"
-                if import_file not in imports_by_category[current_category]:
-                    imports_by_category[current_category].append(import_file)
-        
-        return imports_by_category
+        return parse_framework_imports(content)
     
     def ensure_claude_md_exists(self) -> None:
         """
@@ -238,79 +464,12 @@ class CLAUDEMdService:
             return
         
         try:
-            # Create directory if it doesn't exist
             self.claude_md_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Default CLAUDE.md content
-            default_content = """# SuperClaude Entry Point
-
-This file serves as the entry point for the SuperClaude framework.
-You can add your own custom instructions and configurations here.
-
-The SuperClaude framework components will be automatically imported below.
-"""
-            
             with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(default_content)
+                f.write(DEFAULT_CONTENT)
             
             self.logger.info("Created CLAUDE.md with default content")
             
         except Exception as e:
             self.logger.error(f"Failed to create CLAUDE.md: {e}")
             raise
-    
-    def remove_imports(self, files: List[str]) -> bool:
-        """
-        Remove specific imports from CLAUDE.md
-        
-        Args:
-            files: List of filenames to remove from imports
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            if not self.claude_md_path.exists():
-                return True  # Nothing to remove
-            
-            existing_content = self.read_existing_content()
-            user_content = self.extract_user_content(existing_content)
-            existing_framework_imports = self._parse_existing_framework_imports(existing_content)
-            
-            # Remove files from all categories
-            removed_any = False
-            for category, category_files in existing_framework_imports.items():
-                for file in files:
-                    if file in category_files:
-                        category_files.remove(file)
-                        removed_any = True
-            
-            # Remove empty categories
-            existing_framework_imports = {k: v for k, v in existing_framework_imports.items() if v}
-            
-            if not removed_any:
-                return True  # Nothing was removed
-            
-            # Rebuild content
-            new_content_parts = []
-            
-            if user_content.strip():
-                new_content_parts.append(user_content)
-                new_content_parts.append("")
-            
-            framework_section = self.organize_imports_by_category(existing_framework_imports)
-            if framework_section:
-                new_content_parts.append(framework_section)
-            
-            # Write updated content
-            new_content = "\n".join(new_content_parts)
-            
-            with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            self.logger.info(f"Removed {len(files)} imports from CLAUDE.md")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to remove imports from CLAUDE.md: {e}")
-            return False
\ No newline at end of file
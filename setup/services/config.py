@@ -74,6 +74,17 @@ class ConfigService:
                                 "required_tools": {
                                     "type": "array",
                                     "items": {"type": "string"}
+                                },
+                                "context_priorities": {
+                                    "type": "object",
+                                    "additionalProperties": {"type": "integer"}
+                                },
+                                "compact_sections": {
+                                    "type": "object",
+                                    "additionalProperties": {
+                                        "type": "array",
+                                        "items": {"type": "string"}
+                                    }
                                 }
                             },
                             "required": ["name", "version", "description", "category"],
@@ -278,6 +289,38 @@ class ConfigService:
             return component_info.get("dependencies", [])
         return []
     
+    def get_context_priorities(self) -> Dict[str, int]:
+        """
+        Get the context priorities of the docs components import into CLAUDE.md
+
+        Returns:
+            Dict mapping imported filenames to priorities (higher is kept
+            first under a context budget)
+        """
+        features = self.load_features()
+        priorities = {}
+
+        for info in features.get("components", {}).values():
+            priorities.update(info.get("context_priorities", {}))
+
+        return priorities
+
+    def get_compact_sections(self) -> Dict[str, List[str]]:
+        """
+        Get the section allowlists for compact docs
+
+        Returns:
+            Dict mapping doc filenames to the `##` section titles their
+            compact variant keeps (docs without an entry keep all sections)
+        """
+        features = self.load_features()
+        sections = {}
+
+        for info in features.get("components", {}).values():
+            sections.update(info.get("compact_sections", {}))
+
+        return sections
+
     def get_system_requirements(self) -> Dict[str, Any]:
         """
         Get system requirements
@@ -0,0 +1,304 @@
+"""
+Context footprint analysis for installed framework imports
+Walks the @import graph from CLAUDE.md and measures what every Claude Code
+session loads: bytes, lines and approximate tokens per file and category,
+plus content duplicated across files
+"""
+
+import hashlib
+import math
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .claude_md import IMPORT_RE, parse_framework_imports
+
+# Claude Code follows nested imports at most this many hops deep
+MAX_IMPORT_DEPTH = 5
+
+# Rough size of a token in characters for English prose and markdown
+CHARS_PER_TOKEN = 4
+
+# Paragraphs shorter than this are too generic to count as duplicated content
+MIN_DUPLICATE_CHARS = 80
+
+# Priority of framework docs without an entry in features.json
+DEFAULT_CONTEXT_PRIORITY = 50
+
+ENTRY_CATEGORY = "Entry Point"
+USER_CATEGORY = "User Imports"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate the number of tokens a text costs in the model's context
+
+    Args:
+        text: File content
+
+    Returns:
+        Estimated token count (characters / 4, rounded up)
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def parse_token_count(value: str, allow_zero: bool = False) -> int:
+    """
+    Parse a token count such as "20000", "20k" or "1.5m"
+
+    Args:
+        value: Count with an optional k/m suffix
+        allow_zero: Accept 0 (e.g. for limits that forbid any tokens)
+
+    Returns:
+        Token count
+
+    Raises:
+        ValueError: If the value is not a positive (or zero, if allowed) count
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([km]?)\s*", value.lower())
+    if not match:
+        raise ValueError(f"Invalid token count '{value}' (expected e.g. 20000 or 20k)")
+    count = int(float(match.group(1)) * {"": 1, "k": 1000, "m": 1000000}[match.group(2)])
+    if count < 0 or count == 0 and not allow_zero:
+        raise ValueError(f"Token count must be positive: '{value}'")
+    return count
+
+
+@dataclass(frozen=True)
+class ContextBudget:
+    """Token cap on the framework docs @imported by CLAUDE.md"""
+
+    tokens: int
+    priorities: Dict[str, int] = field(default_factory=dict)
+
+    def priority(self, name: str) -> int:
+        """Priority of an import (higher is kept first)"""
+        return self.priorities.get(name, DEFAULT_CONTEXT_PRIORITY)
+
+    def select(self, costs: Dict[str, int]) -> Tuple[List[str], List[str]]:
+        """
+        Choose which imports fit the budget
+
+        Imports are taken by descending priority, cheaper first among equal
+        priorities; an import that does not fit is skipped and smaller,
+        lower-priority ones may still be taken.
+
+        Args:
+            costs: Estimated tokens by import name
+
+        Returns:
+            Tuple of (kept, excluded) import names
+        """
+        kept, excluded = [], []
+        remaining = self.tokens
+        for name in sorted(costs, key=lambda n: (-self.priority(n), costs[n], n)):
+            if costs[name] <= remaining:
+                kept.append(name)
+                remaining -= costs[name]
+            else:
+                excluded.append(name)
+        return kept, excluded
+
+
+@dataclass
+class FileFootprint:
+    """Context cost of one file loaded through CLAUDE.md"""
+
+    path: Path
+    category: str
+    depth: int
+    bytes: int
+    lines: int
+    tokens: int
+    imported_by: Optional[Path] = None
+
+
+@dataclass
+class DuplicateBlock:
+    """A paragraph that appears in more than one loaded file"""
+
+    preview: str
+    tokens: int
+    files: List[Path] = field(default_factory=list)
+
+    @property
+    def wasted_tokens(self) -> int:
+        """Tokens spent on all but the first copy"""
+        return self.tokens * (len(self.files) - 1)
+
+
+@dataclass
+class ContextReport:
+    """Context footprint of an installation"""
+
+    root: Path
+    files: List[FileFootprint]
+    missing: List[Tuple[Path, Path]]
+    duplicates: List[DuplicateBlock]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(f.bytes for f in self.files)
+
+    @property
+    def total_lines(self) -> int:
+        return sum(f.lines for f in self.files)
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(f.tokens for f in self.files)
+
+    @property
+    def duplicate_tokens(self) -> int:
+        return sum(d.wasted_tokens for d in self.duplicates)
+
+    def by_category(self) -> Dict[str, Dict[str, int]]:
+        """Totals per category, in load order"""
+        categories: Dict[str, Dict[str, int]] = OrderedDict()
+        for footprint in self.files:
+            totals = categories.setdefault(footprint.category, {"files": 0, "bytes": 0, "lines": 0, "tokens": 0})
+            totals["files"] += 1
+            totals["bytes"] += footprint.bytes
+            totals["lines"] += footprint.lines
+            totals["tokens"] += footprint.tokens
+        return categories
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the report"""
+        return {
+            "root": str(self.root),
+            "totals": {"files": len(self.files), "bytes": self.total_bytes, "lines": self.total_lines,
+                       "tokens": self.total_tokens, "duplicate_tokens": self.duplicate_tokens},
+            "categories": self.by_category(),
+            "files": [
+                {"path": str(f.path), "category": f.category, "depth": f.depth, "bytes": f.bytes,
+                 "lines": f.lines, "tokens": f.tokens,
+                 "imported_by": str(f.imported_by) if f.imported_by else None}
+                for f in self.files
+            ],
+            "missing": [{"path": str(path), "imported_by": str(parent)} for path, parent in self.missing],
+            "duplicates": [
+                {"preview": d.preview, "tokens": d.tokens, "wasted_tokens": d.wasted_tokens,
+                 "files": [str(path) for path in d.files]}
+                for d in self.duplicates
+            ],
+        }
+
+
+class ContextAnalyzer:
+    """Measures the context loaded through CLAUDE.md imports"""
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize analyzer
+
+        Args:
+            install_dir: Installation directory containing CLAUDE.md
+        """
+        self.install_dir = install_dir
+        self.claude_md_path = install_dir / "CLAUDE.md"
+
+    def analyze(self) -> ContextReport:
+        """
+        Walk the import graph breadth-first and measure every loaded file
+
+        Each file is counted once, under the category of the framework
+        section that first imports it; nested imports inherit their
+        importer's category.
+
+        Returns:
+            ContextReport for the installation
+
+        Raises:
+            FileNotFoundError: If CLAUDE.md doesn't exist
+        """
+        root = self.claude_md_path.resolve()
+        root_text = root.read_text(encoding="utf-8")
+        categories = {file: category
+                      for category, files in parse_framework_imports(root_text).items()
+                      for file in files}
+
+        files: List[FileFootprint] = []
+        contents: Dict[Path, str] = {}
+        missing: List[Tuple[Path, Path]] = []
+        seen = {root}
+        queue = [(root, root_text, ENTRY_CATEGORY, 0, None)]
+
+        while queue:
+            path, text, category, depth, parent = queue.pop(0)
+            files.append(FileFootprint(path, category, depth, len(text.encode("utf-8")),
+                                       len(text.splitlines()), estimate_tokens(text), parent))
+            contents[path] = text
+
+            if depth >= MAX_IMPORT_DEPTH:
+                continue
+            for name in self._iter_imports(text):
+                target = self._resolve_import(name, path.parent)
+                if target in seen:
+                    continue
+                seen.add(target)
+                try:
+                    child_text = target.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    missing.append((target, path))
+                    continue
+                if depth == 0:
+                    child_category = categories.get(name, USER_CATEGORY)
+                else:
+                    child_category = category
+                queue.append((target, child_text, child_category, depth + 1, path))
+
+        return ContextReport(root, files, missing, self.find_duplicates(contents))
+
+    @staticmethod
+    def find_duplicates(contents: Dict[Path, str]) -> List[DuplicateBlock]:
+        """
+        Find paragraphs repeated across files
+
+        Paragraphs are blank-line separated blocks compared with whitespace
+        normalized; blocks shorter than MIN_DUPLICATE_CHARS are ignored.
+
+        Args:
+            contents: File contents by path
+
+        Returns:
+            Duplicated blocks, most wasted tokens first
+        """
+        blocks: Dict[str, DuplicateBlock] = {}
+        for path, text in contents.items():
+            for paragraph in re.split(r"\n\s*\n", text):
+                normalized = " ".join(paragraph.split())
+                if len(normalized) < MIN_DUPLICATE_CHARS or IMPORT_RE.fullmatch(paragraph.strip()):
+                    continue
+                key = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+                block = blocks.setdefault(key, DuplicateBlock(normalized[:60], estimate_tokens(paragraph)))
+                if path not in block.files:
+                    block.files.append(path)
+
+        duplicates = [block for block in blocks.values() if len(block.files) > 1]
+        return sorted(duplicates, key=lambda block: block.wasted_tokens, reverse=True)
+
+    @staticmethod
+    def _iter_imports(text: str) -> List[str]:
+        """@imports of a file, skipping fenced code blocks"""
+        imports = []
+        in_code = False
+        for line in text.splitlines():
+            if line.lstrip().startswith("```"):
+                in_code = not in_code
+            elif not in_code:
+                match = IMPORT_RE.match(line)
+                if match:
+                    imports.append(match.group(1))
+        return imports
+
+    @staticmethod
+    def _resolve_import(name: str, base_dir: Path) -> Path:
+        """Resolve an import relative to the importing file"""
+        path = Path(name).expanduser()
+        if not path.is_absolute():
+            path = base_dir / path
+        return path.resolve()
@@ -2,13 +2,28 @@
 Cross-platform file management for SuperClaude installation system
 """
 
+import os
 import shutil
 import stat
-from typing import List, Optional, Callable, Dict, Any
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Callable, Dict, Any, Tuple
 from pathlib import Path
 import fnmatch
 import hashlib
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# How installed files refer to their source (see FileService.deploy_file)
+LINK_MODES = ("copy", "hardlink", "symlink", "reflink")
+
+# Linux FICLONE ioctl: share the source's extents (btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
 
 class FileService:
     """Cross-platform file operations manager"""
@@ -23,6 +38,193 @@ class FileService:
         self.dry_run = dry_run
         self.copied_files: List[Path] = []
         self.created_dirs: List[Path] = []
+    
+    def deploy_file(self, source: Path, target: Path, link_mode: str = "copy") -> Optional[str]:
+        """
+        Install a file as a copy, hardlink, symlink or reflink of its source
+        
+        Link modes that are unsupported for the source/target pair (other
+        filesystem, missing privilege, no reflink support) fall back to a copy.
+        The target is always replaced, never written through, so an existing
+        link never modifies its source.
+        
+        Args:
+            source: Source file path
+            target: Target file path
+            link_mode: One of LINK_MODES
+            
+        Returns:
+            Link mode actually used, or None if the file could not be deployed
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link_mode}")
+        
+        if not source.is_file():
+            raise FileNotFoundError(f"Source file not found: {source}")
+        
+        if self.dry_run:
+            print(f"[DRY RUN] Would {link_mode} {source} -> {target}")
+            return link_mode
+        
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            return self._deploy(source, target, link_mode)
+        except OSError as e:
+            print(f"Error copying {source} to {target}: {e}")
+            return None
+    
+    def copy_files(self, files: List[Tuple[Path, Path]], link_mode: str = "copy",
+                   link_modes: Optional[Dict[Path, str]] = None, skip_identical: bool = True,
+                   max_workers: int = 8, source_hashes: Optional[Dict[Path, str]] = None) -> Dict[str, Any]:
+        """
+        Deploy many files at once on a thread pool
+        
+        Target directories are created once up front. Every source is hashed
+        (sha256) while it is deployed, so callers can record it without
+        reading the file again.
+        
+        Args:
+            files: List of (source, target) tuples
+            link_mode: Link mode for all files (see deploy_file)
+            link_modes: Per-target link modes overriding link_mode
+            skip_identical: Leave targets whose size and hash match the source
+            max_workers: Maximum concurrent copies (1 copies serially)
+            source_hashes: Known sha256 of sources, which are then not re-read
+            
+        Returns:
+            Dict with "copied" and "skipped" target lists, "failed" mapping
+            target to error message (including unknown link modes),
+            "link_modes" mapping copied target to the mode used and "hashes"
+            mapping target to its source's sha256
+        """
+        link_modes = link_modes or {}
+        source_hashes = source_hashes or {}
+        report = {"copied": [], "skipped": [], "failed": {}, "link_modes": {}, "hashes": {}}
+        
+        for _, target in files:
+            mode = link_modes.get(target, link_mode)
+            if mode not in LINK_MODES:
+                report["failed"][target] = f"Unknown link mode: {mode}"
+        files = [(source, target) for source, target in files if target not in report["failed"]]
+        
+        if self.dry_run:
+            for source, target in files:
+                print(f"[DRY RUN] Would {link_modes.get(target, link_mode)} {source} -> {target}")
+                report["copied"].append(target)
+                report["link_modes"][target] = link_modes.get(target, link_mode)
+            return report
+        
+        for directory in sorted({target.parent for _, target in files}):
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                for _, target in files:
+                    if target.parent == directory:
+                        report["failed"][target] = f"Could not create {directory}: {e}"
+        
+        def deploy(source: Path, target: Path) -> Tuple[str, Optional[str]]:
+            source_hash = source_hashes.get(source) or self.get_file_hash(source)
+            if source_hash is None:
+                raise OSError(f"Source file not readable: {source}")
+            if (skip_identical and target.is_file() and
+                    target.stat().st_size == source.stat().st_size and
+                    self.get_file_hash(target) == source_hash):
+                return source_hash, None
+            return source_hash, self._deploy(source, target, link_modes.get(target, link_mode))
+        
+        pending = [(source, target) for source, target in files if target not in report["failed"]]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending) or 1))) as executor:
+            futures = [(target, executor.submit(deploy, source, target)) for source, target in pending]
+            for target, future in futures:
+                try:
+                    source_hash, used_mode = future.result()
+                except OSError as e:
+                    report["failed"][target] = str(e)
+                    continue
+                
+                report["hashes"][target] = source_hash
+                if used_mode is None:
+                    report["skipped"].append(target)
+                else:
+                    report["copied"].append(target)
+                    report["link_modes"][target] = used_mode
+        
+        return report
+    
+    def _deploy(self, source: Path, target: Path, link_mode: str) -> str:
+        """
+        Deploy a file into an existing directory (see deploy_file)
+        
+        Returns:
+            Link mode actually used
+            
+        Raises:
+            OSError: If not even a copy succeeded
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link_mode}")
+        
+        temp_path = target.with_name(f".{target.name}.deploy")
+        
+        for mode in dict.fromkeys([link_mode, "copy"]):
+            try:
+                if os.path.lexists(temp_path):
+                    os.unlink(temp_path)
+                
+                if mode == "hardlink":
+                    os.link(source, temp_path)
+                elif mode == "symlink":
+                    os.symlink(source.resolve(), temp_path)
+                elif mode == "reflink":
+                    self._reflink(source, temp_path)
+                else:
+                    shutil.copy2(source, temp_path)
+                
+                os.replace(temp_path, target)
+                self.copied_files.append(target)
+                return mode
+            except OSError:
+                if os.path.lexists(temp_path):
+                    os.unlink(temp_path)
+                if mode == "copy":
+                    raise
+        
+        raise OSError(f"Could not deploy {source}")  # Unreachable: copy is always tried
+    
+    def _reflink(self, source: Path, target: Path) -> None:
+        """
+        Clone a file's data without copying it (copy-on-write filesystems)
+        
+        Raises:
+            OSError: If the platform or filesystem cannot clone
+        """
+        if fcntl is None or not sys.platform.startswith("linux"):
+            raise OSError("reflink is not supported on this platform")
+        
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except OSError:
+                dst.close()
+                os.unlink(target)
+                raise
+        shutil.copystat(source, target)
+    
+    def is_linked(self, target: Path, source: Path) -> bool:
+        """
+        Check whether an installed file is a hardlink or symlink to its source
+        
+        Args:
+            target: Installed file path
+            source: Source file path
+            
+        Returns:
+            True if target shares its source's inode or points at it
+        """
+        try:
+            return os.path.samefile(target, source)
+        except OSError:
+            return False
         
     def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
         """
@@ -50,6 +252,10 @@ class FileService:
             # Ensure target directory exists
             target.parent.mkdir(parents=True, exist_ok=True)
             
+            # Replace linked targets instead of writing through to their source
+            if target.is_symlink() or (target.exists() and target.stat().st_nlink > 1):
+                target.unlink()
+            
             # Copy file
             if preserve_permissions:
                 shutil.copy2(source, target)
@@ -158,7 +364,7 @@ class FileService:
         Returns:
             True if successful, False otherwise
         """
-        if not file_path.exists():
+        if not os.path.lexists(file_path):
             return True  # Already gone
         
         if self.dry_run:
@@ -166,7 +372,8 @@ class FileService:
             return True
         
         try:
-            if file_path.is_file():
+            # Symlinks (including dangling ones) are removed, never their source
+            if file_path.is_symlink() or file_path.is_file():
                 file_path.unlink()
             else:
                 print(f"Warning: {file_path} is not a file, skipping")
@@ -0,0 +1,286 @@
+"""
+Local artifact cache for MCP server packages
+`SuperClaude mcp prefetch` resolves MCP servers into npm tarballs (installed
+into a private prefix) and Python wheels, pinned in a lockfile, so installs
+can register servers without touching the network
+"""
+
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.logger import get_logger
+from ..utils.paths import get_cache_directory
+
+
+class MCPArtifactCache:
+    """
+    Directory of prefetched MCP server artifacts plus a lockfile
+
+    Layout (all lockfile paths are relative, so the directory can be copied
+    to other machines):
+        mcp-lock.json            Exact versions, artifact paths and sha256
+        npm/<name>-<ver>.tgz     Packed npm package
+        npm/<name>-<ver>/        Package and dependencies installed offline-ready
+        uv/<server>/*.whl        Wheel of the server and all its dependencies
+    """
+
+    CACHE_SUBDIR = "mcp"
+    LOCK_NAME = "mcp-lock.json"
+    LOCK_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 runner: Optional[Callable[..., subprocess.CompletedProcess]] = None,
+                 install_dir: Optional[Path] = None):
+        """
+        Initialize artifact cache
+
+        Args:
+            cache_dir: Cache directory (defaults to "mcp" in the cache
+                directory of install_dir, which backups exclude)
+            runner: Function running a command list (defaults to subprocess.run
+                    with captured text output)
+            install_dir: Installation directory (defaults to ~/.claude)
+        """
+        if cache_dir is None:
+            from .. import DEFAULT_INSTALL_DIR
+            cache_dir = get_cache_directory(install_dir or DEFAULT_INSTALL_DIR) / self.CACHE_SUBDIR
+        self.cache_dir = cache_dir
+        self.lock_file = self.cache_dir / self.LOCK_NAME
+        self.runner = runner or self._run
+        self.logger = get_logger()
+        self._servers: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def resolve_source(server_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Work out which package an MCP server definition runs
+
+        Args:
+            server_info: Server definition from MCPComponent.mcp_servers
+
+        Returns:
+            {"type": "npm", "spec": ...} or {"type": "uv", "spec": ...,
+            "entry": ..., "args": [...]}, or None if it cannot be cached
+        """
+        if server_info.get("npm_package"):
+            return {"type": "npm", "spec": server_info["npm_package"]}
+
+        for key in ("run_command", "install_command"):
+            command = server_info.get(key)
+            if not command:
+                continue
+            tokens = shlex.split(command)
+            if tokens[0] == "npx":
+                specs = [token for token in tokens[1:] if not token.startswith("-")]
+                if specs:
+                    return {"type": "npm", "spec": specs[0]}
+            elif tokens[0] == "uvx" and "--from" in tokens:
+                index = tokens.index("--from")
+                if len(tokens) > index + 2:
+                    return {"type": "uv", "spec": tokens[index + 1], "entry": tokens[index + 2],
+                            "args": tokens[index + 3:]}
+        return None
+
+    def prefetch(self, name: str, server_info: Dict[str, Any], timeout: int = 900) -> Dict[str, Any]:
+        """
+        Download a server's artifacts and pin them in the lockfile
+
+        Args:
+            name: Server name
+            server_info: Server definition from MCPComponent.mcp_servers
+            timeout: Timeout in seconds for each download/build step
+
+        Returns:
+            The new lockfile entry
+
+        Raises:
+            ValueError: If the server cannot be cached
+            RuntimeError: If a download or build step fails
+        """
+        source = self.resolve_source(server_info)
+        if source is None:
+            raise ValueError(f"Don't know how to prefetch MCP server {name}")
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if source["type"] == "npm":
+            entry = self._prefetch_npm(source, timeout)
+        else:
+            entry = self._prefetch_uv(name, source, timeout)
+        entry["fetched"] = time.time()
+
+        self.load_lock()[name] = entry
+        self._save_lock()
+        return entry
+
+    def verify(self, name: str) -> bool:
+        """Check that a server's cached artifacts exist and match the lockfile"""
+        entry = self.load_lock().get(name)
+        if not entry:
+            return False
+
+        artifact = self.cache_dir / entry["artifact"]
+        if entry["type"] == "npm":
+            return (artifact.is_file() and self._hash_file(artifact) == entry.get("sha256") and
+                    self._npm_bin_path(entry).exists())
+        return artifact.is_dir() and self._hash_wheels(artifact) == entry.get("sha256")
+
+    def offline_command(self, name: str) -> Optional[List[str]]:
+        """
+        Get the command that runs a cached server without network access
+
+        Args:
+            name: Server name
+
+        Returns:
+            Command list for `claude mcp add`, or None if not (validly) cached
+        """
+        if not self.verify(name):
+            return None
+
+        entry = self.load_lock()[name]
+        if entry["type"] == "npm":
+            return [str(self._npm_bin_path(entry))]
+
+        wheel_dir = self.cache_dir / entry["artifact"]
+        return ["uvx", "--offline", "--no-index", "--find-links", str(wheel_dir),
+                "--from", str(wheel_dir / entry["wheel"]), entry["entry"]] + entry.get("args", [])
+
+    def load_lock(self) -> Dict[str, Dict[str, Any]]:
+        """Load lockfile entries by server name, starting empty if missing or unreadable"""
+        if self._servers is None:
+            self._servers = {}
+            if self.lock_file.exists():
+                try:
+                    with open(self.lock_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if data.get("version") == self.LOCK_VERSION:
+                        self._servers = data.get("servers", {})
+                except (json.JSONDecodeError, IOError, AttributeError) as e:
+                    self.logger.warning(f"Ignoring unreadable MCP lockfile {self.lock_file}: {e}")
+        return self._servers
+
+    def _save_lock(self) -> None:
+        """Write the lockfile atomically"""
+        temp_path = self.lock_file.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": self.LOCK_VERSION, "servers": self._servers}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.lock_file)
+
+    def _prefetch_npm(self, source: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """Pack an npm package and install it with its dependencies into a private prefix"""
+        npm_dir = self.cache_dir / "npm"
+        npm_dir.mkdir(parents=True, exist_ok=True)
+
+        result = self._check(["npm", "pack", source["spec"], "--json", "--pack-destination", str(npm_dir)], timeout)
+        info = json.loads(result.stdout)[0]
+        tarball = npm_dir / info["filename"]
+
+        prefix = npm_dir / tarball.name[:-len(".tgz")]
+        if prefix.exists():
+            shutil.rmtree(prefix)
+        self._check(["npm", "install", "--prefix", str(prefix), "--no-audit", "--no-fund",
+                     "--omit=dev", str(tarball)], timeout)
+
+        entry = {
+            "type": "npm",
+            "spec": source["spec"],
+            "package": info["name"],
+            "version": info["version"],
+            "integrity": info.get("integrity"),
+            "artifact": tarball.relative_to(self.cache_dir).as_posix(),
+            "sha256": self._hash_file(tarball),
+            "prefix": prefix.relative_to(self.cache_dir).as_posix(),
+        }
+        entry["bin"] = self._get_npm_bin(prefix / "node_modules" / info["name"] / "package.json", info["name"])
+        return entry
+
+    def _prefetch_uv(self, name: str, source: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """Build wheels for a Python server and its dependencies, pinning git sources to a commit"""
+        spec = pinned = source["spec"]
+        if spec.startswith("git+") and "@" not in spec.split("://", 1)[-1]:
+            result = self._check(["git", "ls-remote", spec[len("git+"):], "HEAD"], timeout)
+            pinned = f"{spec}@{result.stdout.split()[0]}"
+
+        wheel_dir = self.cache_dir / "uv" / name
+        if wheel_dir.exists():
+            shutil.rmtree(wheel_dir)
+        top_dir = wheel_dir / ".top"
+        top_dir.mkdir(parents=True)
+
+        # Build the server itself first to know which wheel is the entry point,
+        # then collect its dependencies next to it
+        self._check([sys.executable, "-m", "pip", "wheel", "--no-deps", "--wheel-dir", str(top_dir), pinned], timeout)
+        wheels = list(top_dir.glob("*.whl"))
+        if len(wheels) != 1:
+            raise RuntimeError(f"Expected one wheel for {pinned}, got {[w.name for w in wheels]}")
+        main_wheel = wheel_dir / wheels[0].name
+        shutil.move(str(wheels[0]), str(main_wheel))
+        shutil.rmtree(top_dir)
+        self._check([sys.executable, "-m", "pip", "wheel", "--wheel-dir", str(wheel_dir),
+                     "--find-links", str(wheel_dir), str(main_wheel)], timeout)
+
+        package, version = main_wheel.name.split("-")[:2]
+        return {
+            "type": "uv",
+            "spec": spec,
+            "pinned": pinned,
+            "package": package,
+            "version": version,
+            "wheel": main_wheel.name,
+            "entry": source["entry"],
+            "args": source.get("args", []),
+            "artifact": wheel_dir.relative_to(self.cache_dir).as_posix(),
+            "sha256": self._hash_wheels(wheel_dir),
+        }
+
+    def _get_npm_bin(self, package_json: Path, package: str) -> str:
+        """Get the executable an installed npm package exposes"""
+        with open(package_json, 'r', encoding='utf-8') as f:
+            bins = json.load(f).get("bin")
+        unscoped = package.split("/")[-1]
+        if isinstance(bins, str) or not bins:
+            return unscoped
+        return unscoped if unscoped in bins else sorted(bins)[0]
+
+    def _npm_bin_path(self, entry: Dict[str, Any]) -> Path:
+        """Get the path of a cached npm server's executable"""
+        suffix = ".cmd" if sys.platform == "win32" else ""
+        return self.cache_dir / entry["prefix"] / "node_modules" / ".bin" / f"{entry['bin']}{suffix}"
+
+    def _hash_file(self, path: Path) -> str:
+        """Get a file's sha256"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _hash_wheels(self, wheel_dir: Path) -> str:
+        """Get one sha256 over the names and contents of all wheels in a directory"""
+        digest = hashlib.sha256()
+        for wheel in sorted(wheel_dir.glob("*.whl")):
+            digest.update(f"{wheel.name}:{self._hash_file(wheel)}\n".encode())
+        return digest.hexdigest()
+
+    def _check(self, cmd: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """Run a prefetch step, raising RuntimeError if it fails"""
+        self.logger.debug(f"Running: {' '.join(cmd)}")
+        result = self.runner(cmd, timeout=timeout)
+        if result.returncode != 0:
+            error = (result.stderr or result.stdout or "").strip().splitlines()
+            raise RuntimeError(f"{' '.join(cmd[:3])} failed: {error[-1] if error else 'unknown error'}")
+        return result
+
+    @staticmethod
+    def _run(cmd: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """Run a command with captured text output"""
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
+                              shell=(sys.platform == "win32"))
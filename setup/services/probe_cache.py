@@ -0,0 +1,153 @@
+"""
+Persistent cache of tool probe results for SuperClaude system validation
+Probes like `node --version` are keyed on the resolved executable and its
+size/mtime, so they only run again when the toolchain changes
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils.logger import get_logger
+from ..utils.paths import get_cache_directory
+
+
+class ProbeCache:
+    """
+    On-disk cache of `<tool> --version` style command results
+
+    An entry is reused only while the executable it ran is unchanged (same
+    resolved path, size and mtime) and younger than the TTL.
+    """
+
+    CACHE_NAME = "probes.json"
+    CACHE_VERSION = 1
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, cache_file: Optional[Path] = None, ttl: int = DEFAULT_TTL,
+                 install_dir: Optional[Path] = None):
+        """
+        Initialize probe cache
+
+        Args:
+            cache_file: Cache file (defaults to probes.json in the cache
+                directory of install_dir)
+            ttl: Seconds an entry stays valid even if the executable is unchanged
+            install_dir: Installation directory (defaults to ~/.claude)
+        """
+        if cache_file is None:
+            from .. import DEFAULT_INSTALL_DIR
+            cache_file = get_cache_directory(install_dir or DEFAULT_INSTALL_DIR) / self.CACHE_NAME
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.logger = get_logger()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def run(self, cmd_parts: List[str], timeout: int = 10) -> subprocess.CompletedProcess:
+        """
+        Run a probe command, answering from the cache when possible
+
+        Args:
+            cmd_parts: Command and arguments
+            timeout: Subprocess timeout in seconds
+
+        Returns:
+            CompletedProcess with text stdout/stderr
+
+        Raises:
+            subprocess.TimeoutExpired, FileNotFoundError: As subprocess.run
+        """
+        fingerprint = self._fingerprint(cmd_parts[0])
+        key = " ".join(cmd_parts)
+
+        if fingerprint is not None:
+            with self._lock:
+                entry = self._load().get(key)
+            if entry and entry.get("executable") == fingerprint and time.time() - entry.get("checked", 0) < self.ttl:
+                return subprocess.CompletedProcess(cmd_parts, entry["returncode"], entry["stdout"], entry["stderr"])
+
+        result = subprocess.run(
+            cmd_parts,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            shell=(sys.platform == "win32")
+        )
+
+        # Only successful probes are cached; failures are retried next run
+        if fingerprint is not None and result.returncode == 0:
+            with self._lock:
+                self._load()[key] = {
+                    "executable": fingerprint,
+                    "checked": time.time(),
+                    "returncode": result.returncode,
+                    "stdout": result.stdout,
+                    "stderr": result.stderr
+                }
+                self._save()
+
+        return result
+
+    def clear(self) -> None:
+        """Forget all cached probes"""
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+    def _fingerprint(self, executable: str) -> Optional[List[Any]]:
+        """Get [resolved path, size, mtime_ns] of an executable on PATH"""
+        found = shutil.which(executable)
+        if not found:
+            return None
+
+        resolved = os.path.realpath(found)
+        try:
+            stat = os.stat(resolved)
+        except OSError:
+            return None
+        return [resolved, stat.st_size, stat.st_mtime_ns]
+
+    def _save(self) -> None:
+        """
+        Write cache entries atomically
+
+        Each writer uses its own temp file, so concurrent processes never
+        clobber each other's. The installation directory itself is not
+        created: the cache is only kept once something is installed there.
+        """
+        try:
+            self.cache_file.parent.mkdir(exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=self.cache_file.parent, prefix=f".{self.cache_file.name}.",
+                                             suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({"version": self.CACHE_VERSION, "probes": self._entries}, f, indent=2, sort_keys=True)
+                os.replace(temp_name, self.cache_file)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+        except OSError as e:
+            # The cache is an optimization; probing still works without it
+            self.logger.debug(f"Could not write probe cache {self.cache_file}: {e}")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cache entries, starting empty if missing or unreadable"""
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_file.exists():
+                try:
+                    with open(self.cache_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if data.get("version") == self.CACHE_VERSION:
+                        self._entries = data.get("probes", {})
+                except (json.JSONDecodeError, IOError, AttributeError) as e:
+                    self.logger.debug(f"Ignoring unreadable probe cache: {e}")
+        return self._entries
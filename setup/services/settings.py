@@ -5,12 +5,62 @@ Allows for manipulation of these json files with deep merge and backup
 """
 
 import json
+import os
 import shutil
-from typing import Dict, Any, Optional, List
+import tempfile
+import threading
+import functools
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, List
 from pathlib import Path
 from datetime import datetime
 import copy
 
+from ..utils.locking import InterProcessLock, fsync_directory, get_install_lock
+
+
+# Components may be installed concurrently (see Installer parallel mode), and
+# every component instance has its own SettingsService pointing at the same
+# files, so read-modify-write cycles are serialized process-wide. Separate
+# SuperClaude processes are serialized by a lock file in the install directory.
+_write_lock = threading.RLock()
+
+
+def _locked(method):
+    """Run a read-modify-write method under the shared settings locks"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with _write_lock, get_install_lock(self.install_dir):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _Transaction:
+    """Buffered settings/metadata state shared by one install directory"""
+
+    def __init__(self, process_lock: InterProcessLock):
+        self.depth = 0
+        self.buffers: Dict[str, Dict[str, Any]] = {}
+        self.dirty: set = set()
+        self.settings_backup = False
+        self.process_lock = process_lock
+
+
+# Open transactions by install directory, shared by every SettingsService
+# pointing at it (see SettingsService.transaction)
+_transactions: Dict[Path, _Transaction] = {}
+
+
+def _reset_after_fork() -> None:
+    """Drop the parent's open transactions in a forked child so its writes reach disk"""
+    global _write_lock
+    _transactions.clear()
+    _write_lock = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 class SettingsService:
     """Manages settings.json file operations"""
@@ -26,6 +76,100 @@ class SettingsService:
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".superclaude-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
+        self._transaction_key = Path(os.path.abspath(install_dir))
+    
+    @contextmanager
+    def transaction(self) -> Iterator["SettingsService"]:
+        """
+        Batch settings and metadata changes into one write per file
+        
+        While a transaction is open, every SettingsService for this install
+        directory (in any thread) reads and writes an in-memory copy. The
+        outermost transaction writes each changed file once, atomically, when
+        it exits; an exception discards the buffered changes.
+        
+        The install directory's cross-process lock is held from the first
+        read to the final write, so other SuperClaude processes wait instead
+        of having their changes overwritten by the buffered copy.
+        
+        Yields:
+            This settings service
+        """
+        with _write_lock:
+            txn = _transactions.get(self._transaction_key)
+            if txn is None:
+                process_lock = get_install_lock(self.install_dir)
+                process_lock.acquire()
+                txn = _transactions[self._transaction_key] = _Transaction(process_lock)
+            txn.depth += 1
+        
+        committed = False
+        try:
+            yield self
+            committed = True
+        finally:
+            with _write_lock:
+                txn.depth -= 1
+                if txn.depth == 0:
+                    del _transactions[self._transaction_key]
+                    try:
+                        if committed:
+                            self._flush_transaction(txn)
+                    finally:
+                        txn.process_lock.release()
+    
+    def _flush_transaction(self, txn: _Transaction) -> None:
+        """Write the files changed in a transaction"""
+        if "settings" in txn.dirty:
+            if txn.settings_backup and self.settings_file.exists():
+                self._create_settings_backup()
+            self._write_json(self.settings_file, txn.buffers["settings"], "settings")
+        if "metadata" in txn.dirty:
+            self._write_json(self.metadata_file, txn.buffers["metadata"], "metadata")
+    
+    def _buffered(self, name: str, loader) -> Dict[str, Any]:
+        """Load a file, going through the open transaction's buffer if any"""
+        txn = _transactions.get(self._transaction_key)
+        if txn is None:
+            return loader()
+        if name not in txn.buffers:
+            txn.buffers[name] = loader()
+        return copy.deepcopy(txn.buffers[name])
+    
+    def _buffer_write(self, name: str, data: Dict[str, Any]) -> Optional[_Transaction]:
+        """Stage a write in the open transaction; None if there is none"""
+        txn = _transactions.get(self._transaction_key)
+        if txn is not None:
+            txn.buffers[name] = copy.deepcopy(data)
+            txn.dirty.add(name)
+        return txn
+    
+    def _write_json(self, path: Path, data: Dict[str, Any], label: str) -> None:
+        """
+        Write JSON atomically: a synced temp file in the same directory replaces the target
+        
+        Readers (in any process) see either the old or the new file, never a
+        partial one, and the new content is on disk once this returns.
+        
+        Raises:
+            ValueError: If the file could not be written
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_name, path)
+                fsync_directory(path.parent)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+        except (IOError, OSError) as e:
+            raise ValueError(f"Could not save {label} to {path}: {e}")
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -34,6 +178,10 @@ class SettingsService:
         Returns:
             Settings dict (empty if file doesn't exist)
         """
+        return self._buffered("settings", self._read_settings_file)
+    
+    def _read_settings_file(self) -> Dict[str, Any]:
+        """Read settings.json from disk"""
         if not self.settings_file.exists():
             return {}
         
@@ -51,19 +199,17 @@ class SettingsService:
             settings: Settings dict to save
             create_backup: Whether to create backup before saving
         """
+        txn = self._buffer_write("settings", settings)
+        if txn is not None:
+            # Back up once, when the transaction is written
+            txn.settings_backup |= create_backup
+            return
+        
         # Create backup if requested and file exists
         if create_backup and self.settings_file.exists():
             self._create_settings_backup()
         
-        # Ensure directory exists
-        self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save with pretty formatting
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
+        self._write_json(self.settings_file, settings, "settings")
     
     def load_metadata(self) -> Dict[str, Any]:
         """
@@ -72,6 +218,10 @@ class SettingsService:
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
+        return self._buffered("metadata", self._read_metadata_file)
+    
+    def _read_metadata_file(self) -> Dict[str, Any]:
+        """Read .superclaude-metadata.json from disk"""
         if not self.metadata_file.exists():
             return {}
         
@@ -88,15 +238,10 @@ class SettingsService:
         Args:
             metadata: Metadata dict to save
         """
-        # Ensure directory exists
-        self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
+        if self._buffer_write("metadata", metadata) is not None:
+            return
         
-        # Save with pretty formatting
-        try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
+        self._write_json(self.metadata_file, metadata, "metadata")
 
     def merge_metadata(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -111,6 +256,7 @@ class SettingsService:
         existing = self.load_metadata()
         return self._deep_merge(existing, modifications)
 
+    @_locked
     def update_metadata(self, modifications: Dict[str, Any]) -> None:
         """
         Update settings with modifications
@@ -122,6 +268,7 @@ class SettingsService:
         merged = self.merge_metadata(modifications)
         self.save_metadata(merged)
 
+    @_locked
     def migrate_superclaude_data(self) -> bool:
         """
         Migrate SuperClaude-specific data from settings.json to metadata file
@@ -173,6 +320,7 @@ class SettingsService:
         existing = self.load_settings()
         return self._deep_merge(existing, modifications)
     
+    @_locked
     def update_settings(self, modifications: Dict[str, Any], create_backup: bool = True) -> None:
         """
         Update settings with modifications
@@ -227,6 +375,7 @@ class SettingsService:
         
         self.update_settings(modification, create_backup)
     
+    @_locked
     def remove_setting(self, key_path: str, create_backup: bool = True) -> bool:
         """
         Remove setting using dot-notation path
@@ -258,6 +407,7 @@ class SettingsService:
         except (KeyError, TypeError):
             return False
     
+    @_locked
     def add_component_registration(self, component_name: str, component_info: Dict[str, Any]) -> None:
         """
         Add component to registry in metadata
@@ -277,6 +427,7 @@ class SettingsService:
         
         self.save_metadata(metadata)
     
+    @_locked
     def remove_component_registration(self, component_name: str) -> bool:
         """
         Remove component from registry in metadata
@@ -290,10 +441,36 @@ class SettingsService:
         metadata = self.load_metadata()
         if "components" in metadata and component_name in metadata["components"]:
             del metadata["components"][component_name]
+            metadata.get("file_manifests", {}).pop(component_name, None)
             self.save_metadata(metadata)
             return True
         return False
     
+    def get_file_manifest(self, component_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the installed file manifest of a component
+        
+        Args:
+            component_name: Name of component
+            
+        Returns:
+            Dict mapping install-relative path to {size, mtime, sha256}
+        """
+        return self.load_metadata().get("file_manifests", {}).get(component_name, {})
+    
+    @_locked
+    def set_file_manifest(self, component_name: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Replace the installed file manifest of a component
+        
+        Args:
+            component_name: Name of component
+            manifest: Dict mapping install-relative path to {size, mtime, sha256}
+        """
+        metadata = self.load_metadata()
+        metadata.setdefault("file_manifests", {})[component_name] = manifest
+        self.save_metadata(metadata)
+    
     def get_installed_components(self) -> Dict[str, Dict[str, Any]]:
         """
         Get all installed components from registry
@@ -331,6 +508,7 @@ class SettingsService:
         component_info = components.get(component_name, {})
         return component_info.get("version")
     
+    @_locked
     def update_framework_version(self, version: str) -> None:
         """
         Update SuperClaude framework version in metadata
@@ -0,0 +1,224 @@
+"""
+Compact variants of the framework Markdown docs
+Strips example sections, decorative rules and table padding and collapses
+whitespace, so docs @imported into every Claude Code session cost fewer
+tokens. Packages ship them prebuilt next to the full docs, in a `compact/`
+subdirectory, by scripts/build_compact_docs.py; when those are missing or
+stale, installs build them into the installation's cache directory.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Bump when compact_markdown output changes so stale builds are redone
+COMPACT_VERSION = "1"
+
+COMPACT_DIR_NAME = "compact"
+BUILD_MANIFEST = ".build.json"
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+RULE_RE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+TABLE_SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+EXAMPLE_HEADING_RE = re.compile(r"\bexamples?\b", re.IGNORECASE)
+EXAMPLE_LABEL_RE = re.compile(r"^\s*\*\*[^*]*\bexamples?\b[^*]*\*\*:?\s*$", re.IGNORECASE)
+HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+def compact_markdown(text: str, sections: Optional[Iterable[str]] = None) -> str:
+    """
+    Produce the compact variant of a framework doc
+
+    Args:
+        text: Full Markdown document
+        sections: Optional allowlist of section titles; when given, only the
+            preamble (everything before the first second-level heading) and
+            the listed `##` sections with their subsections are kept
+
+    Returns:
+        Compact Markdown
+    """
+    allowed = {title.strip().lower() for title in sections} if sections is not None else None
+    lines = HTML_COMMENT_RE.sub("", text).splitlines()
+
+    output: List[str] = []
+    skip_level = 0          # Heading level of the section being dropped (0 = keeping)
+    in_fence = False
+    drop_fence = False      # Current fenced block belongs to an example
+    pending_example = False  # An "**Example**:" label was just dropped
+    front_matter = bool(lines) and lines[0].strip() == "---"
+
+    for index, line in enumerate(lines):
+        if front_matter:
+            output.append(line.rstrip())
+            if index > 0 and line.strip() == "---":
+                front_matter = False
+            continue
+
+        if in_fence:
+            if not drop_fence and not skip_level:
+                output.append(line.rstrip())
+            if FENCE_RE.match(line):
+                in_fence = False
+            continue
+
+        if FENCE_RE.match(line):
+            in_fence = True
+            drop_fence = pending_example
+            pending_example = False
+            if not drop_fence and not skip_level:
+                output.append(line.rstrip())
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            level, title = len(heading.group(1)), heading.group(2)
+            pending_example = False
+            if skip_level and level > skip_level:
+                continue
+            skip_level = 0
+            if level > 1 and EXAMPLE_HEADING_RE.search(title):
+                skip_level = level
+                continue
+            if allowed is not None and level == 2 and title.strip().lower() not in allowed:
+                skip_level = level
+                continue
+            output.append(f"{heading.group(1)} {title}")
+            continue
+
+        if skip_level:
+            continue
+
+        if EXAMPLE_LABEL_RE.match(line):
+            pending_example = True
+            continue
+        if pending_example and line.strip():
+            # Examples given as indented or plain lines after the label
+            if line.startswith((" ", "\t", "-", "*", ">")) or line.strip()[0].isdigit():
+                continue
+            pending_example = False
+
+        if RULE_RE.match(line) or TABLE_SEPARATOR_RE.match(line) and "|" in line:
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith("|") and stripped.endswith("|") and len(stripped) > 1:
+            cells = [cell.strip() for cell in re.split(r"(?<!\\)\|", stripped[1:-1])]
+            output.append("|".join(cells))
+            continue
+
+        output.append(line.rstrip())
+
+    return _collapse_blank_lines(output)
+
+
+def _collapse_blank_lines(lines: List[str]) -> str:
+    """Join lines, dropping blank lines after headings and repeated blank lines"""
+    result: List[str] = []
+    for line in lines:
+        if not line.strip():
+            if not result or not result[-1].strip() or HEADING_RE.match(result[-1]):
+                continue
+            line = ""
+        result.append(line)
+    while result and not result[-1].strip():
+        result.pop()
+    return "\n".join(result) + "\n"
+
+
+def _load_build_manifest(compact_dir: Path) -> Dict[str, str]:
+    """Build keys by filename of a compact directory, empty if unknown or outdated"""
+    try:
+        with open(compact_dir / BUILD_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != COMPACT_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+
+def _build_key(text: str, sections: Optional[List[str]]) -> str:
+    return hashlib.sha256(json.dumps([text, sections]).encode('utf-8')).hexdigest()
+
+
+def compact_docs_current(source_dir: Path, files: Iterable[str],
+                         sections: Optional[Dict[str, List[str]]] = None,
+                         compact_dir: Optional[Path] = None) -> bool:
+    """
+    Check whether compact docs are built and up to date, without writing
+
+    Args:
+        source_dir: Directory with the full docs
+        files: Doc filenames that must be built
+        sections: Optional section allowlists by filename
+        compact_dir: Compact directory (defaults to `<source_dir>/compact`)
+
+    Returns:
+        True if every file has a current compact variant
+    """
+    sections = sections or {}
+    compact_dir = compact_dir or source_dir / COMPACT_DIR_NAME
+    built = _load_build_manifest(compact_dir)
+    for name in files:
+        try:
+            text = (source_dir / name).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return False
+        if built.get(name) != _build_key(text, sections.get(name)) or not (compact_dir / name).exists():
+            return False
+    return True
+
+
+def build_compact_docs(source_dir: Path, files: Iterable[str],
+                       sections: Optional[Dict[str, List[str]]] = None,
+                       compact_dir: Optional[Path] = None) -> Path:
+    """
+    Build (or refresh) compact variants of docs
+
+    Files are only rewritten when their source, section allowlist or
+    COMPACT_VERSION changed since the last build.
+
+    Args:
+        source_dir: Directory with the full docs
+        files: Doc filenames to build
+        sections: Optional section allowlists by filename
+        compact_dir: Output directory (defaults to `<source_dir>/compact`)
+
+    Returns:
+        The compact directory
+
+    Raises:
+        OSError: If the compact directory can't be written
+    """
+    sections = sections or {}
+    compact_dir = compact_dir or source_dir / COMPACT_DIR_NAME
+    manifest_path = compact_dir / BUILD_MANIFEST
+    built = _load_build_manifest(compact_dir)
+
+    changed = False
+    for name in files:
+        source = source_dir / name
+        text = source.read_text(encoding='utf-8')
+        key = _build_key(text, sections.get(name))
+        target = compact_dir / name
+        if built.get(name) == key and target.exists():
+            continue
+
+        compact_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{name}.tmp")
+        temp_path.write_text(compact_markdown(text, sections.get(name)), encoding='utf-8')
+        os.replace(temp_path, target)
+        built[name] = key
+        changed = True
+
+    if changed:
+        temp_path = manifest_path.with_name(f"{BUILD_MANIFEST}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": COMPACT_VERSION, "files": built}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, manifest_path)
+    return compact_dir
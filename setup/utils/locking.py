@@ -0,0 +1,154 @@
+"""
+Cross-process file locking for SuperClaude installation system
+Uses advisory fcntl locks on POSIX and msvcrt byte-range locks on Windows
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+class InterProcessLock:
+    """
+    Exclusive lock on a lock file, shared by all processes using the same path
+
+    The lock is held by the process, not by a thread, and is re-entrant:
+    nested acquisitions (from any thread) only increase a counter. Callers
+    still serialize their own threads (see SettingsService) around the data
+    it protects.
+    """
+
+    def __init__(self, lock_file: Path):
+        """
+        Initialize lock
+
+        Args:
+            lock_file: Lock file path (created if missing)
+        """
+        self.lock_file = lock_file
+        self._fd: Optional[int] = None
+        self._depth = 0
+        self._guard = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the lock is held by this process"""
+        with self._guard:
+            self._acquire()
+
+    def _acquire(self) -> None:
+        if self._depth == 0:
+            self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                elif msvcrt is not None:
+                    # LK_LOCK retries for ~10s before raising; keep waiting
+                    while True:
+                        try:
+                            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                            break
+                        except OSError:
+                            continue
+            except BaseException:
+                os.close(fd)
+                raise
+            self._fd = fd
+        self._depth += 1
+
+    def release(self) -> None:
+        """Release one acquisition, unlocking after the outermost one"""
+        with self._guard:
+            self._release()
+
+    def _release(self) -> None:
+        if self._depth == 0:
+            raise RuntimeError("Lock released more times than acquired")
+
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+
+    def __enter__(self) -> "InterProcessLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+# Name of the lock file serializing SuperClaude processes on an install directory
+LOCK_FILE_NAME = ".superclaude.lock"
+
+_install_locks: Dict[Path, InterProcessLock] = {}
+_install_locks_guard = threading.Lock()
+
+
+def get_install_lock(install_dir: Path) -> InterProcessLock:
+    """
+    Get the cross-process lock of an installation directory
+
+    Every caller in a process gets the same lock object, so nested use only
+    increases its counter.
+
+    Args:
+        install_dir: Installation directory holding the lock file
+
+    Returns:
+        The shared InterProcessLock
+    """
+    lock_file = Path(os.path.abspath(install_dir)) / LOCK_FILE_NAME
+    with _install_locks_guard:
+        if lock_file not in _install_locks:
+            _install_locks[lock_file] = InterProcessLock(lock_file)
+        return _install_locks[lock_file]
+
+
+def _reset_install_locks() -> None:
+    """Forget inherited locks in a forked child; it must take them itself"""
+    global _install_locks_guard
+    _install_locks.clear()
+    _install_locks_guard = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_install_locks)
+
+
+def fsync_directory(directory: Path) -> None:
+    """
+    Flush a directory entry so a rename into it survives a crash
+
+    No-op where directories cannot be opened (Windows).
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -6,7 +6,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TextIO
 from enum import Enum
 
 from .ui import Colors
@@ -40,6 +40,7 @@ class Logger:
         self.log_dir = log_dir or (get_home_directory() / ".claude" / "logs")
         self.console_level = console_level
         self.file_level = file_level
+        self.console_stream: TextIO = sys.stdout
         self.session_start = datetime.now()
         
         # Create logger
@@ -63,7 +64,7 @@ class Logger:
     
     def _setup_console_handler(self) -> None:
         """Setup colorized console handler"""
-        handler = logging.StreamHandler(sys.stdout)
+        handler = logging.StreamHandler(self.console_stream)
         handler.setLevel(self.console_level.value)
         
         # Custom formatter with colors
@@ -249,6 +250,12 @@ class Logger:
         if self.logger.handlers:
             self.logger.handlers[0].setLevel(level.value)
     
+    def set_console_stream(self, stream: TextIO) -> None:
+        """Change the stream console logging writes to"""
+        self.console_stream = stream
+        if self.logger.handlers:
+            self.logger.handlers[0].setStream(stream)
+    
     def set_file_level(self, level: LogLevel) -> None:
         """Change file logging level"""
         self.file_level = level
@@ -6,6 +6,9 @@ Handles cross-platform path operations and immutable distro support
 import os
 from pathlib import Path
 
+# Directory of local caches inside an installation directory (never backed up)
+CACHE_DIR_NAME = ".superclaude-cache"
+
 
 def get_home_directory() -> Path:
     """
@@ -51,4 +54,20 @@ def get_home_directory() -> Path:
 
     # Method 3: Last resort - use the original Path.home() even if it seems wrong
     # This ensures we don't crash the installation
-    return Path.home()
\ No newline at end of file
+    return Path.home()
+
+
+def get_cache_directory(install_dir: Path) -> Path:
+    """
+    Get the directory holding SuperClaude's local caches for an installation
+
+    Caches live inside the installation directory so they follow
+    --install-dir; the directory is excluded from backups.
+
+    Args:
+        install_dir: Installation directory
+
+    Returns:
+        Path: The cache directory (not created)
+    """
+    return install_dir / CACHE_DIR_NAME
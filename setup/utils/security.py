@@ -29,12 +29,28 @@ Architecture:
 
 import re
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Set
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Set
 import urllib.parse
 from .paths import get_home_directory
 
 
+def _compile_alternation(patterns: List[str]) -> Pattern:
+    """
+    Compile patterns into one case-insensitive alternation
+
+    Each pattern becomes a named group (p0, p1, ...) so the pattern that
+    matched can be recovered with _matched_pattern().
+    """
+    return re.compile("|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(patterns)), re.IGNORECASE)
+
+
+def _matched_pattern(match: "re.Match", patterns: List[str]) -> str:
+    """Get the source pattern of an alternation match"""
+    return patterns[int(match.lastgroup[1:])]
+
+
 class SecurityValidator:
     """Security validation utilities"""
     
@@ -95,6 +111,15 @@ class SecurityValidator:
         r'\.secret',
     ]
     
+    # Pattern categories compiled once into single alternations
+    _TRAVERSAL_RE = _compile_alternation(TRAVERSAL_PATTERNS)
+    _UNIX_SYSTEM_RE = _compile_alternation(UNIX_SYSTEM_PATTERNS)
+    _WINDOWS_SYSTEM_RE = _compile_alternation(WINDOWS_SYSTEM_PATTERNS)
+    _DANGEROUS_FILENAMES_RE = _compile_alternation(DANGEROUS_FILENAMES)
+    
+    # Number of (path, base_dir) verdicts kept by validate_path
+    PATH_CACHE_SIZE = 32768
+    
     # Allowed file extensions for installation
     ALLOWED_EXTENSIONS = {
         '.md', '.json', '.py', '.js', '.ts', '.jsx', '.tsx',
@@ -106,6 +131,13 @@ class SecurityValidator:
     MAX_PATH_LENGTH = 4096
     MAX_FILENAME_LENGTH = 255
     
+    # Reserved Windows device names (checked without extension)
+    WINDOWS_RESERVED_NAMES = frozenset([
+        'CON', 'PRN', 'AUX', 'NUL',
+        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+    ])
+    
     @classmethod
     def validate_path(cls, path: Path, base_dir: Optional[Path] = None) -> Tuple[bool, str]:
         """
@@ -123,6 +155,7 @@ class SecurityValidator:
         - Applies platform-specific patterns for system directories
         - Checks traversal patterns against original path to catch attacks before normalization
         - Provides detailed error messages with actionable suggestions
+        - Caches verdicts per (path, base_dir); see clear_path_cache()
         
         Args:
             path: Path to validate (can be relative or absolute)
@@ -133,6 +166,29 @@ class SecurityValidator:
             - is_safe: True if path passes all security checks
             - error_message: Detailed error message with suggestions if validation fails
         """
+        return cls._validate_path_cached(path, base_dir)
+    
+    @classmethod
+    def clear_path_cache(cls) -> None:
+        """Forget cached validate_path verdicts (e.g. after symlinks changed)"""
+        cls._validate_path_cached.cache_clear()
+        cls._resolve_base_dir.cache_clear()
+    
+    @classmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
+    def _validate_path_cached(cls, path: Path, base_dir: Optional[Path]) -> Tuple[bool, str]:
+        """Memoized validate_path"""
+        return cls._check_path(path, base_dir)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _resolve_base_dir(cls, base_dir: Path) -> Path:
+        """Resolve a base directory once per process"""
+        return base_dir.resolve()
+    
+    @classmethod
+    def _check_path(cls, path: Path, base_dir: Optional[Path]) -> Tuple[bool, str]:
+        """Uncached validate_path"""
         try:
             # Convert to absolute path
             abs_path = path.resolve()
@@ -151,36 +207,18 @@ class SecurityValidator:
                 return False, f"Filename too long: {len(abs_path.name)} > {cls.MAX_FILENAME_LENGTH}"
             
             # Check for dangerous patterns using platform-specific validation
-            # Always check traversal patterns (platform independent) - use original path string
-            # to detect patterns before normalization removes them
-            original_str = str(path).lower()
-            for pattern in cls.TRAVERSAL_PATTERNS:
-                if re.search(pattern, original_str, re.IGNORECASE):
-                    return False, cls._get_user_friendly_error_message("traversal", pattern, abs_path)
-            
-            # Check platform-specific system directory patterns - use original path first, then resolved
-            # Always check both Windows and Unix patterns to handle cross-platform scenarios
-            
-            # Check Windows system directory patterns
-            for pattern in cls.WINDOWS_SYSTEM_PATTERNS:
-                if (re.search(pattern, original_path_str, re.IGNORECASE) or 
-                    re.search(pattern, resolved_path_str, re.IGNORECASE)):
-                    return False, cls._get_user_friendly_error_message("windows_system", pattern, abs_path)
-            
-            # Check Unix system directory patterns
-            for pattern in cls.UNIX_SYSTEM_PATTERNS:
-                if (re.search(pattern, original_path_str, re.IGNORECASE) or 
-                    re.search(pattern, resolved_path_str, re.IGNORECASE)):
-                    return False, cls._get_user_friendly_error_message("unix_system", pattern, abs_path)
+            error = cls._check_location_patterns(str(path), original_path_str, resolved_path_str, abs_path)
+            if error:
+                return False, error
             
             # Check for dangerous filenames
-            for pattern in cls.DANGEROUS_FILENAMES:
-                if re.search(pattern, abs_path.name, re.IGNORECASE):
-                    return False, f"Dangerous filename pattern detected: {pattern}"
+            error = cls._check_filename_patterns(abs_path.name)
+            if error:
+                return False, error
             
             # Check if path is within base directory
             if base_dir:
-                base_abs = base_dir.resolve()
+                base_abs = cls._resolve_base_dir(base_dir)
                 try:
                     abs_path.relative_to(base_abs)
                 except ValueError:
@@ -192,14 +230,8 @@ class SecurityValidator:
             
             # Check for Windows reserved names
             if os.name == 'nt':
-                reserved_names = [
-                    'CON', 'PRN', 'AUX', 'NUL',
-                    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-                    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-                ]
-                
                 name_without_ext = abs_path.stem.upper()
-                if name_without_ext in reserved_names:
+                if name_without_ext in cls.WINDOWS_RESERVED_NAMES:
                     return False, f"Reserved Windows filename: {name_without_ext}"
             
             return True, "Path is safe"
@@ -207,6 +239,51 @@ class SecurityValidator:
         except Exception as e:
             return False, f"Path validation error: {e}"
     
+    @classmethod
+    def _check_location_patterns(cls, raw_str: str, original_path_str: str, resolved_path_str: str,
+                                 report_path: Path) -> Optional[str]:
+        """
+        Check traversal and system directory patterns
+        
+        Args:
+            raw_str: Path as given, for traversal patterns (before normalization removes them)
+            original_path_str: Normalized original path
+            resolved_path_str: Normalized resolved path
+            report_path: Path named in error messages
+            
+        Returns:
+            Error message, or None if no pattern matched
+        """
+        # Always check traversal patterns (platform independent)
+        match = cls._TRAVERSAL_RE.search(raw_str)
+        if match:
+            pattern = _matched_pattern(match, cls.TRAVERSAL_PATTERNS)
+            return cls._get_user_friendly_error_message("traversal", pattern, report_path)
+        
+        # Check platform-specific system directory patterns - use original path first, then resolved
+        # Always check both Windows and Unix patterns to handle cross-platform scenarios
+        match = (cls._WINDOWS_SYSTEM_RE.search(original_path_str) or
+                 cls._WINDOWS_SYSTEM_RE.search(resolved_path_str))
+        if match:
+            pattern = _matched_pattern(match, cls.WINDOWS_SYSTEM_PATTERNS)
+            return cls._get_user_friendly_error_message("windows_system", pattern, report_path)
+        
+        match = (cls._UNIX_SYSTEM_RE.search(original_path_str) or
+                 cls._UNIX_SYSTEM_RE.search(resolved_path_str))
+        if match:
+            pattern = _matched_pattern(match, cls.UNIX_SYSTEM_PATTERNS)
+            return cls._get_user_friendly_error_message("unix_system", pattern, report_path)
+        
+        return None
+    
+    @classmethod
+    def _check_filename_patterns(cls, name: str) -> Optional[str]:
+        """Check a file name against DANGEROUS_FILENAMES, returning an error message or None"""
+        match = cls._DANGEROUS_FILENAMES_RE.search(name)
+        if match:
+            return f"Dangerous filename pattern detected: {_matched_pattern(match, cls.DANGEROUS_FILENAMES)}"
+        return None
+    
     @classmethod
     def validate_file_extension(cls, path: Path) -> Tuple[bool, str]:
         """
@@ -531,26 +608,147 @@ class SecurityValidator:
         Returns:
             Tuple of (all_safe: bool, error_messages: List[str])
         """
+        _, batch_errors = cls.validate_component_files_batch(file_list, base_source_dir, base_target_dir)
+        
         errors = []
+        for error in batch_errors:
+            for file_path in error["files"]:
+                if error["role"] == "extension":
+                    errors.append(f"File {file_path}: {error['message']}")
+                else:
+                    errors.append(f"Invalid {error['role']} path {file_path}: {error['message']}")
+        
+        return len(errors) == 0, errors
+    
+    @classmethod
+    def validate_component_files_batch(cls, file_list: List[Tuple[Path, Path]], base_source_dir: Path,
+                                       base_target_dir: Path) -> Tuple[bool, List[Dict[str, Any]]]:
+        """
+        Validate a component manifest, checking each directory only once
+        
+        Base directories are resolved once and traversal, system directory
+        and containment checks run once per unique parent directory. Only
+        filename checks (name patterns, length, extension, reserved names)
+        run per file. Files that are themselves symlinks are validated in
+        full with validate_path, since their target can be anywhere.
+        
+        Args:
+            file_list: List of (source, target) path tuples
+            base_source_dir: Base source directory
+            base_target_dir: Base target directory
+            
+        Returns:
+            Tuple of (all_safe: bool, errors: List[Dict]) where each error has
+            "role" ("source", "target" or "extension"), "path" (the file or
+            directory that failed), "files" (affected files) and "message"
+        """
+        errors: List[Dict[str, Any]] = []
+        directory_errors: Dict[Tuple[str, Path], Optional[Dict[str, Any]]] = {}
+        resolved_lengths: Dict[Tuple[str, Path], int] = {}
+        
+        def add_error(role: str, path: Path, message: str, files: List[Path]) -> Dict[str, Any]:
+            error = {"role": role, "path": path, "files": files, "message": message}
+            errors.append(error)
+            return error
         
         for source, target in file_list:
-            # Validate source path
-            is_safe, msg = cls.validate_path(source, base_source_dir)
-            if not is_safe:
-                errors.append(f"Invalid source path {source}: {msg}")
-            
-            # Validate target path
-            is_safe, msg = cls.validate_path(target, base_target_dir)
-            if not is_safe:
-                errors.append(f"Invalid target path {target}: {msg}")
-            
-            # Validate file extension
-            is_allowed, msg = cls.validate_file_extension(source)
+            for role, path, base_dir in (("source", source, base_source_dir), ("target", target, base_target_dir)):
+                message = cls._check_file_name(path)
+                if message:
+                    add_error(role, path, message, [path])
+                    continue
+                
+                if path.is_symlink():
+                    is_safe, message = cls.validate_path(path, base_dir)
+                    if not is_safe:
+                        add_error(role, path, message, [path])
+                    continue
+                
+                key = (role, path.parent)
+                if key not in directory_errors:
+                    resolved, message = cls._check_directory(path.parent, base_dir)
+                    resolved_lengths[key] = len(os.path.join(str(resolved), ""))
+                    directory_errors[key] = add_error(role, path.parent, message, []) if message else None
+                
+                directory_error = directory_errors[key]
+                if directory_error:
+                    directory_error["files"].append(path)
+                    continue
+                
+                length = resolved_lengths[key] + len(path.name)
+                if length > cls.MAX_PATH_LENGTH:
+                    add_error(role, path, f"Path too long: {length} > {cls.MAX_PATH_LENGTH}", [path])
+            
+            is_allowed, message = cls.validate_file_extension(source)
             if not is_allowed:
-                errors.append(f"File {source}: {msg}")
+                add_error("extension", source, message, [source])
         
         return len(errors) == 0, errors
     
+    @classmethod
+    def _check_file_name(cls, path: Path) -> Optional[str]:
+        """
+        Run validate_path's per-file checks on a path's final component
+        
+        Returns:
+            Error message, or None if the name is safe
+        """
+        name = path.name
+        if '\x00' in str(path):
+            return "Null byte detected in path"
+        if name in ('', '.', '..'):
+            return f"Path validation error: {path} does not name a file"
+        if len(name) > cls.MAX_FILENAME_LENGTH:
+            return f"Filename too long: {len(name)} > {cls.MAX_FILENAME_LENGTH}"
+        
+        match = cls._TRAVERSAL_RE.search(name)
+        if match:
+            pattern = _matched_pattern(match, cls.TRAVERSAL_PATTERNS)
+            return cls._get_user_friendly_error_message("traversal", pattern, path)
+        
+        message = cls._check_filename_patterns(name)
+        if message:
+            return message
+        
+        if os.name == 'nt' and path.stem.upper() in cls.WINDOWS_RESERVED_NAMES:
+            return f"Reserved Windows filename: {path.stem.upper()}"
+        
+        return None
+    
+    @classmethod
+    def _check_directory(cls, directory: Path, base_dir: Optional[Path]) -> Tuple[Path, Optional[str]]:
+        """
+        Run validate_path's location checks on a directory holding files
+        
+        Patterns are matched against the directory with a trailing
+        separator, i.e. as the prefix of the paths of the files within it.
+        
+        Returns:
+            Tuple of (resolved directory, error message or None)
+        """
+        try:
+            resolved = directory.resolve()
+            
+            message = cls._check_location_patterns(
+                os.path.join(str(directory), ""),
+                cls._normalize_path_for_validation(directory).rstrip("/\\") + "/",
+                cls._normalize_path_for_validation(resolved).rstrip("/\\") + "/",
+                resolved
+            )
+            if message:
+                return resolved, message
+            
+            if base_dir:
+                base_abs = cls._resolve_base_dir(base_dir)
+                try:
+                    resolved.relative_to(base_abs)
+                except ValueError:
+                    return resolved, f"Path outside allowed directory: {resolved} not in {base_abs}"
+            
+            return resolved, None
+        except Exception as e:
+            return directory, f"Path validation error: {e}"
+    
     @classmethod
     def _normalize_path_for_validation(cls, path: Path) -> str:
         """
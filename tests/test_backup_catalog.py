@@ -0,0 +1,65 @@
+import io
+import json
+import tarfile
+from pathlib import Path
+from unittest.mock import patch
+from setup.cli.commands import backup
+from setup.services.backups import BackupCatalog
+
+
+def _write_archive(path: Path, files: int, version: str = "4.2.0") -> None:
+    with tarfile.open(path, "w:gz") as tar:
+        metadata = json.dumps({"framework_version": version, "components": {"core": version}}).encode()
+        info = tarfile.TarInfo("backup_metadata.json")
+        info.size = len(metadata)
+        tar.addfile(info, io.BytesIO(metadata))
+        for i in range(files):
+            data = f"file {i}".encode()
+            info = tarfile.TarInfo(f"agents/{i}.md")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+class TestBackupCatalog:
+    def test_list_indexes_archives_once(self, tmp_path):
+        _write_archive(tmp_path / "a.tar.gz", 2)
+        _write_archive(tmp_path / "b.tar.gz", 3)
+
+        first = backup.list_backups(tmp_path)
+        assert (tmp_path / BackupCatalog.CATALOG_NAME).exists()
+
+        with patch('setup.cli.commands.backup.tarfile.open', side_effect=AssertionError("archive opened")):
+            second = backup.list_backups(tmp_path)
+
+        assert sorted(b["files"] for b in second) == [3, 4]
+        assert [b["path"] for b in second] == [b["path"] for b in first]
+        assert second[0]["metadata"]["framework_version"] == "4.2.0"
+
+    def test_only_new_or_changed_archives_are_scanned(self, tmp_path):
+        _write_archive(tmp_path / "a.tar.gz", 2)
+        backup.list_backups(tmp_path)
+
+        _write_archive(tmp_path / "c.tar.gz", 1)
+        opened = []
+        real_open = tarfile.open
+
+        def tracking_open(path, *args, **kwargs):
+            opened.append(Path(path).name)
+            return real_open(path, *args, **kwargs)
+
+        with patch('setup.cli.commands.backup.tarfile.open', side_effect=tracking_open):
+            backups = backup.list_backups(tmp_path)
+
+        assert opened == ["c.tar.gz"]
+        assert len(backups) == 2
+
+    def test_deleted_archives_are_pruned(self, tmp_path):
+        _write_archive(tmp_path / "a.tar.gz", 1)
+        _write_archive(tmp_path / "b.tar.gz", 1)
+        backup.list_backups(tmp_path)
+
+        (tmp_path / "a.tar.gz").unlink()
+        backup.list_backups(tmp_path)
+
+        catalog = json.loads((tmp_path / BackupCatalog.CATALOG_NAME).read_text())
+        assert list(catalog["backups"]) == ["b.tar.gz"]
@@ -0,0 +1,141 @@
+import argparse
+import io
+import json
+import os
+import sys
+import tarfile
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from setup.cli.commands import backup
+from setup.services.backups import BackupCatalog
+
+FILES = {
+    "CLAUDE.md": "@FLAGS.md",
+    "FLAGS.md": "flags",
+    "MODE_Brainstorming.md": "mode",
+    "agents/system-architect.md": "architect",
+    "agents/security-engineer.md": "security",
+    "commands/sc/build.md": "build",
+}
+
+
+def _write_archive(path: Path, mode: str, file_manifests=None) -> None:
+    with tarfile.open(path, mode) as tar:
+        contents = dict(FILES)
+        if file_manifests is not None:
+            contents[".superclaude-metadata.json"] = json.dumps({"file_manifests": file_manifests})
+        for name, text in contents.items():
+            data = text.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            info.mtime = 1700000000
+            tar.addfile(info, io.BytesIO(data))
+
+
+def _args(install_dir: Path, **kwargs) -> argparse.Namespace:
+    defaults = dict(install_dir=install_dir, overwrite=False, dry_run=False,
+                    component=None, include=None, paths=None, jobs=4)
+    defaults.update(kwargs)
+    return argparse.Namespace(**defaults)
+
+
+class TestSelectiveRestore:
+    def test_restore_component_from_uncompressed_archive(self, tmp_path):
+        archive = tmp_path / "superclaude_backup.tar"
+        _write_archive(archive, "w")
+        install_dir = tmp_path / "install"
+
+        assert backup.restore_backup(archive, _args(install_dir, component=["agents"], jobs=2))
+
+        restored = sorted(str(p.relative_to(install_dir)) for p in install_dir.rglob("*") if p.is_file())
+        assert restored == ["agents/security-engineer.md", "agents/system-architect.md"]
+        assert (install_dir / "agents" / "system-architect.md").read_text() == "architect"
+        assert (install_dir / "agents" / "system-architect.md").stat().st_mtime == 1700000000
+
+    def test_second_restore_uses_cataloged_member_index(self, tmp_path):
+        archive = tmp_path / "superclaude_backup.tar"
+        _write_archive(archive, "w")
+        backup.restore_backup(archive, _args(tmp_path / "first", paths=["FLAGS.md"]))
+        assert "members" in BackupCatalog(tmp_path).get(archive)
+
+        with patch('setup.cli.commands.backup.tarfile.open', side_effect=AssertionError("archive scanned")):
+            assert backup.restore_backup(archive, _args(tmp_path / "second", include=["commands/*"]))
+
+        assert (tmp_path / "second" / "commands" / "sc" / "build.md").read_text() == "build"
+
+    def test_compressed_restore_uses_archived_file_manifest(self, tmp_path):
+        archive = tmp_path / "superclaude_backup.tar.gz"
+        _write_archive(archive, "w:gz", file_manifests={"core": {"CLAUDE.md": {}, "FLAGS.md": {}}})
+        install_dir = tmp_path / "install"
+        install_dir.mkdir()
+        (install_dir / "FLAGS.md").write_text("local edit")
+
+        assert backup.restore_backup(archive, _args(install_dir, component=["core"]))
+
+        assert (install_dir / "CLAUDE.md").read_text() == "@FLAGS.md"
+        assert (install_dir / "FLAGS.md").read_text() == "local edit"
+        assert not (install_dir / "MODE_Brainstorming.md").exists()
+
+    def test_fallback_component_patterns(self):
+        names = list(FILES)
+
+        assert backup.component_member_names("core", names, {}) == {"CLAUDE.md", "FLAGS.md"}
+        assert backup.component_member_names("modes", names, {}) == {"MODE_Brainstorming.md"}
+        assert backup.component_member_names("commands", names, {}) == {"commands/sc/build.md"}
+
+    def test_compressed_backup_is_cataloged_for_restore(self, tmp_path):
+        install_dir = tmp_path / "install"
+        (install_dir / "agents").mkdir(parents=True)
+        (install_dir / "agents" / "system-architect.md").write_text("architect")
+        (install_dir / "FLAGS.md").write_text("flags")
+        (install_dir / ".superclaude-metadata.json").write_text(
+            json.dumps({"file_manifests": {"agents": {"agents/system-architect.md": {}}}}))
+        backup_dir = tmp_path / "backups"
+        assert backup.create_backup(argparse.Namespace(
+            install_dir=install_dir, backup_dir=backup_dir, name=None, dedup=False,
+            compress="gzip", compress_level=None))
+        archive = next(backup_dir.glob("*.tar.gz"))
+
+        entry = BackupCatalog(backup_dir).get(archive)
+        assert set(entry["members"]) == {"agents/system-architect.md", "FLAGS.md", ".superclaude-metadata.json"}
+        assert entry["install_metadata"]["file_manifests"] == {"agents": {"agents/system-architect.md": {}}}
+
+        opened = []
+        real_open = tarfile.open
+
+        def tracking_open(*args, **kwargs):
+            opened.append(args[1])
+            return real_open(*args, **kwargs)
+
+        with patch('setup.cli.commands.backup.tarfile.open', side_effect=tracking_open):
+            assert backup.restore_backup(archive, _args(tmp_path / "restored", component=["agents"]))
+
+        assert opened == ["r|gz"]
+        assert (tmp_path / "restored" / "agents" / "system-architect.md").read_text() == "architect"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="creates symlinks")
+    def test_restores_directories_and_symlinks(self, tmp_path):
+        archive = tmp_path / "superclaude_backup.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            for name, kind, target in (("logs", tarfile.DIRTYPE, ""),
+                                       ("LINKED.md", tarfile.SYMTYPE, "FLAGS.md"),
+                                       ("ESCAPE.md", tarfile.SYMTYPE, "../outside.md")):
+                info = tarfile.TarInfo(name)
+                info.type = kind
+                info.linkname = target
+                info.mode = 0o755
+                tar.addfile(info)
+            info = tarfile.TarInfo("FLAGS.md")
+            info.size = 5
+            tar.addfile(info, io.BytesIO(b"flags"))
+        install_dir = tmp_path / "install"
+
+        assert not backup.restore_backup(archive, _args(install_dir))
+
+        assert (install_dir / "logs").is_dir()
+        assert os.readlink(install_dir / "LINKED.md") == "FLAGS.md"
+        assert (install_dir / "LINKED.md").read_text() == "flags"
+        assert not (install_dir / "ESCAPE.md").exists()
@@ -0,0 +1,68 @@
+import pytest
+from setup.services.backups import BackupStore, iter_backup_files
+
+
+@pytest.fixture
+def install_dir(tmp_path):
+    install_dir = tmp_path / ".claude"
+    (install_dir / "agents").mkdir(parents=True)
+    (install_dir / "backups").mkdir()
+    (install_dir / "local").mkdir()
+    (install_dir / "CLAUDE.md").write_text("@FLAGS.md\n")
+    (install_dir / "FLAGS.md").write_text("flags")
+    (install_dir / "agents" / "a.md").write_text("agent")
+    (install_dir / "agents" / "b.md").write_text("agent")  # same content as a.md
+    (install_dir / "local" / "secret").write_text("local only")
+    return install_dir
+
+
+class TestBackupStore:
+    def test_iter_backup_files_skips_excluded_dirs(self, install_dir):
+        rel_paths = [rel for _, rel in iter_backup_files(install_dir)]
+
+        assert rel_paths == ["CLAUDE.md", "FLAGS.md", "agents/a.md", "agents/b.md"]
+
+    def test_identical_content_is_stored_once(self, install_dir):
+        store = BackupStore(install_dir / "backups")
+
+        store.create(install_dir, "first")
+
+        manifest = store.load_manifest("first")
+        assert manifest["files"]["agents/a.md"]["sha256"] == manifest["files"]["agents/b.md"]["sha256"]
+        assert len(list(store.objects_dir.glob("*/*"))) == 3
+
+    def test_second_backup_stores_only_changes(self, install_dir):
+        store = BackupStore(install_dir / "backups")
+        store.create(install_dir, "first")
+        size_before = store.get_store_size()
+
+        (install_dir / "FLAGS.md").write_text("flags v2")
+        store.create(install_dir, "second")
+
+        assert store.get_store_size() - size_before == len("flags v2")
+        assert [backup["name"] for backup in store.list_backups()] == ["second", "first"]
+
+    def test_restore_rebuilds_files(self, install_dir, tmp_path):
+        store = BackupStore(install_dir / "backups")
+        store.create(install_dir, "first")
+
+        target = tmp_path / "restored"
+        restored, errors = store.restore("first", target)
+
+        assert errors == []
+        assert restored == 4
+        assert (target / "agents" / "b.md").read_text() == "agent"
+        assert not (target / "local").exists()
+
+    def test_gc_removes_unreferenced_blobs(self, install_dir):
+        store = BackupStore(install_dir / "backups")
+        store.create(install_dir, "first")
+        (install_dir / "FLAGS.md").write_text("flags v2")
+        store.create(install_dir, "second")
+
+        assert store.delete("first")
+        removed, freed = store.gc()
+
+        assert (removed, freed) == (1, len("flags"))
+        restored, errors = store.restore("second", install_dir.parent / "check")
+        assert restored == 4 and errors == []
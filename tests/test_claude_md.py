@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+import sys
+
+import pytest
+from unittest.mock import patch
+from setup.services.claude_md import CLAUDEMdService
+from setup.services.context_footprint import ContextBudget
+
+
+class TestClaudeMdSession:
+    def test_components_share_one_parse_and_one_write(self, tmp_path):
+        (tmp_path / "CLAUDE.md").write_text("# My notes\n\n@PERSONAL.md\n")
+        core = CLAUDEMdService(tmp_path)
+        modes = CLAUDEMdService(tmp_path)
+
+        with patch('setup.services.claude_md.os.replace', wraps=os.replace) as replace, \
+             patch.object(CLAUDEMdService, '_load_document', autospec=True,
+                          side_effect=CLAUDEMdService._load_document) as load:
+            with core.session():
+                assert core.add_imports(["RULES.md", "FLAGS.md", "PERSONAL.md"], category="Core Framework")
+                assert modes.add_imports(["MODE_Brainstorming.md"], category="Behavioral Modes")
+                assert modes.remove_imports(["FLAGS.md"])
+                assert "RULES.md" not in (tmp_path / "CLAUDE.md").read_text()
+
+        assert load.call_count == 1
+        assert replace.call_count == 1
+        assert (tmp_path / "CLAUDE.md").read_text() == (
+            "# My notes\n\n@PERSONAL.md\n\n"
+            "# ===================================================\n"
+            "# SuperClaude Framework Components\n"
+            "# ===================================================\n\n"
+            "# Core Framework\n@RULES.md\n\n"
+            "# Behavioral Modes\n@MODE_Brainstorming.md\n"
+        )
+
+    def test_no_op_skips_write(self, tmp_path):
+        service = CLAUDEMdService(tmp_path)
+        assert service.add_imports(["RULES.md"], category="Core Framework")
+        content = (tmp_path / "CLAUDE.md").read_text()
+        assert content.startswith("# SuperClaude Entry Point")
+
+        with patch('setup.services.claude_md.tempfile.mkstemp') as mkstemp:
+            with service.session():
+                assert service.add_imports(["RULES.md"], category="Core Framework")
+                assert service.remove_imports(["NOT_IMPORTED.md"])
+
+        mkstemp.assert_not_called()
+        assert (tmp_path / "CLAUDE.md").read_text() == content
+
+    def test_failed_session_discards_changes(self, tmp_path):
+        service = CLAUDEMdService(tmp_path)
+
+        with pytest.raises(RuntimeError):
+            with service.session():
+                service.add_imports(["RULES.md"])
+                raise RuntimeError("component failed")
+
+        assert not (tmp_path / "CLAUDE.md").exists()
+
+    def test_budget_drops_lowest_priority_imports(self, tmp_path):
+        for name, size in (("RULES.md", 400), ("FLAGS.md", 400), ("MODE_Focus.md", 400), ("EXAMPLES.md", 40)):
+            (tmp_path / name).write_text("x" * size)
+        budget = ContextBudget(230, {"RULES.md": 90, "FLAGS.md": 95, "MODE_Focus.md": 40, "EXAMPLES.md": 10})
+        service = CLAUDEMdService(tmp_path)
+
+        with service.session(budget):
+            service.add_imports(["RULES.md", "FLAGS.md", "EXAMPLES.md"], category="Core Framework")
+            service.add_imports(["MODE_Focus.md"], category="Behavioral Modes")
+
+        imports = service.read_existing_imports()
+        assert imports == {"RULES.md", "FLAGS.md", "EXAMPLES.md"}
+        assert "# Behavioral Modes" not in (tmp_path / "CLAUDE.md").read_text()
+        assert (tmp_path / "MODE_Focus.md").exists()
+
+
+def _add_personal_import(install_dir):
+    CLAUDEMdService(install_dir).add_imports(["MODE_Focus.md"], category="Behavioral Modes")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses fork start method")
+class TestClaudeMdCrossProcess:
+    def test_other_process_waits_for_open_session(self, tmp_path):
+        service = CLAUDEMdService(tmp_path)
+        context = multiprocessing.get_context("fork")
+
+        with service.session():
+            service.add_imports(["RULES.md"], category="Core Framework")
+            other = context.Process(target=_add_personal_import, args=(tmp_path,))
+            other.start()
+            other.join(timeout=0.5)
+            assert other.is_alive(), "other process wrote during the session"
+
+        other.join(timeout=60)
+        assert other.exitcode == 0
+        assert service.read_existing_imports() == {"RULES.md", "MODE_Focus.md"}
@@ -0,0 +1,65 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def _imported_modules(*cli_args):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "SuperClaude", *cli_args],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT
+    )
+    assert result.returncode == 0, result.stderr
+    return set(re.findall(r"\|\s+(\S+)$", result.stderr, re.MULTILINE))
+
+
+class TestLazyCLIStartup:
+    def test_help_imports_no_operation_modules(self):
+        modules = _imported_modules("--help")
+
+        assert not {m for m in modules if m.startswith("setup.cli.commands.")}
+        assert "setup.core.installer" not in modules
+
+    @pytest.mark.parametrize("operation,unrelated", [
+        ("backup", "setup.cli.commands.install"),
+        ("uninstall", "setup.cli.commands.backup"),
+    ])
+    def test_subcommand_imports_only_its_module(self, operation, unrelated):
+        modules = _imported_modules(operation, "--help")
+
+        assert f"setup.cli.commands.{operation}" in modules
+        assert unrelated not in modules
+
+    def test_detect_operation_skips_option_values(self):
+        from SuperClaude.__main__ import detect_operation
+
+        assert detect_operation(["--install-dir", "install", "backup", "--list"]) == "backup"
+        assert detect_operation(["-v", "update"]) == "update"
+        assert detect_operation(["--help"]) is None
+        assert detect_operation(["instal"]) is None
+
+    def test_detect_operation_skips_abbreviated_option_values(self):
+        from SuperClaude.__main__ import detect_operation
+
+        assert detect_operation(["--install-d", "/tmp/x", "backup", "--list"]) == "backup"
+        assert detect_operation(["--install-dir=/tmp/x", "backup"]) == "backup"
+        assert detect_operation(["--inst", "backup", "install"]) == "install"
+        assert detect_operation(["--verbose", "backup"]) == "backup"
+
+    def test_abbreviated_install_dir_reaches_the_operation(self, tmp_path):
+        result = subprocess.run(
+            [sys.executable, "-m", "SuperClaude", "--install-d", str(tmp_path),
+             "backup", "--list", "--no-update-check"],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT
+        )
+
+        assert "unrecognized arguments" not in result.stderr
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,71 @@
+from unittest.mock import patch
+from setup.utils import compact_docs
+from setup.utils.compact_docs import build_compact_docs, compact_markdown
+
+DOC = """---
+name: MODE_Test
+---
+
+# Test Mode
+
+**Purpose**: Keep   this
+
+
+## Activation Triggers
+- Trigger one
+
+---
+
+| Symbol | Meaning |
+|--------|---------|
+| →      | leads to |
+
+**Example**:
+```
+not needed
+```
+
+## Examples
+```
+user: hello
+```
+### Nested example detail
+text
+
+## Outcomes
+- Done
+"""
+
+
+class TestCompactMarkdown:
+    def test_strips_examples_rules_and_table_padding(self):
+        assert compact_markdown(DOC) == (
+            "---\nname: MODE_Test\n---\n\n"
+            "# Test Mode\n**Purpose**: Keep   this\n\n"
+            "## Activation Triggers\n- Trigger one\n\n"
+            "Symbol|Meaning\n→|leads to\n\n"
+            "## Outcomes\n- Done\n"
+        )
+
+    def test_section_allowlist_keeps_preamble_and_listed_sections(self):
+        compact = compact_markdown(DOC, sections=["outcomes"])
+
+        assert "# Test Mode" in compact and "**Purpose**" in compact
+        assert "## Outcomes" in compact
+        assert "Activation Triggers" not in compact
+
+
+class TestBuildCompactDocs:
+    def test_only_stale_docs_are_rebuilt(self, tmp_path):
+        (tmp_path / "A.md").write_text(DOC)
+        (tmp_path / "B.md").write_text("# B\n\n\n\ntext\n")
+        build_compact_docs(tmp_path, ["A.md", "B.md"])
+        assert (tmp_path / "compact" / "B.md").read_text() == "# B\ntext\n"
+
+        (tmp_path / "B.md").write_text("# B\n\nchanged\n")
+        with patch.object(compact_docs, 'compact_markdown', wraps=compact_markdown) as compact:
+            build_compact_docs(tmp_path, ["A.md", "B.md"])
+            build_compact_docs(tmp_path, ["A.md", "B.md"], sections={"A.md": ["Outcomes"]})
+
+        assert compact.call_count == 2
+        assert "Activation Triggers" not in (tmp_path / "compact" / "A.md").read_text()
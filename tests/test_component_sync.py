@@ -0,0 +1,306 @@
+import os
+import shutil
+import sys
+import threading
+from collections import Counter
+from dataclasses import FrozenInstanceError
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from setup.core.base import Component
+from setup.services.files import FileService
+from setup.utils.compact_docs import build_compact_docs
+
+
+class FakeComponent(Component):
+    """Minimal file-copying component backed by a temporary source directory"""
+
+    def __init__(self, source_dir: Path, install_dir: Path):
+        self.source_dir = source_dir
+        super().__init__(install_dir, Path("fake"))
+
+    def get_metadata(self):
+        return {"name": "fake", "version": "1.0.0", "description": "Fake", "category": "test"}
+
+    def _install(self, config):
+        return super()._install(config)
+
+    def _post_install(self):
+        return True
+
+    def uninstall(self):
+        return True
+
+    def get_dependencies(self):
+        return []
+
+    def _get_source_dir(self):
+        return self.source_dir
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "A.md").write_text("alpha")
+    (source_dir / "B.md").write_text("bravo")
+    (source_dir / "C.md").write_text("charlie")
+    return source_dir, tmp_path / "install"
+
+
+def _install(source_dir, install_dir, config=None):
+    component = FakeComponent(source_dir, install_dir)
+    with patch.object(FakeComponent, 'validate_prerequisites', return_value=(True, [])):
+        assert component.install(config or {})
+    return component
+
+
+class TestIncrementalSync:
+    def test_first_install_records_manifest(self, dirs):
+        source_dir, install_dir = dirs
+
+        component = _install(source_dir, install_dir)
+
+        assert sorted(component.file_changes["added"]) == ["fake/A.md", "fake/B.md", "fake/C.md"]
+        manifest = component.settings_manager.get_file_manifest("fake")
+        assert manifest["fake/A.md"]["sha256"] == component.file_manager.get_file_hash(source_dir / "A.md")
+        assert manifest["fake/A.md"]["size"] == 5
+
+    def test_update_copies_only_changes(self, dirs):
+        source_dir, install_dir = dirs
+        _install(source_dir, install_dir)
+
+        (source_dir / "B.md").write_text("bravo two")
+        (source_dir / "C.md").unlink()
+        (source_dir / "D.md").write_text("delta")
+
+        def copy(file_service, source, target, link_mode):
+            shutil.copy2(source, target)
+            return link_mode
+
+        with patch('setup.services.files.FileService._deploy', autospec=True, side_effect=copy) as deploy:
+            component = _install(source_dir, install_dir, {"update_mode": True})
+
+        copied = sorted(call.args[1].name for call in deploy.call_args_list)
+        assert copied == ["B.md", "D.md"]
+        assert component.file_changes["added"] == ["fake/D.md"]
+        assert component.file_changes["changed"] == ["fake/B.md"]
+        assert component.file_changes["removed"] == ["fake/C.md"]
+        assert component.file_changes["unchanged"] == ["fake/A.md"]
+        assert not (install_dir / "fake" / "C.md").exists()
+        assert "fake/C.md" not in component.settings_manager.get_file_manifest("fake")
+
+    def test_locally_modified_removed_file_is_kept(self, dirs):
+        source_dir, install_dir = dirs
+        _install(source_dir, install_dir)
+
+        (install_dir / "fake" / "C.md").write_text("my notes")
+        (source_dir / "C.md").unlink()
+
+        component = _install(source_dir, install_dir, {"update_mode": True})
+
+        assert component.file_changes["removed"] == []
+        assert (install_dir / "fake" / "C.md").read_text() == "my notes"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need extra privileges on Windows")
+class TestLinkModes:
+    def test_hardlink_and_symlink_deployment(self, dirs):
+        source_dir, install_dir = dirs
+        component = _install(source_dir, install_dir, {"link_mode": "hardlink"})
+        target = install_dir / "fake" / "A.md"
+
+        assert os.path.samefile(target, source_dir / "A.md")
+        assert component.settings_manager.get_file_manifest("fake")["fake/A.md"]["link_mode"] == "hardlink"
+
+        # Switching modes redeploys files whose content is unchanged
+        component = _install(source_dir, install_dir, {"link_mode": "symlink"})
+        assert sorted(component.file_changes["changed"]) == ["fake/A.md", "fake/B.md", "fake/C.md"]
+        assert target.is_symlink()
+
+        # Without a mode, updates keep the recorded one
+        component = _install(source_dir, install_dir, {"update_mode": True})
+        assert len(component.file_changes["unchanged"]) == 3
+
+    def test_linked_targets_never_write_through(self, dirs):
+        source_dir, install_dir = dirs
+        _install(source_dir, install_dir, {"link_mode": "hardlink"})
+        other = source_dir.parent / "other.md"
+        other.write_text("overwrite")
+
+        FakeComponent(source_dir, install_dir).file_manager.copy_file(other, install_dir / "fake" / "A.md")
+
+        assert (source_dir / "A.md").read_text() == "alpha"
+        assert (install_dir / "fake" / "A.md").read_text() == "overwrite"
+
+    def test_broken_symlinks_are_reported_and_removable(self, dirs):
+        source_dir, install_dir = dirs
+        component = _install(source_dir, install_dir, {"link_mode": "symlink"})
+        target = install_dir / "fake" / "B.md"
+
+        (source_dir / "B.md").rename(source_dir / "moved.md")
+        success, errors = component.validate_installation()
+
+        assert not success
+        assert errors[0].startswith(f"Broken link: {target}")
+        assert component.file_manager.remove_file(target)
+        assert not os.path.lexists(target)
+
+    def test_hardlink_cut_off_from_updated_source_is_reported(self, dirs):
+        source_dir, install_dir = dirs
+        component = _install(source_dir, install_dir, {"link_mode": "hardlink"})
+        assert not [e for e in component.validate_installation()[1] if e.startswith("Stale")]
+
+        # Package upgrades replace source files instead of writing through
+        (source_dir / "C.md").unlink()
+        (source_dir / "C.md").write_text("charlie v2")
+        component = FakeComponent(source_dir, install_dir)
+        success, errors = component.validate_installation()
+
+        assert not success
+        assert [e for e in errors if e.startswith("Stale")] == [f"Stale hardlink: {install_dir / 'fake' / 'C.md'} no longer matches "
+                          f"{source_dir / 'C.md'} (re-run install)"]
+
+    def test_reflink_falls_back_to_copy(self, dirs):
+        source_dir, install_dir = dirs
+        target = install_dir / "A.md"
+
+        used = FakeComponent(source_dir, install_dir).file_manager.deploy_file(source_dir / "A.md", target, "reflink")
+
+        assert used in ("reflink", "copy")
+        assert target.read_text() == "alpha"
+        assert not os.path.samefile(target, source_dir / "A.md")
+
+
+class TestBulkCopy:
+    def test_identical_files_are_skipped(self, dirs):
+        source_dir, install_dir = dirs
+        files = [(source_dir / name, install_dir / "nested" / "dir" / name) for name in ("A.md", "B.md", "C.md")]
+        (install_dir / "nested" / "dir").mkdir(parents=True)
+        shutil.copy2(source_dir / "A.md", install_dir / "nested" / "dir" / "A.md")
+        (install_dir / "nested" / "dir" / "B.md").write_text("BRAVO")  # Same size, other content
+
+        report = FileService().copy_files(files)
+
+        assert report["skipped"] == [files[0][1]]
+        assert sorted(t.name for t in report["copied"]) == ["B.md", "C.md"]
+        assert report["failed"] == {}
+        assert (install_dir / "nested" / "dir" / "B.md").read_text() == "bravo"
+        assert report["hashes"][files[2][1]] == FileService().get_file_hash(source_dir / "C.md")
+
+    def test_copies_run_concurrently_and_failures_are_reported(self, dirs):
+        source_dir, install_dir = dirs
+        barrier = threading.Barrier(3, timeout=5)
+        real_deploy = FileService._deploy
+
+        def deploy(file_service, source, target, link_mode):
+            # Only completes if all three copies are running at once
+            barrier.wait()
+            return real_deploy(file_service, source, target, link_mode)
+
+        files = [(source_dir / name, install_dir / name) for name in ("A.md", "B.md", "C.md")]
+        files.append((source_dir / "missing.md", install_dir / "missing.md"))
+        with patch.object(FileService, '_deploy', autospec=True, side_effect=deploy), \
+             patch('pathlib.Path.mkdir', autospec=True, side_effect=Path.mkdir) as mkdir:
+            report = FileService().copy_files(files, max_workers=4)
+
+        assert mkdir.call_count == 1
+        assert len(report["copied"]) == 3
+        assert list(report["failed"]) == [install_dir / "missing.md"]
+
+    def test_unknown_link_mode_is_reported_as_failed(self, dirs):
+        source_dir, install_dir = dirs
+        files = [(source_dir / name, install_dir / name) for name in ("A.md", "B.md")]
+
+        report = FileService().copy_files(files, link_modes={install_dir / "B.md": "junction"})
+
+        assert report["copied"] == [install_dir / "A.md"]
+        assert report["failed"] == {install_dir / "B.md": "Unknown link mode: junction"}
+
+
+class TestInstallPlan:
+    def test_each_source_is_scanned_and_hashed_once_per_run(self, dirs):
+        source_dir, install_dir = dirs
+        real_hash = FileService.get_file_hash
+        hashed = Counter()
+
+        def get_file_hash(file_service, file_path, *args):
+            hashed[file_path.name] += 1
+            return real_hash(file_service, file_path, *args)
+
+        with patch.object(FileService, 'get_file_hash', autospec=True, side_effect=get_file_hash), \
+             patch('setup.core.base.SecurityValidator') as security, \
+             patch.object(FakeComponent, '_discover_component_files', autospec=True,
+                          side_effect=Component._discover_component_files) as discover:
+            security.check_permissions.return_value = (True, [])
+            security.validate_installation_target.return_value = (True, [])
+            security.validate_component_files.return_value = (True, [])
+            component = FakeComponent(source_dir, install_dir)
+            size = component.get_size_estimate()
+            assert component.install({})
+            _, errors = component.validate_installation()
+
+        assert errors == ["Component not registered in .superclaude-metadata.json"]
+        assert discover.call_count == 1
+        assert hashed == {"A.md": 1, "B.md": 1, "C.md": 1}
+        assert size == len("alpha") + len("bravo") + len("charlie")
+
+    def test_plan_is_immutable_and_follows_component_files(self, dirs):
+        source_dir, install_dir = dirs
+        component = FakeComponent(source_dir, install_dir)
+        plan = component.get_install_plan()
+
+        with pytest.raises(FrozenInstanceError):
+            plan.files = ()
+        assert component.get_install_plan() is plan
+
+        component.component_files = ["A.md", "missing.md"]
+        plan = component.get_install_plan()
+        assert [planned.source.name for planned in plan.files] == ["A.md"]
+        assert plan.missing == ((source_dir / "missing.md", install_dir / "fake" / "missing.md"),)
+        assert plan.get(source_dir / "A.md").sha256 == FileService().get_file_hash(source_dir / "A.md")
+
+
+class CompactFakeComponent(FakeComponent):
+    SUPPORTS_COMPACT_DOCS = True
+
+
+class TestCompactDocVariant:
+    def test_compact_variant_deploys_compact_sources(self, dirs):
+        source_dir, install_dir = dirs
+        (source_dir / "A.md").write_text("# Alpha\n\n\n## Examples\nskip me\n")
+
+        component = CompactFakeComponent(source_dir, install_dir)
+        with patch.object(CompactFakeComponent, 'validate_prerequisites', return_value=(True, [])):
+            assert component.install({"doc_variant": "compact"})
+
+        # Built into the install's cache, never next to the (package) sources
+        compact_dir = install_dir / ".superclaude-cache" / "compact" / "source"
+        assert component.get_install_plan().get(compact_dir / "A.md") is not None
+        assert not (source_dir / "compact").exists()
+        assert (install_dir / "fake" / "A.md").read_text() == "# Alpha\n"
+        assert (install_dir / "fake" / "B.md").read_text() == "bravo\n"
+
+        # Components without compact docs ignore the option
+        plain = FakeComponent(source_dir, install_dir)
+        plain.set_doc_variant("compact")
+        assert plain.get_install_plan().get(source_dir / "A.md") is not None
+
+    def test_prebuilt_compact_docs_are_used_while_current(self, dirs):
+        source_dir, install_dir = dirs
+        build_compact_docs(source_dir, ["A.md", "B.md", "C.md"])
+
+        component = CompactFakeComponent(source_dir, install_dir)
+        component.set_doc_variant("compact")
+        assert component.get_install_plan().get(source_dir / "compact" / "A.md") is not None
+
+        # A stale prebuilt doc is rebuilt in the cache, leaving the package alone
+        (source_dir / "A.md").write_text("alpha v2")
+        component = CompactFakeComponent(source_dir, install_dir)
+        component.set_doc_variant("compact")
+        with patch('setup.utils.compact_docs.os.replace', side_effect=os.replace) as replace:
+            plan = component.get_install_plan()
+
+        assert plan.get(install_dir / ".superclaude-cache" / "compact" / "source" / "A.md") is not None
+        assert all(source_dir not in call.args[1].parents for call in replace.call_args_list)
@@ -0,0 +1,96 @@
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from setup.cli.commands.analyze_context import check_budgets
+from setup.services.config import ConfigService
+from setup.services.claude_md import CLAUDEMdService
+from setup.services.context_footprint import ContextAnalyzer, ContextBudget, parse_token_count
+
+SHARED = "Always validate inputs before acting on them and report every assumption you make to the user clearly."
+
+
+def make_install(tmp_path):
+    service = CLAUDEMdService(tmp_path)
+    service.add_imports(["RULES.md"], category="Core Framework")
+    service.add_imports(["MODE_Focus.md"], category="Behavioral Modes")
+    (tmp_path / "RULES.md").write_text(f"# Rules\n\n{SHARED}\n\n@rules/EXTRA.md\n")
+    (tmp_path / "rules").mkdir()
+    (tmp_path / "rules" / "EXTRA.md").write_text("# Extra\n\n```\n@NOT_AN_IMPORT.md\n```\n")
+    (tmp_path / "MODE_Focus.md").write_text(f"# Focus\n\n{SHARED}\n\n@MISSING.md\n")
+
+
+class TestContextAnalyzer:
+    def test_walks_imports_and_attributes_categories(self, tmp_path):
+        make_install(tmp_path)
+
+        report = ContextAnalyzer(tmp_path).analyze()
+
+        by_name = {f.path.name: f for f in report.files}
+        assert set(by_name) == {"CLAUDE.md", "RULES.md", "EXTRA.md", "MODE_Focus.md"}
+        assert by_name["EXTRA.md"].category == "Core Framework"
+        assert by_name["EXTRA.md"].depth == 2
+        assert by_name["MODE_Focus.md"].bytes == len((tmp_path / "MODE_Focus.md").read_bytes())
+        assert report.missing == [((tmp_path / "MISSING.md").resolve(), (tmp_path / "MODE_Focus.md").resolve())]
+
+        categories = report.by_category()
+        assert list(categories) == ["Entry Point", "Core Framework", "Behavioral Modes"]
+        assert sum(c["tokens"] for c in categories.values()) == report.total_tokens
+
+        assert len(report.duplicates) == 1
+        assert [p.name for p in report.duplicates[0].files] == ["RULES.md", "MODE_Focus.md"]
+        assert report.duplicate_tokens == report.duplicates[0].tokens
+
+    def test_budget_violations(self, tmp_path):
+        make_install(tmp_path)
+        report = ContextAnalyzer(tmp_path).analyze()
+        args = argparse.Namespace(max_tokens=report.total_tokens, max_file_tokens=None,
+                                  max_category_tokens=["Behavioral Modes=1"], max_duplicate_tokens=0)
+
+        violations = check_budgets(report, args)
+
+        assert len(violations) == 2
+        assert violations[0].startswith("Category 'Behavioral Modes'")
+        assert violations[1].startswith("Duplicated content")
+
+    def test_json_output_is_valid_json_on_stdout(self, tmp_path):
+        make_install(tmp_path)
+
+        result = subprocess.run(
+            [sys.executable, "-m", "SuperClaude", "analyze-context", "--json", "--no-update-check",
+             "--install-dir", str(tmp_path), "--max-tokens", "20k", "--max-duplicate-tokens", "0"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent
+        )
+
+        data = json.loads(result.stdout)
+        assert result.returncode == 1
+        assert [v.split()[0] for v in data["budget_violations"]] == ["Duplicated"]
+        assert "Executing operation: analyze-context" in result.stderr
+
+
+class TestContextBudget:
+    @pytest.mark.parametrize("value,tokens", [("20000", 20000), ("20k", 20000), ("1.5M", 1500000)])
+    def test_parse_token_count(self, value, tokens):
+        assert parse_token_count(value) == tokens
+
+    def test_select_skips_what_does_not_fit_and_keeps_filling(self):
+        budget = ContextBudget(100, {"RULES.md": 90, "BIG.md": 80})
+
+        kept, excluded = budget.select({"RULES.md": 60, "BIG.md": 50, "SMALL.md": 30})
+
+        assert kept == ["RULES.md", "SMALL.md"]
+        assert excluded == ["BIG.md"]
+
+    def test_every_shipped_mcp_doc_has_a_priority(self):
+        root = Path(__file__).resolve().parent.parent
+        priorities = ConfigService(root / "setup" / "data").get_context_priorities()
+
+        docs = {path.name for path in (root / "SuperClaude" / "MCP").glob("MCP_*.md")}
+
+        assert docs and docs <= set(priorities)
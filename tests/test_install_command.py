@@ -55,4 +55,4 @@ class TestInstallCommand:
         mock_display.assert_not_called()
 
         # Check that perform_installation was called with the resolved list
-        mock_perform.assert_called_once_with(['core', 'mcp'], mock_args, ANY)
+        mock_perform.assert_called_once_with(['core', 'mcp'], mock_args, ANY, ANY)
@@ -3,7 +3,7 @@ from pathlib import Path
 import shutil
 import tarfile
 import tempfile
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from setup.core.installer import Installer
 
 class TestInstaller:
@@ -30,6 +30,21 @@ class TestInstaller:
             except tarfile.ReadError as e:
                 pytest.fail(f"Backup file is not a valid tar.gz file: {e}")
 
+    def test_create_backup_streams_files_with_exclusions(self, tmp_path):
+        (tmp_path / "agents").mkdir()
+        (tmp_path / "agents" / "a.md").write_text("agent")
+        (tmp_path / "CLAUDE.md").write_text("@FLAGS.md")
+        (tmp_path / "local").mkdir()
+        (tmp_path / "local" / "notes.md").write_text("private")
+        installer = Installer(install_dir=tmp_path)
+
+        backup_path = installer.create_backup(compresslevel=1)
+
+        with tarfile.open(backup_path, "r:gz") as tar:
+            assert sorted(tar.getnames()) == ["CLAUDE.md", "agents/a.md"]
+            assert tar.extractfile("agents/a.md").read() == b"agent"
+        assert not list((tmp_path / "backups").glob("*.partial"))
+
     def test_skips_already_installed_component(self):
         # Create a mock component that is NOT reinstallable
         mock_component = MagicMock()
@@ -93,3 +108,127 @@ class TestInstaller:
         # Assert
         mock_comp1.validate_installation.assert_called_once()
         mock_comp2.validate_installation.assert_not_called()
+
+
+def _make_component(name, dependencies=None, install_result=True):
+    component = MagicMock()
+    component.get_metadata.return_value = {'name': name}
+    component.get_dependencies.return_value = dependencies or []
+    component.is_reinstallable.return_value = True
+    component.install.return_value = install_result
+    component.validate_prerequisites.return_value = (True, [])
+    component.validate_installation.return_value = (True, [])
+    return component
+
+
+class TestParallelInstall:
+    def test_installation_levels(self, tmp_path):
+        installer = Installer(install_dir=tmp_path)
+        installer.register_components([
+            _make_component('core'),
+            _make_component('modes', ['core']),
+            _make_component('agents', ['core']),
+            _make_component('mcp_docs', ['core', 'modes']),
+        ])
+
+        ordered = installer.resolve_dependencies(['mcp_docs', 'agents'])
+        levels = installer.get_installation_levels(ordered)
+
+        assert levels[0] == ['core']
+        assert sorted(levels[1]) == ['agents', 'modes']
+        assert levels[2] == ['mcp_docs']
+
+    def test_same_level_components_run_concurrently(self, tmp_path):
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+
+        def install_waiting(config):
+            # Only completes if both level-2 components are running at once
+            barrier.wait()
+            return True
+
+        modes = _make_component('modes', ['core'])
+        agents = _make_component('agents', ['core'])
+        modes.install.side_effect = install_waiting
+        agents.install.side_effect = install_waiting
+
+        installer = Installer(install_dir=tmp_path)
+        installer.register_components([_make_component('core'), modes, agents])
+
+        assert installer.install_components(['modes', 'agents'], {'parallel': True, 'max_workers': 2})
+        assert installer.component_results == {'core': True, 'modes': True, 'agents': True}
+
+    def test_failed_dependency_is_not_installed(self, tmp_path):
+        core = _make_component('core', install_result=False)
+        modes = _make_component('modes', ['core'])
+        mcp = _make_component('mcp')
+
+        installer = Installer(install_dir=tmp_path)
+        installer.register_components([core, modes, mcp])
+
+        assert not installer.install_components(['core', 'modes', 'mcp'], {'parallel': True})
+        modes.install.assert_not_called()
+        mcp.install.assert_called_once()
+        assert installer.failed_components == {'core', 'modes'}
+
+    def test_fail_fast_stops_later_levels(self, tmp_path):
+        core = _make_component('core', install_result=False)
+        agents = _make_component('agents', ['mcp'])
+        mcp = _make_component('mcp')
+
+        installer = Installer(install_dir=tmp_path)
+        installer.register_components([core, mcp, agents])
+
+        assert not installer.install_components(
+            ['core', 'mcp', 'agents'], {'parallel': True, 'fail_fast': True}
+        )
+        agents.install.assert_not_called()
+        assert 'agents' in installer.skipped_components
+
+    def test_failed_settings_write_fails_install_and_keeps_claude_md(self, tmp_path):
+        core = _make_component('core')
+
+        def install_core(config):
+            installer.settings_manager.add_component_registration('core', {'version': '4.2.0'})
+            from setup.services.claude_md import CLAUDEMdService
+            return CLAUDEMdService(tmp_path).add_imports(['RULES.md'], category='Core Framework')
+
+        core.install.side_effect = install_core
+        installer = Installer(install_dir=tmp_path)
+        installer.register_components([core])
+
+        with patch('setup.services.settings.json.dump', side_effect=OSError("disk full")), \
+             patch.object(installer, '_run_post_install_validation') as validate:
+            assert not installer.install_components(['core'])
+
+        validate.assert_called_once()
+        assert '@RULES.md' in (tmp_path / 'CLAUDE.md').read_text()
+        assert not (tmp_path / '.superclaude-metadata.json').exists()
+
+    def test_failed_claude_md_write_fails_install(self, tmp_path):
+        core = _make_component('core')
+
+        def install_core(config):
+            from setup.services.claude_md import CLAUDEMdService
+            return CLAUDEMdService(tmp_path).add_imports(['RULES.md'], category='Core Framework')
+
+        core.install.side_effect = install_core
+        installer = Installer(install_dir=tmp_path)
+        installer.register_components([core])
+
+        with patch('setup.services.claude_md.tempfile.mkstemp', side_effect=OSError("read-only")), \
+             patch.object(installer, '_run_post_install_validation'):
+            assert not installer.install_components(['core'])
+
+        assert not (tmp_path / 'CLAUDE.md').exists()
+
+    def test_dry_run_writes_nothing(self, tmp_path):
+        install_dir = tmp_path / "fresh"
+        core = _make_component('core')
+        installer = Installer(install_dir=install_dir, dry_run=True)
+        installer.register_components([core])
+
+        assert installer.install_components(['core'], {'dry_run': True})
+
+        core.install.assert_not_called()
+        assert not install_dir.exists()
@@ -0,0 +1,86 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from setup.components.mcp import MCPComponent
+from setup.services.mcp_cache import MCPArtifactCache
+
+
+def fake_pip_runner(cmd, timeout):
+    """Stand in for `pip wheel` by writing wheel files into --wheel-dir"""
+    if "ls-remote" in cmd:
+        return subprocess.CompletedProcess(cmd, 0, stdout="abc123\tHEAD\n", stderr="")
+    wheel_dir = Path(cmd[cmd.index("--wheel-dir") + 1])
+    names = ["serena_agent-0.1.4-py3-none-any.whl"] if "--no-deps" in cmd else ["mcp-1.0.0-py3-none-any.whl"]
+    for name in names:
+        (wheel_dir / name).write_bytes(name.encode())
+    return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+
+class TestMCPArtifactCache:
+    @pytest.mark.skipif(shutil.which("npm") is None, reason="npm not available")
+    def test_npm_prefetch_runs_offline_from_private_prefix(self, tmp_path):
+        package_dir = tmp_path / "fixture-server"
+        package_dir.mkdir()
+        (package_dir / "package.json").write_text(json.dumps({
+            "name": "fixture-server", "version": "1.2.3", "bin": {"fixture-server": "server.js"}}))
+        (package_dir / "server.js").write_text("#!/usr/bin/env node\nconsole.log('ok')\n")
+
+        cache = MCPArtifactCache(tmp_path / "cache")
+        entry = cache.prefetch("fixture", {"npm_package": str(package_dir)}, timeout=120)
+
+        assert (entry["package"], entry["version"], entry["bin"]) == ("fixture-server", "1.2.3", "fixture-server")
+        command = MCPArtifactCache(tmp_path / "cache").offline_command("fixture")
+        assert command is not None and Path(command[0]).exists()
+        assert subprocess.run(command, capture_output=True, text=True).stdout.strip() == "ok"
+
+    def test_uv_prefetch_pins_git_source_and_detects_tampering(self, tmp_path):
+        server_info = {"run_command": "uvx --from git+https://github.com/oraios/serena serena start-mcp-server"}
+        cache = MCPArtifactCache(tmp_path, runner=fake_pip_runner)
+
+        entry = cache.prefetch("serena", server_info)
+
+        assert entry["pinned"] == "git+https://github.com/oraios/serena@abc123"
+        assert (entry["package"], entry["version"]) == ("serena_agent", "0.1.4")
+        wheel_dir = tmp_path / "uv" / "serena"
+        assert cache.offline_command("serena") == [
+            "uvx", "--offline", "--no-index", "--find-links", str(wheel_dir),
+            "--from", str(wheel_dir / entry["wheel"]), "serena", "start-mcp-server"]
+
+        (wheel_dir / "mcp-1.0.0-py3-none-any.whl").write_bytes(b"tampered")
+        assert cache.offline_command("serena") is None
+
+
+class TestMCPCachedInstall:
+    def test_registers_cached_server_and_fails_offline_when_uncached(self, tmp_path):
+        MCPArtifactCache(tmp_path, runner=fake_pip_runner).prefetch("serena", MCPComponent().mcp_servers["serena"])
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        config = {"mcp_cache_dir": tmp_path, "mcp_offline": True}
+
+        with patch.object(component, '_check_mcp_server_installed', return_value=False), \
+             patch.object(component, '_register_mcp_server',
+                          return_value=MagicMock(returncode=0, stderr="")) as register, \
+             patch.object(component, '_install_github_mcp_server') as network_install:
+            assert component._install_mcp_server(component.mcp_servers["serena"], config)
+            assert not component._install_mcp_server(component.mcp_servers["context7"], config)
+
+        network_install.assert_not_called()
+        name, command, _ = register.call_args[0]
+        assert name == "serena"
+        assert command[:2] == ["uvx", "--offline"] and command[-2] == "--project"
+
+    def test_default_cache_follows_install_dir_and_is_not_backed_up(self, tmp_path):
+        from setup.services.backups import iter_backup_files
+
+        install_dir = tmp_path / "install"
+        MCPArtifactCache(runner=fake_pip_runner, install_dir=install_dir).prefetch(
+            "serena", MCPComponent().mcp_servers["serena"])
+        (install_dir / "CLAUDE.md").write_text("@RULES.md")
+
+        component = MCPComponent(install_dir=install_dir)
+        assert component._get_artifact_cache({}).cache_dir == install_dir / ".superclaude-cache" / "mcp"
+        assert component._get_artifact_cache({}).offline_command("serena") is not None
+        assert [rel for _, rel in iter_backup_files(install_dir)] == ["CLAUDE.md"]
@@ -1,3 +1,7 @@
+import os
+import sys
+import threading
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -71,3 +75,179 @@ class TestMCPComponent:
         assert success is False
         assert len(errors) == 1
         assert "playwright" in errors[0]
+
+
+class TestMCPServerSnapshot:
+    LIST_OUTPUT = (
+        "Checking MCP server health...\n"
+        "\n"
+        "context7: npx -y @upstash/context7-mcp - ✓ Connected\n"
+        "sequential-thinking: npx -y @modelcontextprotocol/server-sequential-thinking - ✓ Connected\n"
+    )
+
+    def _fake_cli(self, calls):
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            result = MagicMock()
+            result.returncode = 0
+            result.stderr = ""
+            result.stdout = self.LIST_OUTPUT if cmd[:3] == ["claude", "mcp", "list"] else ""
+            return result
+        return run
+
+    def test_parse_mcp_list_output(self):
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+
+        servers = component._parse_mcp_list_output(self.LIST_OUTPUT)
+
+        assert list(servers) == ["context7", "sequential-thinking"]
+        assert servers["context7"] == {"command": "npx -y @upstash/context7-mcp", "status": "✓ Connected"}
+
+    @patch('setup.components.mcp.MCPComponent._post_install', return_value=True)
+    @patch('setup.components.mcp.MCPComponent.validate_prerequisites', return_value=(True, []))
+    def test_install_lists_servers_once_per_state_change(self, mock_validate_prereqs, mock_post_install):
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        component.settings_manager = MagicMock()
+        component.settings_manager.get_metadata_setting.return_value = []
+
+        calls = []
+        with patch.object(component, '_run_command_cross_platform', side_effect=self._fake_cli(calls)), \
+             patch.object(component, '_detect_existing_mcp_servers_from_config', return_value=[]):
+            assert component._install({"selected_mcp_servers": ["magic"]})
+
+        list_calls = [cmd for cmd in calls if cmd[:3] == ["claude", "mcp", "list"]]
+        add_calls = [cmd for cmd in calls if cmd[:3] == ["claude", "mcp", "add"]]
+
+        # One snapshot for detection and checks, one to verify the added server
+        assert len(list_calls) == 2
+        assert len(add_calls) == 1
+        assert sorted(component.installed_servers_in_session) == ["context7", "magic", "sequential-thinking"]
+
+    def test_failed_add_invalidates_snapshot(self):
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        component._server_snapshot = {"context7": {"command": "npx", "status": ""}}
+
+        failed = MagicMock(returncode=1)
+        component._record_mcp_config_change("magic", failed, ["npx", "-y", "@21st-dev/magic"])
+
+        assert component._server_snapshot is None
+
+
+FAKE_CLAUDE = """#!/bin/sh
+# Minimal stand-in for the Claude CLI's `mcp list/add` commands
+registry="$FAKE_CLAUDE_DIR/registry"
+events="$FAKE_CLAUDE_DIR/events"
+if [ "$2" = "list" ]; then
+    [ -f "$registry" ] && cat "$registry"
+    exit 0
+fi
+if [ "$2" = "add" ]; then
+    name="$7"
+    echo "start $name" >> "$events"
+    sleep 0.2
+    echo "$name: npx -y $name - ✓ Connected" >> "$registry"
+    echo "end $name" >> "$events"
+    exit 0
+fi
+exit 1
+"""
+
+
+class TestConcurrentProvisioning:
+    @pytest.fixture
+    def fake_claude(self, tmp_path, monkeypatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        script = bin_dir / "claude"
+        script.write_text(FAKE_CLAUDE)
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setenv("SHELL", "/bin/sh")
+        monkeypatch.setenv("FAKE_CLAUDE_DIR", str(tmp_path))
+        return tmp_path
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fake CLI is a POSIX shell script")
+    @patch('setup.components.mcp.MCPComponent._post_install', return_value=True)
+    @patch('setup.components.mcp.MCPComponent.validate_prerequisites', return_value=(True, []))
+    def test_parallel_registrations_are_serialized(self, mock_validate_prereqs, mock_post_install, fake_claude):
+        component = MCPComponent(install_dir=fake_claude)
+        component.settings_manager = MagicMock()
+        component.settings_manager.get_metadata_setting.return_value = []
+        servers = ["context7", "playwright", "sequential-thinking", "chrome-devtools"]
+
+        with patch.object(component, '_detect_existing_mcp_servers_from_config', return_value=[]):
+            assert component._install({"selected_mcp_servers": servers, "mcp_max_workers": 4})
+
+        assert sorted(component.installed_servers_in_session) == sorted(servers)
+        registered = (fake_claude / "registry").read_text().splitlines()
+        assert len(registered) == len(servers)
+
+        # Every add must finish before the next one starts
+        events = (fake_claude / "events").read_text().splitlines()
+        for start, end in zip(events[::2], events[1::2]):
+            assert start.split()[0] == "start" and end.split()[0] == "end"
+            assert start.split()[1] == end.split()[1]
+
+    def test_server_installs_run_concurrently(self):
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        barrier = threading.Barrier(3, timeout=5)
+
+        def install_waiting(server_info, config):
+            barrier.wait()
+            return server_info["name"] != "playwright"
+
+        with patch.object(component, '_install_mcp_server', side_effect=install_waiting):
+            results = component._provision_servers(["magic", "playwright", "serena"], {"mcp_max_workers": 3})
+
+        assert list(results) == ["magic", "playwright", "serena"]
+        assert results == {"magic": True, "playwright": False, "serena": True}
+
+    def test_server_timeout_is_capped(self):
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+
+        assert component._get_server_timeout({}, 900) == 900
+        assert component._get_server_timeout({"mcp_server_timeout": 60}, 900) == 60
+        assert component._get_server_timeout({"mcp_server_timeout": 600}, 120) == 120
+
+    def test_server_timeout_is_a_deadline_for_all_steps(self):
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        config = {"mcp_server_timeout": 60}
+        timeouts = []
+
+        def install_in_steps(server_info, config):
+            timeouts.append(component._get_server_timeout(config, 120))
+            timeouts.append(component._get_server_timeout(config, 120))
+            return True
+
+        with patch('setup.components.mcp.time.monotonic', side_effect=[1000, 1000, 1045, 2000, 2070]), \
+             patch.object(component, '_install_mcp_server', side_effect=install_in_steps):
+            assert component._install_server_safely("serena", config)
+            assert not component._install_server_safely("serena", config)
+
+        assert timeouts == [60, 15]
+
+    def test_worker_messages_are_shown_per_server(self):
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+        barrier = threading.Barrier(2, timeout=5)
+        shown = []
+
+        def install_with_messages(server_info, config):
+            component._display(shown.append, server_info["name"])
+            barrier.wait()
+            component._display(shown.append, server_info["name"])
+            return True
+
+        with patch.object(component, '_install_mcp_server', side_effect=install_with_messages):
+            component._provision_servers(["magic", "morphllm-fast-apply"], {"mcp_max_workers": 2})
+
+        assert sorted(shown) == ["magic", "magic", "morphllm-fast-apply", "morphllm-fast-apply"]
+        assert shown[0] == shown[1] and shown[2] == shown[3]
+
+    def test_run_command_adds_serena_project(self):
+        component = MCPComponent(install_dir=Path('/fake/dir'))
+
+        with patch('setup.components.mcp.os.getcwd', return_value="/work/my project"):
+            command = component._get_run_command(component.mcp_servers["serena"])
+
+        assert command[:3] == ["uvx", "--from", "git+https://github.com/oraios/serena"]
+        assert command[-2:] == ["--project", "/work/my project"]
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+from setup.core.registry import ComponentRegistry
+
+COMPONENTS_DIR = Path(__file__).parent.parent / "setup" / "components"
+
+
+class TestDiscoveryCache:
+    def test_cached_discovery_imports_nothing(self, tmp_path):
+        cache_file = tmp_path / "discovery.json"
+        first = ComponentRegistry(COMPONENTS_DIR, cache_file=cache_file)
+        first.discover_components()
+        assert cache_file.exists()
+
+        registry = ComponentRegistry(COMPONENTS_DIR, cache_file=cache_file)
+        with patch('setup.core.registry.importlib.import_module', side_effect=AssertionError("module imported")):
+            assert sorted(registry.list_components()) == sorted(first.list_components())
+            assert registry.get_component_metadata("agents")["category"] == "agents"
+            assert registry.resolve_dependencies(["agents"]) == ["core", "agents"]
+            assert registry.get_components_by_category("core") == ["core"]
+
+        assert registry.component_classes == {}
+
+    def test_component_class_is_imported_on_use(self, tmp_path):
+        cache_file = tmp_path / "discovery.json"
+        ComponentRegistry(COMPONENTS_DIR, cache_file=cache_file).discover_components()
+
+        registry = ComponentRegistry(COMPONENTS_DIR, cache_file=cache_file)
+        instance = registry.get_component_instance("modes", tmp_path / "claude")
+
+        assert instance.get_metadata()["name"] == "modes"
+        assert instance.install_dir == tmp_path / "claude"
+        assert list(registry.component_classes) == ["modes"]
+
+    def test_changed_modules_invalidate_cache(self, tmp_path):
+        cache_file = tmp_path / "discovery.json"
+        ComponentRegistry(COMPONENTS_DIR, cache_file=cache_file).discover_components()
+
+        data = json.loads(cache_file.read_text())
+        data["fingerprint"]["files"]["core.py"][1] += 1
+        data["components"]["core"]["metadata"]["description"] = "stale"
+        cache_file.write_text(json.dumps(data))
+
+        registry = ComponentRegistry(COMPONENTS_DIR, cache_file=cache_file)
+        assert registry.get_component_metadata("core")["description"] != "stale"
@@ -0,0 +1,94 @@
+import re
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from setup.utils.security import SecurityValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_path_cache():
+    SecurityValidator.clear_path_cache()
+    yield
+    SecurityValidator.clear_path_cache()
+
+
+class TestCompiledPathChecks:
+    @pytest.mark.parametrize("path,pattern", [
+        ("/home/user/../etc", r'\.\./'),
+        ("/usr/sbin/tool", r'^/usr/sbin/'),
+        ("/home/user/app.DLL", r'\.dll$'),
+        ("/home/user/.env.local", r'\.env'),
+    ])
+    def test_reports_the_matching_pattern(self, path, pattern):
+        is_safe, message = SecurityValidator.validate_path(Path(path))
+
+        assert not is_safe
+        if "Dangerous filename" in message:
+            assert message.endswith(pattern)
+        else:
+            category = "traversal" if pattern in SecurityValidator.TRAVERSAL_PATTERNS else "unix_system"
+            assert message == SecurityValidator._get_user_friendly_error_message(
+                category, pattern, Path(path).resolve())
+
+    def test_alternations_agree_with_individual_patterns(self):
+        for name in ("/home/user/docs/notes.md", "/home/dev/tmp/bin/x.md", "/var/lib/x", "/home/u/hosts.md"):
+            for patterns, regex in ((SecurityValidator.UNIX_SYSTEM_PATTERNS, SecurityValidator._UNIX_SYSTEM_RE),
+                                    (SecurityValidator.DANGEROUS_FILENAMES, SecurityValidator._DANGEROUS_FILENAMES_RE)):
+                expected = any(re.search(p, name, re.IGNORECASE) for p in patterns)
+                assert bool(regex.search(name)) == expected
+
+
+class TestPathVerdictCache:
+    def test_repeated_validation_is_answered_from_cache(self):
+        base = Path.home() / ".claude"
+
+        with patch.object(SecurityValidator, '_check_path', wraps=SecurityValidator._check_path) as check:
+            for _ in range(3):
+                assert SecurityValidator.validate_path(base / "a.md", base)[0]
+                assert not SecurityValidator.validate_path(base / "a.exe", base)[0]
+
+        assert check.call_count == 2
+
+
+class TestBatchComponentValidation:
+    def test_directory_checks_run_once_per_parent(self):
+        source_base = Path.home() / "src"
+        target_base = Path.home() / ".claude"
+        files = [(source_base / d / f"{i}.md", target_base / d / f"{i}.md") for d in ("a", "b") for i in range(50)]
+
+        with patch.object(SecurityValidator, '_check_directory',
+                          wraps=SecurityValidator._check_directory) as check_directory:
+            is_safe, errors = SecurityValidator.validate_component_files_batch(files, source_base, target_base)
+
+        assert is_safe and errors == []
+        assert check_directory.call_count == 4
+
+    def test_errors_are_structured_and_match_per_file_verdicts(self):
+        home = Path.home()
+        files = [
+            (home / "src" / "ok.md", home / ".claude" / "ok.md"),
+            (home / "src" / "tool.exe", home / ".claude" / "tool.exe"),
+            (home / "src" / "a.md", Path("/etc/superclaude/a.md")),
+            (home / "src" / "b.md", Path("/etc/superclaude/b.md")),
+            (home / "other" / "c.md", home / ".claude" / "c.md"),
+        ]
+
+        is_safe, errors = SecurityValidator.validate_component_files_batch(files, home / "src", home / ".claude")
+
+        assert not is_safe
+        system_error = next(e for e in errors if e["path"] == Path("/etc/superclaude"))
+        assert system_error["role"] == "target"
+        assert system_error["files"] == [Path("/etc/superclaude/a.md"), Path("/etc/superclaude/b.md")]
+        assert {(e["role"], e["path"]) for e in errors} == {
+            ("source", home / "src" / "tool.exe"),
+            ("target", home / ".claude" / "tool.exe"),
+            ("extension", home / "src" / "tool.exe"),
+            ("target", Path("/etc/superclaude")),
+            ("source", home / "other"),
+        }
+
+        flagged = {f for e in errors if e["role"] != "extension" for f in e["files"]}
+        for source, target in files:
+            for path, base in ((source, home / "src"), (target, home / ".claude")):
+                assert SecurityValidator.validate_path(path, base)[0] == (path not in flagged)
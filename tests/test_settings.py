@@ -0,0 +1,118 @@
+import json
+import multiprocessing
+import sys
+
+import pytest
+from unittest.mock import patch
+from setup.services.settings import SettingsService
+
+
+class TestSettingsTransaction:
+    def test_changes_are_written_once_at_commit(self, tmp_path):
+        core = SettingsService(tmp_path)
+        agents = SettingsService(tmp_path)
+
+        with patch.object(SettingsService, '_write_json', autospec=True,
+                          side_effect=SettingsService._write_json) as write:
+            with core.transaction():
+                core.update_metadata({"framework": {"name": "SuperClaude"}})
+                core.add_component_registration("core", {"version": "4.2.0"})
+                agents.add_component_registration("agents", {"version": "4.2.0"})
+                agents.update_framework_version("4.2.0")
+
+                # Every service for this directory sees the buffered state
+                assert agents.is_component_installed("core")
+                assert not core.metadata_file.exists()
+
+        assert write.call_count == 1
+        metadata = json.loads(core.metadata_file.read_text())
+        assert sorted(metadata["components"]) == ["agents", "core"]
+        assert metadata["framework"]["version"] == "4.2.0"
+
+    def test_nested_transactions_flush_at_outermost_exit(self, tmp_path):
+        settings = SettingsService(tmp_path)
+
+        with settings.transaction():
+            with settings.transaction():
+                settings.set_setting("hooks.enabled", True)
+            assert not settings.settings_file.exists()
+
+        assert settings.get_setting("hooks.enabled") is True
+
+    def test_exception_discards_buffered_changes(self, tmp_path):
+        settings = SettingsService(tmp_path)
+        settings.update_metadata({"framework": {"version": "4.1.0"}})
+
+        with pytest.raises(RuntimeError):
+            with settings.transaction():
+                settings.update_framework_version("4.2.0")
+                raise RuntimeError("install failed")
+
+        assert settings.get_metadata_setting("framework.version") == "4.1.0"
+
+    def test_settings_backup_is_taken_once(self, tmp_path):
+        settings = SettingsService(tmp_path)
+        settings.save_settings({"theme": "dark"}, create_backup=False)
+
+        with settings.transaction():
+            settings.set_setting("a", 1)
+            settings.set_setting("b", 2)
+
+        assert len(settings.list_backups()) == 1
+        assert settings.load_settings() == {"theme": "dark", "a": 1, "b": 2}
+
+
+def _register_components(install_dir, worker, count):
+    settings = SettingsService(install_dir)
+    for i in range(count):
+        settings.add_component_registration(f"worker{worker}_{i}", {"version": "4.2.0"})
+        settings.set_setting(f"workers.w{worker}", i)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses fork start method")
+class TestCrossProcessLocking:
+    def test_concurrent_processes_lose_no_updates(self, tmp_path):
+        workers, count = 4, 25
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_register_components, args=(tmp_path, worker, count))
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        settings = SettingsService(tmp_path)
+        assert len(settings.get_installed_components()) == workers * count
+        assert settings.get_setting("workers") == {f"w{w}": count - 1 for w in range(workers)}
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_other_process_waits_for_open_transaction(self, tmp_path):
+        settings = SettingsService(tmp_path)
+        context = multiprocessing.get_context("fork")
+
+        with settings.transaction():
+            settings.add_component_registration("core", {"version": "4.2.0"})
+            # The child inherits this open transaction but must write to disk
+            other = context.Process(target=_register_components, args=(tmp_path, 9, 1))
+            other.start()
+            other.join(timeout=0.5)
+            assert other.is_alive(), "other process wrote during the transaction"
+
+        other.join(timeout=60)
+        assert other.exitcode == 0
+        assert sorted(SettingsService(tmp_path).get_installed_components()) == ["core", "worker9_0"]
+        assert SettingsService(tmp_path).get_setting("workers") == {"w9": 0}
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        settings = SettingsService(tmp_path)
+        settings.update_metadata({"framework": {"version": "4.1.0"}})
+
+        with patch('setup.services.settings.json.dump', side_effect=OSError("disk full")):
+            with pytest.raises(ValueError):
+                settings.update_framework_version("4.2.0")
+
+        assert settings.get_metadata_setting("framework.version") == "4.1.0"
+        assert not list(tmp_path.glob(".*.tmp"))
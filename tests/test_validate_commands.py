@@ -0,0 +1,59 @@
+import json
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+COMMANDS_DIR = PROJECT_ROOT / "SuperClaude" / "Commands"
+
+# Importable by name so the process pool can pickle its worker function
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+import validate_commands  # noqa: E402
+
+
+@pytest.fixture
+def commands_dir(tmp_path):
+    commands = tmp_path / "Commands"
+    commands.mkdir()
+    for name in ("analyze.md", "build.md", "test.md"):
+        shutil.copy2(COMMANDS_DIR / name, commands / name)
+    return commands
+
+
+class TestCommandValidationCache:
+    def test_unchanged_files_are_not_revalidated(self, commands_dir, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        files = sorted(commands_dir.glob("*.md"))
+        first = validate_commands.CommandValidator(commands_dir, cache_file=cache_file).validate_files(files)
+
+        (commands_dir / "build.md").write_text("# not a command\n")
+        validator = validate_commands.CommandValidator(commands_dir, cache_file=cache_file)
+        with patch.object(validator, 'validate_content', wraps=validator.validate_content) as validate:
+            second = validator.validate_files(files)
+
+        assert [call.args[1].name for call in validate.call_args_list] == ["build.md"]
+        assert second[0] == first[0] and second[2] == first[2]
+        assert not second[1].passed
+
+    def test_process_pool_matches_serial_results(self, commands_dir):
+        files = sorted(commands_dir.glob("*.md"))
+
+        serial = validate_commands.CommandValidator(commands_dir, jobs=1, cache_file=None).validate_files(files)
+        parallel = validate_commands.CommandValidator(commands_dir, jobs=3, cache_file=None).validate_files(files)
+
+        assert parallel == serial
+        assert [r.filename for r in parallel] == ["analyze.md", "build.md", "test.md"]
+
+    def test_undecodable_file_fails_and_is_not_cached(self, commands_dir, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        (commands_dir / "build.md").write_bytes(b"---\nname: build\n---\n\xff\xfe broken\n")
+        files = sorted(commands_dir.glob("*.md"))
+
+        results = validate_commands.CommandValidator(commands_dir, cache_file=cache_file).validate_files(files)
+
+        assert not results[1].passed
+        assert results[1].errors[0].startswith("Failed to validate file:")
+        assert "build.md" not in json.loads(cache_file.read_text())["results"]
@@ -0,0 +1,112 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+from setup.core.validator import Validator
+from setup.services.probe_cache import ProbeCache
+
+
+@pytest.fixture
+def fake_node(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "node"
+    script.write_text("#!/bin/sh\necho v20.11.0\n")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake tool is a POSIX shell script")
+class TestProbeCache:
+    def test_probe_result_persists_across_validators(self, tmp_path, fake_node):
+        cache_file = tmp_path / "probes.json"
+        assert Validator(ProbeCache(cache_file)).check_node("18.0")[0]
+
+        with patch('setup.services.probe_cache.subprocess.run', side_effect=AssertionError("probe spawned")):
+            success, message = Validator(ProbeCache(cache_file)).check_node("18.0")
+
+        assert success
+        assert "20.11.0" in message
+
+    def test_changed_executable_is_probed_again(self, tmp_path, fake_node):
+        cache_file = tmp_path / "probes.json"
+        Validator(ProbeCache(cache_file)).check_node()
+
+        fake_node.write_text("#!/bin/sh\necho v22.1.0\n")
+        os.utime(fake_node, (time.time() + 10, time.time() + 10))
+
+        success, message = Validator(ProbeCache(cache_file)).check_node()
+        assert success
+        assert "22.1.0" in message
+
+    def test_expired_and_failed_probes_are_not_reused(self, tmp_path, fake_node):
+        cache = ProbeCache(tmp_path / "probes.json", ttl=0)
+        assert cache.run(["node", "--version"]).stdout.strip() == "v20.11.0"
+
+        # Same size and mtime, but the TTL has lapsed
+        stat = fake_node.stat()
+        fake_node.write_text("#!/bin/sh\nexit 3 # fail\n")
+        assert fake_node.stat().st_size == stat.st_size
+        os.utime(fake_node, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert cache.run(["node", "--version"]).returncode == 3
+
+        other = ProbeCache(tmp_path / "other.json")
+        assert not Validator(other).check_node()[0]
+        assert other._load() == {}
+
+
+    def test_cache_lives_in_install_cache_dir_and_is_not_backed_up(self, tmp_path, fake_node):
+        from setup.services.backups import iter_backup_files
+
+        install_dir = tmp_path / "install"
+        install_dir.mkdir()
+        (install_dir / "CLAUDE.md").write_text("@RULES.md")
+        Validator(install_dir=install_dir).check_node()
+
+        cache_files = list((install_dir / ".superclaude-cache").iterdir())
+        assert [p.name for p in cache_files] == ["probes.json"]
+        assert [rel for _, rel in iter_backup_files(install_dir)] == ["CLAUDE.md"]
+
+    def test_missing_install_dir_is_not_created(self, tmp_path, fake_node):
+        assert Validator(install_dir=tmp_path / "fresh").check_node()[0]
+
+        assert not (tmp_path / "fresh").exists()
+
+
+class TestConcurrentChecks:
+    def test_requirement_checks_run_concurrently_in_order(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def tool_check(tool_name, command, min_version=None):
+            # Only completes if all three tool probes are running at once
+            barrier.wait()
+            return tool_name != "git", f"{tool_name} checked"
+
+        validator = Validator(use_probe_cache=False)
+        requirements = {"external_tools": {
+            "git": {"command": "git --version"},
+            "npm": {"command": "npm --version"},
+            "uv": {"command": "uv --version"},
+        }}
+
+        with patch.object(validator, 'check_external_tool', side_effect=tool_check):
+            success, errors = validator.validate_requirements(requirements)
+
+        assert not success
+        assert errors == ["git: git checked"]
+
+    def test_diagnostics_keep_check_order(self):
+        validator = Validator(use_probe_cache=False)
+
+        with patch.object(validator, 'check_node', return_value=(False, "no node")), \
+             patch.object(validator, 'check_claude_cli', return_value=(True, "claude ok")), \
+             patch.object(validator, 'get_installation_help', return_value="help"):
+            diagnostics = validator.diagnose_system()
+
+        assert list(diagnostics["checks"]) == ["python", "node", "claude_cli", "disk_space"]
+        assert diagnostics["checks"]["node"] == {"status": "fail", "message": "no node"}
+        assert diagnostics["issues"][0] == "Node.js not found or version issue"